@@ -0,0 +1,2682 @@
+################################################################################
+##    FILE:  	core.py (autotagging-function)                                ##
+##                                                                            ##
+##    NOTES: 	Contains clients, caches, waits, metrics, tag evaluation and  ##
+##              registry of event handlers shared by all handler modules      ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import botocore.session
+import fnmatch
+import importlib
+import logging
+import json
+import os
+import random
+import sys
+import threading
+from string import Formatter
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, time, sleep as timesleep
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from env_classifier import env_classifier
+from resource_graph import ENI, VOLUME, ResourceGraph
+from tag_rules import TAG_RULES, TAG_WRITERS
+
+# Defining logger
+logger = logging.getLogger()
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# "json" emits every record as a single-line JSON object, "text" keeps format of the Lambda runtime
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'json')
+# fraction of invocations logging full payloads (event details, formed tags) at INFO level; payloads are always logged at DEBUG level
+LOG_PAYLOAD_SAMPLE_RATE = float(os.environ.get('LOG_PAYLOAD_SAMPLE_RATE', 0))
+
+# records and bytes logged during current invocation; sampled is True if payloads of current invocation are logged
+log_stats = {'records': 0, 'bytes': 0, 'sampled': False}
+
+# True while processing TestEvent
+is_test_event = False
+
+class LogFormatter(logging.Formatter):
+    """
+    LogFormatter Class emitting single-line records and counting logged bytes
+    """
+
+    def __init__(self, structured: bool = True, base: logging.Formatter = None):
+        """
+        main __init__ function
+
+        Args:
+            structured (bool, optional): if True format records as single-line JSON objects, otherwise use base formatter
+            base (logging.Formatter, optional): formatter of text records; default formatter if None
+
+        Returns:
+            self
+        """
+        super().__init__()
+        self.structured = structured
+        self.base = base
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self.structured:
+            entry = {'level': record.levelname, 'message': record.getMessage()}
+            if getattr(record, 'aws_request_id', None):
+                entry['request_id'] = record.aws_request_id
+            # payloads of log_payload are nested as they are, not as escaped strings
+            if hasattr(record, 'payload'):
+                entry['payload'] = record.payload
+            if record.exc_info:
+                entry['exception'] = self.formatException(record.exc_info)
+            line = json.dumps(entry, separators=(',', ':'), default=str)
+        else:
+            line = self.base.format(record) if self.base else super().format(record)
+        log_stats['records'] += 1
+        log_stats['bytes'] += len(line) + 1
+        return line
+
+def configure_logging() -> None:
+    """
+    Install LogFormatter on handlers of root logger (Lambda runtime handler or a stream handler)
+
+    Returns:
+        None
+    """
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler())
+    for handler in logger.handlers:
+        if not isinstance(handler.formatter, LogFormatter):
+            handler.setFormatter(LogFormatter(LOG_FORMAT == 'json', handler.formatter))
+
+configure_logging()
+
+def payload_logging_enabled() -> bool:
+    """
+    Check if payloads are logged during current invocation
+
+    Returns:
+        bool: True for DEBUG level, sampled invocations and test events
+    """
+    return logger.isEnabledFor(logging.DEBUG) or log_stats['sampled'] or is_test_event
+
+def log_payload(message: str, payload) -> None:
+    """
+    Log payload as compact JSON; payload is not serialized unless payload logging is enabled
+
+    Args:
+        message (str): description of payload
+        payload: object serializable by json.dumps (str is used for unknown types)
+
+    Returns:
+        None
+    """
+    if not payload_logging_enabled():
+        return
+    if LOG_FORMAT == 'json':
+        logger.info(message, extra={'payload': payload})
+    else:
+        logger.info(f'{message}: {json.dumps(payload, separators=(",", ":"), default=str)}')
+
+# botocore config shared by all pooled clients
+CLIENT_CONFIG = Config(
+    max_pool_connections=int(os.environ.get('BOTO_MAX_POOL_CONNECTIONS', 25)),
+    tcp_keepalive=True,
+    connect_timeout=int(os.environ.get('BOTO_CONNECT_TIMEOUT', 5)),
+    read_timeout=int(os.environ.get('BOTO_READ_TIMEOUT', 30)),
+    retries={
+        'max_attempts': int(os.environ.get('BOTO_MAX_ATTEMPTS', 5)),
+        'mode': os.environ.get('BOTO_RETRY_MODE', 'standard')
+    }
+)
+
+class ClientPool:
+    """
+    ClientPool Class keeping boto3 clients alive for the lifetime of a warm Lambda container; clients are created
+    from botocore sessions, so that neither boto3 nor its resource models are loaded by the function
+    """
+
+    def __init__(self, config: Config = CLIENT_CONFIG):
+        """
+        main __init__ function
+
+        Args:
+            config (Config): botocore config applied to every client created by the pool
+
+        Returns:
+            self
+        """
+        self.config = config
+        self.sessions = {}
+        self.clients = {}
+        # (event name, handler) registered on every client of the pool
+        self.hooks = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def credentials_key(credentials: dict = None) -> tuple:
+        """
+        Build a hashable key identifying credentials
+
+        Args:
+            credentials (dict, optional): aws_access_key_id, aws_secret_access_key and aws_session_token; default credentials chain if None
+
+        Returns:
+            tuple: access key id and session token (empty tuple for default credentials)
+        """
+        if not credentials:
+            return ()
+        return (credentials.get('aws_access_key_id'), credentials.get('aws_session_token'))
+
+    def session(self, credentials: dict = None) -> botocore.session.Session:
+        """
+        Get botocore session for given credentials, creating it on first use
+
+        Args:
+            credentials (dict, optional): explicit credentials; default credentials chain if None
+
+        Returns:
+            botocore.session.Session
+        """
+        key = self.credentials_key(credentials)
+        session = self.sessions.get(key)
+        if session is None:
+            with self.lock:
+                session = self.sessions.get(key)
+                if session is None:
+                    session = botocore.session.Session()
+                    if credentials:
+                        session.set_credentials(credentials.get('aws_access_key_id'), credentials.get('aws_secret_access_key'), credentials.get('aws_session_token'))
+                    self.sessions[key] = session
+        return session
+
+    def client(self, service: str, region: str = None, credentials: dict = None) -> object:
+        """
+        Get pooled boto3 client keyed by service, region and credentials
+
+        Args:
+            service (str): name of AWS service, e.g. "ec2"
+            region (str, optional): region of the client
+            credentials (dict, optional): explicit credentials; default credentials chain if None
+
+        Returns:
+            boto3 client
+        """
+        key = (service, region, self.credentials_key(credentials))
+        client = self.clients.get(key)
+        if client is None:
+            session = self.session(credentials)
+            with self.lock:
+                client = self.clients.get(key)
+                if client is None:
+                    logger.info(f'Creating {service} client in {region}')
+                    client = session.create_client(service, region_name=region, config=self.config)
+                    for event_name, handler in self.hooks:
+                        client.meta.events.register(event_name, handler)
+                    self.clients[key] = client
+        return client
+
+    def register(self, event_name: str, handler) -> None:
+        """
+        Register botocore event handler on pooled clients, existing and future ones
+
+        Args:
+            event_name (str): botocore event name, e.g. "before-parameter-build.ec2.CreateTags"
+            handler (callable): botocore event handler
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.hooks.append((event_name, handler))
+            for client in self.clients.values():
+                client.meta.events.register(event_name, handler)
+
+    def clear(self) -> None:
+        """
+        Drop all pooled sessions and clients
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.sessions.clear()
+            self.clients.clear()
+
+# module-level pool living as long as the warm Lambda container
+client_pool = ClientPool()
+
+class TTLCache:
+    """
+    TTLCache Class keeping size-bounded describe results which expire after ttl seconds
+    """
+
+    def __init__(self, name: str, maxsize: int = 512, ttl: float = 300):
+        """
+        main __init__ function
+
+        Args:
+            name (str): name of the cache used in logs
+            maxsize (int, optional): number of entries kept, least recently used entry is dropped first
+            ttl (float, optional): seconds an entry stays valid; cache is disabled if 0
+
+        Returns:
+            self
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry, value), least recently used first
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: str, loader=None):
+        """
+        Get valid entry, calling loader and storing its result on a miss
+
+        Args:
+            key (str): id of a resource
+            loader (callable, optional): function without arguments returning the value; empty values are not stored
+
+        Returns:
+            cached or loaded value, None on a miss without loader
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.entries.pop(key, None)
+            self.misses += 1
+        if loader is None:
+            return None
+        value = loader()
+        if value:
+            self.put(key, value)
+        return value
+
+    def put(self, key: str, value) -> None:
+        """
+        Store entry, dropping least recently used entries above maxsize
+
+        Args:
+            key (str): id of a resource
+            value: value to store
+
+        Returns:
+            None
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, *keys: str) -> None:
+        """
+        Drop entries of given keys, or all entries if no key is given
+
+        Returns:
+            None
+        """
+        with self.lock:
+            if not keys:
+                self.entries.clear()
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def stats(self) -> str:
+        return f'{self.name}: {self.hits} hits, {self.misses} misses, {len(self.entries)} entries'
+
+# describe results shared by all invocations of the warm Lambda container
+TAG_CACHE_TTL = float(os.environ.get('TAG_CACHE_TTL', 300))
+TAG_CACHE_SIZE = int(os.environ.get('TAG_CACHE_SIZE', 512))
+instance_cache = TTLCache('instances', TAG_CACHE_SIZE, TAG_CACHE_TTL)
+interface_cache = TTLCache('interfaces', TAG_CACHE_SIZE, TAG_CACHE_TTL)
+sg_cache = TTLCache('security groups', TAG_CACHE_SIZE, TAG_CACHE_TTL)
+tag_caches = (instance_cache, interface_cache, sg_cache)
+# relationship graphs of EC2 resources by region, shared by all invocations of the warm Lambda container
+resource_graphs = {}
+resource_graphs_lock = threading.Lock()
+
+def resource_graph(region: str) -> ResourceGraph:
+    """
+    Relationship graph of EC2 resources of a region, trusting described tags for TAG_CACHE_TTL seconds
+
+    Args:
+        region (str): region of resources
+
+    Returns:
+        ResourceGraph: graph of the region
+    """
+    with resource_graphs_lock:
+        if region not in resource_graphs:
+            resource_graphs[region] = ResourceGraph(client_pool.client('ec2', region), owners=TagHandler.AMI_OWNERS, ttl=TAG_CACHE_TTL, maxsize=TAG_CACHE_SIZE * 8)
+        return resource_graphs[region]
+
+def invalidate_tags(resource_ids: list) -> None:
+    """
+    Drop cached describe results of resources in tag caches and resource graphs
+
+    Args:
+        resource_ids (list): ids of resources
+
+    Returns:
+        None
+    """
+    for cache in tag_caches:
+        cache.invalidate(*resource_ids)
+    for graph in list(resource_graphs.values()):
+        graph.invalidate(*resource_ids)
+
+def invalidate_written_tags(params: dict, context: dict, **kwargs) -> None:
+    """
+    botocore handler dropping cached describe results of resources whose tags are about to be written by the Lambda itself
+
+    Args:
+        params (dict): parameters of CreateTags/DeleteTags call
+        context (dict): botocore request context, shared with after-call handler
+
+    Returns:
+        None
+    """
+    context['written_resource_ids'] = params.get('Resources') or []
+    invalidate_tags(context['written_resource_ids'])
+
+def invalidate_tags_after_write(context: dict, **kwargs) -> None:
+    """
+    botocore handler dropping cached describe results of resources once their tags are written, a describe running
+    concurrently with the write (another worker or executor thread) may have cached tags of before the write
+
+    Args:
+        context (dict): botocore request context holding ids of written resources
+
+    Returns:
+        None
+    """
+    invalidate_tags(context.get('written_resource_ids', []))
+
+client_pool.register('before-parameter-build.ec2.CreateTags', invalidate_written_tags)
+client_pool.register('before-parameter-build.ec2.DeleteTags', invalidate_written_tags)
+client_pool.register('after-call.ec2.CreateTags', invalidate_tags_after_write)
+client_pool.register('after-call.ec2.DeleteTags', invalidate_tags_after_write)
+
+# result of readiness polling: predicate passed or not, last value returned by predicate, seconds waited and number of polls
+WaitResult = namedtuple('WaitResult', ['ready', 'value', 'elapsed', 'attempts'])
+
+# (description, seconds waited, ready) of every wait done during current invocation
+wait_log = []
+
+def wait_until(predicate, timeout: float, description: str = 'resource', initial_delay: float = 1.0, max_delay: float = 10.0, backoff: float = 2.0, jitter: float = 0.5, retry_errors: tuple = None) -> WaitResult:
+    """
+    Poll readiness predicate with exponential backoff and jitter until it passes or deadline hits
+
+    Args:
+        predicate (callable): function without arguments returning truthy value once resource is ready; ClientError is treated as "not ready"
+        timeout (float): deadline in seconds
+        description (str, optional): what we are waiting for, used in logs
+        initial_delay (float, optional): first pause between polls in seconds
+        max_delay (float, optional): upper bound of a pause between polls in seconds
+        backoff (float, optional): multiplier applied to the pause after every poll
+        jitter (float, optional): fraction of the pause which is randomized
+        retry_errors (tuple, optional): codes of ClientError treated as "not ready", other codes are raised at once; every code if None
+
+    Returns:
+        WaitResult: ready, value, elapsed, attempts
+    """
+    start = monotonic()
+    deadline = start + timeout
+    delay = initial_delay
+    attempts = 0
+    value = None
+    while True:
+        attempts += 1
+        try:
+            value = predicate()
+        except ClientError as clienterror:
+            if retry_errors is not None and clienterror.response['Error']['Code'] not in retry_errors:
+                raise
+            logger.info(f'{description} is not ready yet: {clienterror.response["Error"]["Code"]}')
+            value = None
+        if value:
+            break
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            break
+        # sleep for a random part of the current delay, but never past the deadline
+        timesleep(min(random.uniform(delay * (1 - jitter), delay), remaining))
+        delay = min(delay * backoff, max_delay)
+
+    elapsed = monotonic() - start
+    wait_log.append((description, elapsed, bool(value)))
+    if value:
+        logger.info(f'{description} ready after {elapsed:.3f} seconds ({attempts} polls)')
+    else:
+        logger.warning(f'{description} not ready after {elapsed:.3f} seconds ({attempts} polls), proceeding')
+    return WaitResult(bool(value), value, elapsed, attempts)
+
+def map_concurrently(function, items: list, max_workers: int) -> list:
+    """
+    Call function for every item in a bounded thread pool, so that waits of items overlap
+
+    Args:
+        function (callable): function of one item; exceptions are raised to the caller
+        items (list): items to process
+        max_workers (int): max number of worker threads
+
+    Returns:
+        list: results in order of items
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix='autotag') as executor:
+        return list(executor.map(function, items))
+
+# max number of AWS calls of one event running at the same time in asyncio execution mode; 1 runs them one after another
+ASYNC_MAX_CALLS = int(os.environ.get('ASYNC_MAX_CALLS', 10))
+
+# asyncio is imported by the first event running a coroutine, not by the cold start of every container
+def run_async(function, *args, max_calls: int = None, **kwargs):
+    """
+    Synchronous shim running coroutine function of a handler in its own event loop, so that independent calls awaited
+    with call_async and gather_async overlap while the handler stays a plain function
+
+    Args:
+        function (callable): coroutine function
+        *args, **kwargs: arguments of the coroutine function
+        max_calls (int, optional): max number of blocking calls running at the same time; ASYNC_MAX_CALLS if None
+
+    Returns:
+        result of the coroutine; its exceptions are raised to the caller
+    """
+    import asyncio
+
+    with ThreadPoolExecutor(max_workers=max(1, max_calls or ASYNC_MAX_CALLS), thread_name_prefix='autotag-async') as executor:
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(executor)
+        try:
+            return loop.run_until_complete(function(*args, **kwargs))
+        finally:
+            loop.close()
+
+async def call_async(function, *args, **kwargs):
+    """
+    Await blocking call (boto3 call, wait_until, describe helper) in the executor of run_async
+
+    Args:
+        function (callable): blocking function
+        *args, **kwargs: arguments of the function
+
+    Returns:
+        result of the function
+    """
+    import asyncio
+
+    return await asyncio.get_running_loop().run_in_executor(None, lambda: function(*args, **kwargs))
+
+async def gather_async(*awaitables) -> list:
+    """
+    Await independent calls or chains of calls together
+
+    Args:
+        *awaitables: coroutines; all of them finish before the first exception is raised to the caller
+
+    Returns:
+        list: results in order of awaitables
+    """
+    import asyncio
+
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return list(results)
+
+# CloudWatch Embedded Metric Format records are printed to stdout unless disabled
+EMF_METRICS = os.environ.get('EMF_METRICS', 'yes').lower() in ('yes', 'true', '1')
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'Autotagging')
+
+class InvocationMetrics:
+    """
+    InvocationMetrics Class timing AWS calls through botocore events and emitting latency breakdown of processed events
+    """
+
+    def __init__(self, namespace: str = METRICS_NAMESPACE, enabled: bool = EMF_METRICS):
+        """
+        main __init__ function
+
+        Args:
+            namespace (str, optional): CloudWatch namespace of emitted metrics
+            enabled (bool, optional): if False nothing is printed
+
+        Returns:
+            self
+        """
+        self.namespace = namespace
+        self.enabled = enabled
+        # monotonic timestamp of invocation start
+        self.started = monotonic()
+        # (service, operation) -> [calls, seconds] of AWS calls made since last emit
+        self.api_calls = {}
+        # (service, operation) -> [retries, throttles, seconds waited for rate limiter] since last emit
+        self.throttling = {}
+        # retries and throttles since invocation start
+        self.invocation_retries = 0
+        self.invocation_throttles = 0
+        # AWS calls may be made from worker threads
+        self.lock = threading.Lock()
+
+    def start_invocation(self) -> None:
+        self.started = monotonic()
+        self.api_calls = {}
+        self.throttling = {}
+        self.invocation_retries = 0
+        self.invocation_throttles = 0
+
+    def start_api_call(self, context: dict = None, **kwargs) -> None:
+        """botocore before-call handler"""
+        if context is not None:
+            context['metrics_started'] = monotonic()
+
+    def finish_api_call(self, event_name: str = '', context: dict = None, **kwargs) -> None:
+        """botocore after-call and after-call-error handler; event_name is after-call.<service>.<operation>"""
+        started = (context or {}).pop('metrics_started', None)
+        if started is None:
+            return
+        _, service, operation = event_name.split('.', 2)
+        with self.lock:
+            timing = self.api_calls.setdefault((service, operation), [0, 0.0])
+            timing[0] += 1
+            timing[1] += monotonic() - started
+
+    def count_throttling(self, service: str, operation: str, retries: int = 0, throttles: int = 0, limited: float = 0.0) -> None:
+        """
+        Count retried and throttled requests and time spent waiting for rate limiter
+
+        Args:
+            service (str): botocore service id, e.g. "ec2"
+            operation (str): name of operation, e.g. "CreateTags"
+            retries (int, optional): number of retried requests
+            throttles (int, optional): number of throttled responses
+            limited (float, optional): seconds waited for rate limiter
+
+        Returns:
+            None
+        """
+        with self.lock:
+            counters = self.throttling.setdefault((service, operation), [0, 0, 0.0])
+            counters[0] += retries
+            counters[1] += throttles
+            counters[2] += limited
+            self.invocation_retries += retries
+            self.invocation_throttles += throttles
+
+    def used_time(self) -> float:
+        return monotonic() - self.started
+
+    def emit(self, name: str, seconds: float, waits: list = (), processed: bool = True) -> list:
+        """
+        Print EMF records of processed event: one with handler, wait and API time by event name and one per AWS operation
+
+        Args:
+            name (str): event name or kind of re-check
+            seconds (float): time spent processing event
+            waits (list, optional): wait_log entries of the event
+            processed (bool, optional): False if processing failed
+
+        Returns:
+            list: emitted records
+        """
+        api_calls, self.api_calls = self.api_calls, {}
+        throttling, self.throttling = self.throttling, {}
+        if not self.enabled:
+            return []
+        timestamp = int(time() * 1000)
+        records = [{
+            '_aws': {'Timestamp': timestamp, 'CloudWatchMetrics': [{
+                'Namespace': self.namespace,
+                'Dimensions': [['EventName']],
+                'Metrics': [
+                    {'Name': 'HandlerTime', 'Unit': 'Milliseconds'},
+                    {'Name': 'WaitTime', 'Unit': 'Milliseconds'},
+                    {'Name': 'ApiTime', 'Unit': 'Milliseconds'},
+                    {'Name': 'ApiCalls', 'Unit': 'Count'},
+                    {'Name': 'Retries', 'Unit': 'Count'},
+                    {'Name': 'Throttles', 'Unit': 'Count'},
+                    {'Name': 'RateLimitTime', 'Unit': 'Milliseconds'},
+                    {'Name': 'Failed', 'Unit': 'Count'}
+                ]}]},
+            'EventName': name,
+            'HandlerTime': round(seconds * 1000, 3),
+            'WaitTime': round(sum(elapsed for _, elapsed, _ in waits) * 1000, 3),
+            'ApiTime': round(sum(elapsed for _, elapsed in api_calls.values()) * 1000, 3),
+            'ApiCalls': sum(calls for calls, _ in api_calls.values()),
+            'Retries': sum(retries for retries, _, _ in throttling.values()),
+            'Throttles': sum(throttles for _, throttles, _ in throttling.values()),
+            'RateLimitTime': round(sum(limited for _, _, limited in throttling.values()) * 1000, 3),
+            'Failed': int(not processed)
+        }]
+        for (service, operation), (calls, elapsed) in sorted(api_calls.items()):
+            retries, throttles, limited = throttling.get((service, operation), (0, 0, 0.0))
+            records.append({
+                '_aws': {'Timestamp': timestamp, 'CloudWatchMetrics': [{
+                    'Namespace': self.namespace,
+                    'Dimensions': [['Service', 'Operation']],
+                    'Metrics': [
+                        {'Name': 'ApiTime', 'Unit': 'Milliseconds'},
+                        {'Name': 'ApiCalls', 'Unit': 'Count'},
+                        {'Name': 'Retries', 'Unit': 'Count'},
+                        {'Name': 'Throttles', 'Unit': 'Count'},
+                        {'Name': 'RateLimitTime', 'Unit': 'Milliseconds'}
+                    ]}]},
+                'Service': service,
+                'Operation': operation,
+                'EventName': name,
+                'ApiTime': round(elapsed * 1000, 3),
+                'ApiCalls': calls,
+                'Retries': retries,
+                'Throttles': throttles,
+                'RateLimitTime': round(limited * 1000, 3)
+            })
+        # EMF records are picked up from stdout by CloudWatch Logs
+        for record in records:
+            print(json.dumps(record, separators=(',', ':')), flush=True)
+        return records
+
+# metrics of the warm Lambda container; AWS calls of all pooled clients are timed
+metrics = InvocationMetrics()
+client_pool.register('before-call', metrics.start_api_call)
+client_pool.register('after-call', metrics.finish_api_call)
+client_pool.register('after-call-error', metrics.finish_api_call)
+
+# token bucket limits of requests of a container: "<service>.<Operation>=<requests per second>[:<burst>]", comma separated;
+# service is botocore service id (ec2, ecs, elastic-load-balancing, elastic-load-balancing-v2, resource-groups-tagging-api), operation may contain * wildcards, first match wins
+RATE_LIMITS = os.environ.get('RATE_LIMITS', 'ec2.CreateTags=5:20,ec2.DeleteTags=5:20,ec2.Describe*=20:50,elastic-load-balancing*.*=10:20,ecs.*=20:50,resource-groups-tagging-api.TagResources=5:10')
+# attempts of a throttled request once retries of botocore are exhausted (0 leaves throttled requests to botocore)
+THROTTLE_MAX_ATTEMPTS = int(os.environ.get('THROTTLE_MAX_ATTEMPTS', 10))
+# base and cap of exponential backoff of throttled requests, seconds
+THROTTLE_BACKOFF_BASE = float(os.environ.get('THROTTLE_BACKOFF_BASE', 0.5))
+THROTTLE_BACKOFF_CAP = float(os.environ.get('THROTTLE_BACKOFF_CAP', 20))
+
+# error codes of throttled responses
+THROTTLE_ERROR_CODES = frozenset(['RequestLimitExceeded', 'Throttling', 'ThrottlingException', 'ThrottledException', 'RequestThrottled',
+                                  'RequestThrottledException', 'TooManyRequestsException', 'SlowDown', 'EC2ThrottledException', 'PriorRequestNotComplete'])
+
+class TokenBucket:
+    """
+    TokenBucket Class limiting rate of requests; rate is halved on throttling and recovers step by step on successful requests
+    """
+
+    # fraction of configured rate restored by every successful request
+    RECOVERY = 0.05
+    # lowest rate adaptation can reach, fraction of configured rate
+    FLOOR = 0.05
+
+    def __init__(self, rate: float, burst: float = None):
+        """
+        main __init__ function
+
+        Args:
+            rate (float): configured requests per second
+            burst (float, optional): capacity of bucket; rate if None
+
+        Returns:
+            self
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(burst or rate, 1)
+        self.tokens = self.burst
+        self.updated = monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until it is available
+
+        Returns:
+            float: seconds slept
+        """
+        with self.lock:
+            now = monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # token is reserved at once, so that concurrent callers queue up behind each other
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if delay:
+            timesleep(delay)
+        return delay
+
+    def throttled(self) -> None:
+        with self.lock:
+            self.rate = max(self.rate / 2, self.max_rate * self.FLOOR)
+            self.tokens = min(self.tokens, 0)
+
+    def succeeded(self) -> None:
+        if self.rate < self.max_rate:
+            with self.lock:
+                self.rate = min(self.rate + self.max_rate * self.RECOVERY, self.max_rate)
+
+class RateLimiter:
+    """
+    RateLimiter Class keeping token buckets per service, operation and region and retrying throttled requests through botocore events
+    """
+
+    def __init__(self, limits: str = RATE_LIMITS, max_attempts: int = THROTTLE_MAX_ATTEMPTS, backoff_base: float = THROTTLE_BACKOFF_BASE, backoff_cap: float = THROTTLE_BACKOFF_CAP):
+        """
+        main __init__ function
+
+        Args:
+            limits (str, optional): limits in RATE_LIMITS format
+            max_attempts (int, optional): attempts of a throttled request
+            backoff_base (float, optional): first backoff delay of a throttled request in seconds
+            backoff_cap (float, optional): upper bound of backoff delay in seconds
+
+        Returns:
+            self
+        """
+        self.limits = self.parse_limits(limits)
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        # (service, operation, region) -> TokenBucket or None for unlimited operations
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def parse_limits(limits: str) -> list:
+        """
+        Parse limits configuration
+
+        Args:
+            limits (str): limits in RATE_LIMITS format
+
+        Returns:
+            list: (pattern, rate, burst) tuples
+        """
+        parsed = []
+        for limit in filter(None, (limit.strip() for limit in limits.split(','))):
+            try:
+                pattern, value = limit.split('=')
+                rate, _, burst = value.partition(':')
+                if float(rate) > 0:
+                    parsed.append((pattern.strip(), float(rate), float(burst) if burst else None))
+            except ValueError:
+                logger.warning(f'Ignoring malformed rate limit: {limit}')
+        return parsed
+
+    def bucket(self, service: str, operation: str, region: str) -> TokenBucket:
+        key = (service, operation, region)
+        if key not in self.buckets:
+            with self.lock:
+                if key not in self.buckets:
+                    self.buckets[key] = next((TokenBucket(rate, burst) for pattern, rate, burst in self.limits
+                                              if fnmatch.fnmatchcase(f'{service}.{operation}', pattern)), None)
+        return self.buckets[key]
+
+    @staticmethod
+    def parse_event_name(event_name: str) -> tuple:
+        _, service, operation = event_name.split('.', 2)
+        return service, operation
+
+    def before_request(self, event_name: str = '', request=None, **kwargs) -> None:
+        """botocore request-created handler, called before every attempt of a request"""
+        context = getattr(request, 'context', None) or {}
+        service, operation = self.parse_event_name(event_name)
+        retries = int(context.get('retries', {}).get('attempt', 1) > 1)
+        bucket = self.bucket(service, operation, context.get('client_region'))
+        limited = bucket.acquire() if bucket else 0.0
+        if retries or limited:
+            metrics.count_throttling(service, operation, retries=retries, limited=limited)
+
+    def needs_retry(self, event_name: str = '', response=None, attempts: int = 1, request_dict: dict = None, **kwargs) -> float:
+        """
+        botocore needs-retry handler adapting rate of throttled operation and retrying it once retries of botocore are exhausted
+
+        Returns:
+            float: seconds to sleep before next attempt or None if request is not retried by this handler
+        """
+        if response is None or response[1].get('Error', {}).get('Code') not in THROTTLE_ERROR_CODES:
+            if response is not None:
+                bucket = self.bucket(*self.parse_event_name(event_name), (request_dict or {}).get('context', {}).get('client_region'))
+                if bucket:
+                    bucket.succeeded()
+            return None
+        service, operation = self.parse_event_name(event_name)
+        logger.warning(f'{service}.{operation} throttled ({response[1]["Error"]["Code"]}) at attempt {attempts}')
+        metrics.count_throttling(service, operation, throttles=1)
+        bucket = self.bucket(service, operation, (request_dict or {}).get('context', {}).get('client_region'))
+        if bucket:
+            bucket.throttled()
+        if attempts >= self.max_attempts:
+            return None
+        # full jitter: random part of exponentially growing delay
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempts))
+
+# rate limiter of the warm Lambda container shared by all pooled clients
+rate_limiter = RateLimiter()
+client_pool.register('request-created', rate_limiter.before_request)
+client_pool.register('needs-retry', rate_limiter.needs_retry)
+
+def ready_response(response: dict, key: str, condition=None) -> dict:
+    """
+    Readiness check of describe response
+
+    Args:
+        response (dict): response of boto3 describe call
+        key (str): key of the list of described items
+        condition (callable, optional): check every described item has to pass
+
+    Returns:
+        dict: response if list of items is not empty and all items pass condition, otherwise None
+    """
+    items = response.get(key)
+    if items and (condition is None or all(condition(item) for item in items)):
+        return response
+    return None
+
+# number of re-checks of deferred resource; the last one tags resource with whatever is available
+RECHECK_MAX_ATTEMPTS = int(os.environ.get('RECHECK_MAX_ATTEMPTS', 3))
+
+class RecheckQueue:
+    """
+    RecheckQueue Class - base of queues keeping "re-check resource X after N seconds" work items
+    """
+
+    # True if queue is drained by lambda_handler itself (local backends) instead of triggering follow-up invocation
+    drain_on_invoke = False
+
+    def send(self, item: dict, delay: int) -> None:
+        """
+        Enqueue work item
+
+        Args:
+            item (dict): work item
+            delay (int): seconds after which item becomes due
+
+        Returns:
+            None
+        """
+        raise NotImplementedError
+
+    def receive(self, now: float = None) -> list:
+        """
+        Dequeue work items which are due
+
+        Args:
+            now (float, optional): current timestamp; time() if None
+
+        Returns:
+            list: due work items
+        """
+        raise NotImplementedError
+
+class SqsRecheckQueue(RecheckQueue):
+    """
+    SqsRecheckQueue Class - SQS delay queue; messages trigger follow-up invocation through event source mapping
+    """
+
+    # SQS does not support longer delay of a message
+    MAX_DELAY = 900
+
+    def __init__(self, queue_url: str, region: str = None):
+        """
+        main __init__ function
+
+        Args:
+            queue_url (str): url of SQS queue
+            region (str, optional): region of SQS queue
+
+        Returns:
+            self
+        """
+        self.queue_url = queue_url
+        self.region = region
+
+    def send(self, item: dict, delay: int) -> None:
+        # Create boto3 client connection
+        sqs_client = client_pool.client('sqs', self.region)
+        sqs_client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(item), DelaySeconds=min(max(int(delay), 0), self.MAX_DELAY))
+
+    def receive(self, now: float = None) -> list:
+        # Create boto3 client connection
+        sqs_client = client_pool.client('sqs', self.region)
+        messages = sqs_client.receive_message(QueueUrl=self.queue_url, MaxNumberOfMessages=10).get('Messages', [])
+        for message in messages:
+            sqs_client.delete_message(QueueUrl=self.queue_url, ReceiptHandle=message['ReceiptHandle'])
+        return [json.loads(message['Body']) for message in messages]
+
+class MemoryRecheckQueue(RecheckQueue):
+    """
+    MemoryRecheckQueue Class - in-memory stand-in living as long as the warm Lambda container
+    """
+
+    drain_on_invoke = True
+
+    def __init__(self):
+        """
+        main __init__ function
+
+        Returns:
+            self
+        """
+        self.items = []
+        self.lock = threading.Lock()
+
+    def send(self, item: dict, delay: int) -> None:
+        with self.lock:
+            self.items.append((time() + delay, item))
+
+    def receive(self, now: float = None) -> list:
+        now = time() if now is None else now
+        with self.lock:
+            due = [item for due_at, item in self.items if due_at <= now]
+            self.items = [(due_at, item) for due_at, item in self.items if due_at > now]
+        return due
+
+class FileRecheckQueue(RecheckQueue):
+    """
+    FileRecheckQueue Class - file-backed stand-in keeping one JSON work item per line
+    """
+
+    drain_on_invoke = True
+
+    def __init__(self, path: str):
+        """
+        main __init__ function
+
+        Args:
+            path (str): path of queue file
+
+        Returns:
+            self
+        """
+        self.path = path
+        self.lock = threading.Lock()
+
+    def send(self, item: dict, delay: int) -> None:
+        with self.lock:
+            with open(self.path, 'a') as queue_file:
+                queue_file.write(json.dumps({'due': time() + delay, 'item': item}) + '\n')
+
+    def receive(self, now: float = None) -> list:
+        now = time() if now is None else now
+        with self.lock:
+            if not os.path.exists(self.path):
+                return []
+            with open(self.path) as queue_file:
+                entries = [json.loads(line) for line in queue_file if line.strip()]
+            with open(self.path, 'w') as queue_file:
+                queue_file.writelines(json.dumps(entry) + '\n' for entry in entries if entry['due'] > now)
+        return [entry['item'] for entry in entries if entry['due'] <= now]
+
+def configure_recheck_queue() -> RecheckQueue:
+    """
+    Select recheck queue backend from environment
+
+    Returns:
+        RecheckQueue: configured queue or None if slow paths should keep waiting inside the invocation
+    """
+    backend = os.environ.get('RECHECK_QUEUE_BACKEND', 'sqs' if os.environ.get('RECHECK_QUEUE_URL') else 'none').lower()
+    if backend == 'sqs':
+        return SqsRecheckQueue(os.environ['RECHECK_QUEUE_URL'], os.environ.get('RECHECK_QUEUE_REGION'))
+    elif backend == 'file':
+        return FileRecheckQueue(os.environ.get('RECHECK_QUEUE_FILE', '/tmp/autotagging-recheck.jsonl'))
+    elif backend == 'memory':
+        return MemoryRecheckQueue()
+    return None
+
+# module-level recheck queue; None keeps bounded waiting inside the invocation
+recheck_queue = configure_recheck_queue()
+
+def recheck_delay(timeout: int) -> int:
+    """
+    Split time budget of a slow path between re-checks
+
+    Args:
+        timeout (int): seconds we used to wait for the resource
+
+    Returns:
+        int: delay of a single re-check in seconds
+    """
+    return max(1, -(-int(timeout) // RECHECK_MAX_ATTEMPTS))
+
+def defer_recheck(kind: str, region: str, resource_id: str, timeout: int, **params) -> bool:
+    """
+    Enqueue "re-check resource after N seconds" work item instead of waiting inside current invocation
+
+    Args:
+        kind (str): name of registered recheck handler
+        region (str): region of the resource
+        resource_id (str): id of the resource to re-check
+        timeout (int): seconds we used to wait for the resource
+        params: JSON serializable parameters passed to recheck handler
+
+    Returns:
+        bool: True if work item was enqueued, False if caller has to wait inline
+    """
+    if recheck_queue is None:
+        return False
+    item = {'recheck': kind, 'region': region, 'resource_id': resource_id, 'timeout': timeout, 'attempt': 1, 'params': params}
+    try:
+        recheck_queue.send(item, recheck_delay(timeout))
+        logger.info(f'Deferred {kind} re-check of {resource_id} for {recheck_delay(timeout)} seconds (attempt 1 of {RECHECK_MAX_ATTEMPTS})')
+        return True
+
+    except Exception as error:
+        logger.error(f'Error message: {str(error)}')
+        logger.exception(f'Cannot defer {kind} re-check of {resource_id}, waiting inline: ')
+        return False
+
+def requeue_recheck(item: dict) -> bool:
+    """
+    Enqueue work item again if resource is still not ready
+
+    Args:
+        item (dict): work item
+
+    Returns:
+        bool: True if work item was enqueued again, False if attempts are exhausted and resource should be tagged as is
+    """
+    if recheck_queue is None or item['attempt'] >= RECHECK_MAX_ATTEMPTS:
+        logger.warning(f'{item["recheck"]} of {item["resource_id"]} not ready after {item["attempt"]} re-checks, proceeding')
+        return False
+    item = dict(item, attempt=item['attempt'] + 1)
+    recheck_queue.send(item, recheck_delay(item['timeout']))
+    logger.info(f'{item["recheck"]} of {item["resource_id"]} not ready, re-check {item["attempt"]} of {RECHECK_MAX_ATTEMPTS} in {recheck_delay(item["timeout"])} seconds')
+    return True
+
+class TagEvaluator:
+    """
+    TagEvaluator Class containing functions evaluating Env and Department tags
+    """
+      
+    def __init__(self):
+        """
+        main __init__ function
+        
+        Args:
+        Returns: 
+        """        
+        
+        logger.info("Initializing TagEvaluator")
+    
+    @staticmethod
+    def determine_env_tag_with_regex(name: str) -> str:
+        """
+        Evaluate Env tag using regex and instance name
+        
+        Args:
+            name ([str]): instance name to check with regex
+
+        Returns:
+            [str]: env_tag variable
+        """
+        try:
+            # precompiled classifier matches all env keywords at once, keeps their priority and memoizes names
+            env_tag = env_classifier.env_tag(str(name.lower()))
+
+            # if env_tag is not empty, return it
+            if env_tag:
+                return env_tag
+            
+            elif not env_tag:
+                logger.error('Cannot determine env tag')
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with determine_env_tag_with_regex: ')
+            return False
+    
+    @staticmethod      
+    def determine_department_tag(env_tag: str) -> str:
+        """
+        Evaluate Department tag using tags retrieved either via boto3 client, event details or regex env tag
+
+        Args:
+            env_tag ([str]): env tag to assess
+
+        Returns:
+            [str]: dep_tag variable 
+        """    
+        try:
+            # determine department tag using env to department mapping of the classifier
+            dep_tag = env_classifier.department_tag(env_tag)
+            
+            # if dep_tag is not empty, return it
+            if dep_tag:
+                return dep_tag
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with determine_department_tag: ')
+            return False
+    
+    
+    def evaluate_env_and_dep_tags(self, name: str) -> str:
+        """
+        Call class methods to evaluate and return Env and Department tags
+
+        Args:
+            name (str): resource name to pass onto class methods
+
+        Returns:
+            str: return env_tag, dep_tag
+        """        
+        try:
+            # call determine_env_tag_with_regex method to get env_tag
+            logger.info(name)
+            env_tag = str(self.determine_env_tag_with_regex(name))
+            logger.info(f'Env tag: {str(env_tag)}')
+            # call determine_department_tag method to get env_tag                        
+            dep_tag = str(self.determine_department_tag(env_tag))
+            logger.info(f'Department tag: {str(dep_tag)}')
+
+            # return both tags
+            return env_tag, dep_tag
+        
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with evaluate_env_and_dep_tags: ')
+            return False
+
+class TagSet:
+    """
+    TagSet Class - dict-backed view of a tag list built once, with O(1) membership and lookup
+    """
+
+    __slots__ = ('tags',)
+
+    def __init__(self, tags=None):
+        """
+        main __init__ function
+
+        Args:
+            tags (list|dict|TagSet, optional): CloudTrail tags [{'key': ..., 'value': ...}], API tags [{'Key': ..., 'Value': ...}],
+                                               {key: value} dict or another TagSet
+
+        Returns:
+            self
+        """
+        if isinstance(tags, TagSet):
+            self.tags = dict(tags.tags)
+        elif isinstance(tags, dict):
+            self.tags = dict(tags)
+        else:
+            self.tags = {}
+            for tag in tags or ():
+                if 'Key' in tag:
+                    self.tags[tag['Key']] = tag.get('Value', '')
+                else:
+                    self.tags[tag['key']] = tag.get('value', '')
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.tags
+
+    def __getitem__(self, key: str) -> str:
+        return self.tags[key]
+
+    def __iter__(self):
+        return iter(self.tags)
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TagSet) and self.tags == other.tags
+
+    def __repr__(self) -> str:
+        return f'TagSet({self.tags!r})'
+
+    def get(self, key: str, default: str = None) -> str:
+        """
+        Value of a tag
+
+        Args:
+            key (str): tag key
+            default (str, optional): value returned if tag is missing
+
+        Returns:
+            str: tag value or default
+        """
+        return self.tags.get(key, default)
+
+    def has_any(self, *keys: str) -> bool:
+        """
+        Check if any of tag keys is present
+
+        Returns:
+            bool: True or False
+        """
+        return any(key in self.tags for key in keys)
+
+    def items(self):
+        return self.tags.items()
+
+    def project(self, keys) -> 'TagSet':
+        """
+        Projection onto an allow-list of tag keys, keeping order of tags
+
+        Args:
+            keys (iterable): allowed tag keys
+
+        Returns:
+            TagSet: tags which keys are allowed
+        """
+        allowed = keys if isinstance(keys, (set, frozenset, dict)) else set(keys)
+        return TagSet({key: value for key, value in self.tags.items() if key in allowed})
+
+    def without(self, keys) -> 'TagSet':
+        """
+        Copy without deny-listed tag keys, keeping order of tags
+
+        Args:
+            keys (iterable): denied tag keys
+
+        Returns:
+            TagSet: tags which keys are not denied
+        """
+        denied = keys if isinstance(keys, (set, frozenset, dict)) else set(keys)
+        return TagSet({key: value for key, value in self.tags.items() if key not in denied})
+
+    def update(self, tags) -> 'TagSet':
+        """
+        Add or overwrite tags in place
+
+        Args:
+            tags (list|dict|TagSet): tags in any supported format
+
+        Returns:
+            TagSet: self
+        """
+        self.tags.update(TagSet(tags).tags)
+        return self
+
+    def to_api(self) -> list:
+        """
+        Wire format of EC2, ELB, RDS and most of the other APIs
+
+        Returns:
+            list: [{'Key': ..., 'Value': ...}]
+        """
+        return [{'Key': key, 'Value': value} for key, value in self.tags.items()]
+
+    def to_cloudtrail(self) -> list:
+        """
+        Wire format of CloudTrail events and ECS API
+
+        Returns:
+            list: [{'key': ..., 'value': ...}]
+        """
+        return [{'key': key, 'value': value} for key, value in self.tags.items()]
+
+    def to_dict(self) -> dict:
+        """
+        Wire format of Lambda, EKS and other APIs using tag maps
+
+        Returns:
+            dict: {key: value}
+        """
+        return dict(self.tags)
+
+class TagWriter:
+    """
+    TagWriter Class batching EC2 create_tags calls: tags are merged per resource and identical tag sets share one call
+    """
+
+    # CreateTags accepts up to 1000 resource ids in one call
+    MAX_RESOURCES = 1000
+
+    def __init__(self, ec2_client: object):
+        """
+        main __init__ function
+
+        Args:
+            ec2_client (object): ec2 boto3 client
+
+        Returns:
+            self
+        """
+        self.ec2_client = ec2_client
+        # resource id -> {tag key: tag value}, in order of first appearance
+        self.pending = {}
+        # resource id -> {tag key: None} of tags to delete
+        self.pending_deletes = {}
+        self.calls = 0
+        # tags may be queued from worker threads
+        self.lock = threading.Lock()
+
+    def add(self, resource_ids: list, tags: list) -> None:
+        """
+        Queue tags for resources; successive tags on the same resource are merged, later values win
+
+        Args:
+            resource_ids (list): ids of EC2 resources
+            tags (list|TagSet): tags in API format [{'Key': ..., 'Value': ...}] or TagSet
+
+        Returns:
+            None
+        """
+        tags = TagSet(tags)
+        with self.lock:
+            for resource_id in resource_ids:
+                self.pending.setdefault(resource_id, {}).update(tags.items())
+
+    def delete(self, resource_ids: list, keys) -> None:
+        """
+        Queue deletion of tag keys of resources
+
+        Args:
+            resource_ids (list): ids of EC2 resources
+            keys (iterable): tag keys
+
+        Returns:
+            None
+        """
+        keys = list(keys)
+        with self.lock:
+            for resource_id in resource_ids:
+                self.pending_deletes.setdefault(resource_id, {}).update(dict.fromkeys(keys))
+
+    def reconcile(self, resource_id: str, current, desired=None, remove=()) -> TagSet:
+        """
+        Queue only tags which differ from known current tags of resource, like reconcile_tags does for single writes
+
+        Args:
+            resource_id (str): id of EC2 resource
+            current (list|dict|TagSet): known current tags of resource
+            desired (list|dict|TagSet, optional): tags resource should have
+            remove (iterable, optional): tag keys resource should not have
+
+        Returns:
+            TagSet: tags of resource after flush
+        """
+        current = TagSet(current)
+        desired = TagSet(desired)
+        changed = TagSet({key: value for key, value in desired.items() if current.get(key) != value})
+        stale = [key for key in dict.fromkeys(remove) if key in current and key not in desired]
+        if changed:
+            self.add([resource_id], changed)
+        if stale:
+            self.delete([resource_id], stale)
+        skipped_calls = int(bool(desired) and not changed) + int(bool(remove) and not stale)
+        reconcile_log.append(ReconcileResult(resource_id, len(changed), len(stale), len(desired) - len(changed), skipped_calls))
+        return current.without(stale).update(changed)
+
+    def reconcile_plan(self, graph: ResourceGraph, plan: dict) -> None:
+        """
+        Queue planned tags of resources which differ from their tags known to resource graph and tags already queued
+
+        Args:
+            graph (ResourceGraph): graph the plan is made from
+            plan (dict): resource id -> desired tags, see ResourceGraph.plan
+
+        Returns:
+            None
+        """
+        for resource_id, desired in plan.items():
+            current = graph.tags(resource_id)
+            # queued tags are written anyway, so they count as current; resources with unknown tags get all desired tags
+            if current is not None:
+                with self.lock:
+                    current.update(self.pending.get(resource_id, {}))
+            self.reconcile(resource_id, current, desired)
+
+    def flush(self) -> int:
+        """
+        Write queued tags with one create_tags call per identical tag set
+
+        Returns:
+            int: number of create_tags calls
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            pending_deletes, self.pending_deletes = self.pending_deletes, {}
+        groups = {}
+        for resource_id, resource_tags in pending.items():
+            if resource_tags:
+                groups.setdefault(tuple(resource_tags.items()), []).append(resource_id)
+        delete_groups = {}
+        for resource_id, keys in pending_deletes.items():
+            if keys:
+                delete_groups.setdefault(tuple(keys), []).append(resource_id)
+
+        calls = 0
+        for tag_items, resource_ids in groups.items():
+            tags = [{'Key': key, 'Value': value} for key, value in tag_items]
+            for index in range(0, len(resource_ids), self.MAX_RESOURCES):
+                chunk = resource_ids[index:index + self.MAX_RESOURCES]
+                logger.info(f'Tagging EC2 resources: {", ".join(chunk)} ({", ".join(key for key, _ in tag_items)})')
+                # apply tags using ec2_client
+                self.ec2_client.create_tags(Resources=chunk, Tags=tags)
+                calls += 1
+        for keys, resource_ids in delete_groups.items():
+            for index in range(0, len(resource_ids), self.MAX_RESOURCES):
+                chunk = resource_ids[index:index + self.MAX_RESOURCES]
+                logger.info(f'Removing tags of EC2 resources: {", ".join(chunk)} ({", ".join(keys)})')
+                # remove tags using ec2_client
+                self.ec2_client.delete_tags(Resources=chunk, Tags=[{'Key': key} for key in keys])
+                calls += 1
+        self.calls += calls
+        return calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        # tags queued before an error are written as well, like the unbatched calls used to be
+        try:
+            self.flush()
+        except Exception as error:
+            if exc_type is None:
+                raise
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with TagWriter flush: ')
+        return False
+
+# outcome of reconciling tags of one resource: keys created or changed, keys deleted, keys already in place and API calls saved
+ReconcileResult = namedtuple('ReconcileResult', ['resource_id', 'written', 'deleted', 'unchanged', 'skipped_calls'])
+
+# ReconcileResult of every reconciled resource during current invocation
+reconcile_log = []
+
+def reconcile_tags(ec2_client: object, resource_id: str, current, desired=None, remove=()) -> TagSet:
+    """
+    Bring tags of EC2 resource to desired state writing only added or changed keys and deleting only present keys
+
+    Args:
+        ec2_client (object): ec2 boto3 client
+        resource_id (str): id of EC2 resource
+        current (list|dict|TagSet): known current tags of resource, e.g. from event payload or cached describe
+        desired (list|dict|TagSet, optional): tags resource should have
+        remove (iterable, optional): tag keys resource should not have
+
+    Returns:
+        TagSet: tags of resource after reconcile
+    """
+    current = TagSet(current)
+    desired = TagSet(desired)
+    changed = TagSet({key: value for key, value in desired.items() if current.get(key) != value})
+    stale = [key for key in dict.fromkeys(remove) if key in current and key not in desired]
+
+    # create_tags and delete_tags are separate calls, each one is sent only if there is something to change
+    if changed:
+        logger.info(f'Tagging {resource_id}: {", ".join(changed)}')
+        ec2_client.create_tags(Resources=[resource_id], Tags=changed.to_api())
+    if stale:
+        logger.info(f'Removing tags of {resource_id}: {", ".join(stale)}')
+        ec2_client.delete_tags(Resources=[resource_id], Tags=[{'Key': key} for key in stale])
+
+    skipped_calls = int(bool(desired) and not changed) + int(bool(remove) and not stale)
+    reconcile_log.append(ReconcileResult(resource_id, len(changed), len(stale), len(desired) - len(changed), skipped_calls))
+    return current.without(stale).update(changed)
+
+def known_instance_tags(instance_id: str) -> TagSet:
+    """
+    Tags of instance known from cached describe, without calling the API
+
+    Args:
+        instance_id (str): id of instance
+
+    Returns:
+        TagSet: cached tags or empty TagSet
+    """
+    instances = instance_cache.get(instance_id) or {'Reservations': []}
+    for reservation in instances['Reservations']:
+        for instance in reservation['Instances']:
+            return TagSet(instance.get('Tags'))
+    return TagSet()
+
+def describe_instance_tags(ec2_client: object, instance_ids: list) -> dict:
+    """
+    Get tags of many instances with one paginated describe_instances call per FILTER_MAX_VALUES ids;
+    described instances are shared with handlers through instance_cache and resource graph of the region
+
+    Args:
+        ec2_client (object): ec2 boto3 client
+        instance_ids (list): ids of instances
+
+    Returns:
+        dict: instance id -> TagSet; terminated or unknown instances are missing
+    """
+    instance_ids = list(dict.fromkeys(instance_ids))
+    graph = resource_graph(ec2_client.meta.region_name)
+    tags = {}
+    for start in range(0, len(instance_ids), FILTER_MAX_VALUES):
+        # filter does not fail on unknown ids, unlike InstanceIds
+        for page in ec2_client.get_paginator('describe_instances').paginate(Filters=[{'Name': 'instance-id', 'Values': instance_ids[start:start + FILTER_MAX_VALUES]}]):
+            graph.add_instances(page['Reservations'])
+            for reservation in page['Reservations']:
+                for instance in reservation['Instances']:
+                    instance_cache.put(instance['InstanceId'], {'Reservations': [dict(reservation, Instances=[instance])]})
+                    if instance['State']['Name'] != 'terminated':
+                        tags[instance['InstanceId']] = TagSet(instance.get('Tags'))
+    return tags
+
+def target_group_lb_name(alb_client: object, tg: dict) -> str:
+    """
+    Get name of the first load balancer of target group
+
+    Args:
+        alb_client (object): elbv2 boto3 client
+        tg (dict): described target group
+
+    Returns:
+        str: load balancer name
+    """
+    load_balancers = alb_client.describe_load_balancers(LoadBalancerArns=tg['LoadBalancerArns'][:1])['LoadBalancers']
+    return load_balancers[0]['LoadBalancerName'] if load_balancers else tg['LoadBalancerArns'][0].split('/')[-2]
+
+class TagHandler:
+    """
+    TagHandler Class containing instance, image and volume iterators
+    """
+
+    # instance tags propagated to attached volumes and ENI's
+    PROPAGATED_TAG_KEYS = frozenset(['Name', 'Env', 'Department', 'Customers', 'Cluster', 'Owner', 'Id', 'tenant', 'stage', 'Project', 'Class', 'Role', 'application'])
+    # instance tags propagated to EIP's and ENI's looked up by address
+    EIP_ENI_TAG_KEYS = PROPAGATED_TAG_KEYS - {'Owner'}
+    # security group tags propagated to ENI's of ECS tasks
+    SG_TAG_KEYS = PROPAGATED_TAG_KEYS - {'Name'}
+    # instance tags not inherited by AMI images
+    AMI_EXCLUDED_TAG_KEYS = frozenset(['Owner', 'LastStartedBy', 'LastStoppedBy'])
+
+      
+    # owners of AMI images looked up by id
+    AMI_OWNERS = ['self']
+      
+    def __init__(self, id: str = None, region: str = None, **scope: str):
+        """
+        main __init__ function; describe calls are deferred until a field is first accessed
+        
+        Args: 
+            instance_id ([str]): instance_id to filter
+            region ([str]): region of event
+    
+        Returns:
+            self
+        """        
+        # assign class properties
+        self.region = region
+        self.scope = scope
+        self.id = id
+        # memoized describe results by field name
+        self.described = {}
+        # create boto3 client/resource connection
+        self.ec2_client = client_pool.client('ec2', region)
+        self.assign_id()
+
+    def assign_id(self) -> None:
+        """
+        Assign resource id properties based on type of the ec2 resource
+
+        Returns:
+            None
+        """
+        if self.id and self.region:
+            for id_type in self.scope.values():
+                # assign properties for ec2_instance 
+                if id_type == 'ec2':
+                    self.instance_id = self.id
+                    logger.info(f'Initializing TagHandler with EC2 Instance ID: {str(self.instance_id)}')
+                
+                # assign properties for eni interface 
+                elif id_type == 'eni':
+                    self.eni_id = self.id
+                    logger.info(f'Initializing TagHandler with ENI ID: {str(self.eni_id)}')
+                    
+                # assign properties for ami image 
+                elif id_type == 'ami':
+                    self.ami_image_id = self.id
+                    logger.info(f'Initializing TagHandler with AMI ID: {str(self.ami_image_id)}')
+                    
+                elif id_type == 'none':
+                    logger.info("proceeding to method")
+
+                else:
+                    logger.info("scope is not properly defined; should be \"ec2\", \"eni\", \"ami\" or \"none\"")
+
+    def describe(self, field: str, loader) -> dict:
+        """
+        Return memoized describe result of a field, calling loader on first access
+
+        Args:
+            field (str): name of the field
+            loader (callable): describe call returning the field value
+
+        Returns:
+            dict: describe result
+        """
+        if field not in self.described:
+            self.described[field] = loader()
+        return self.described[field]
+
+    def invalidate(self, *fields: str) -> None:
+        """
+        Drop memoized describe results so that they are loaded again on next access
+
+        Args:
+            fields (str, optional): names of the fields ("instances", "interfaces", "ami_images"); all fields if empty
+
+        Returns:
+            None
+        """
+        for field in fields or list(self.described):
+            self.described.pop(field, None)
+            # details shared with other handlers are loaded again as well
+            if field == 'instances':
+                instance_cache.invalidate(getattr(self, 'instance_id', None))
+            elif field == 'interfaces':
+                interface_cache.invalidate(getattr(self, 'eni_id', None))
+
+    @property
+    def instances(self) -> dict:
+        return self.describe('instances', self.describe_instances)
+
+    def describe_instances(self) -> dict:
+        """
+        Describe instance, sharing result with other handlers through instance_cache
+
+        Returns:
+            dict: describe_instances response
+        """
+        instances = instance_cache.get(self.instance_id)
+        if instances is None:
+            instances = self.ec2_client.describe_instances(InstanceIds=[self.instance_id])
+            # instances which are not visible yet are not cached
+            if instances['Reservations']:
+                instance_cache.put(self.instance_id, instances)
+        return instances
+
+    @property
+    def instance(self) -> dict:
+        # first instance of reservations or None if instance is gone
+        for reservation in self.instances['Reservations']:
+            for instance in reservation['Instances']:
+                return instance
+        logger.error(f'Instance seems to be terminated: {str(self.instance_id)}')
+        return None
+
+    @property
+    def instance_tags(self) -> list:
+        return (self.instance or {}).get('Tags', [])
+
+    @property
+    def instance_tagset(self) -> TagSet:
+        return TagSet(self.instance_tags)
+
+    @property
+    def instance_name(self) -> str:
+        tags = self.instance_tagset
+        if 'eks:nodegroup-name' in tags:
+            return tags['eks:nodegroup-name'] + '-instance'
+        return tags.get('Name')
+
+    @property
+    def interfaces(self) -> dict:
+        return self.describe('interfaces', lambda: interface_cache.get(self.eni_id, lambda: self.ec2_client.describe_network_interfaces(NetworkInterfaceIds=[self.eni_id])))
+
+    @property
+    def ami_images(self) -> dict:
+        return self.describe('ami_images', lambda: self.ec2_client.describe_images(ImageIds=[self.ami_image_id], Owners=self.AMI_OWNERS))
+
+    @property
+    def ami_image_tags(self) -> list:
+        for ami_image in self.ami_images['Images']:
+            return ami_image.get('Tags', [])
+        return []
+
+    @property
+    def ami_image_name(self) -> str:
+        return TagSet(self.ami_image_tags).get('Name')
+                            
+    def reset_handler(self, new_id: str = None, fields: tuple = ()) -> None:
+        """
+        Reset handler to apply changes
+
+        Args:
+            id (str, optional): id of a resource
+            fields (tuple, optional): names of the fields to load again; all fields if empty
+
+        Returns:
+            None
+        """       
+        try:
+            logger.info('Resetting handler')
+            # assign new resource id if new_id is not empty else leave self.id
+            if new_id is not None and new_id != self.id:
+                self.id = new_id
+                self.assign_id()
+                fields = ()
+
+            # drop memoized describe results, ec2_client is reused
+            self.invalidate(*fields)
+        
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with reset_handler: ')
+            return False
+        
+    def instance_ready(self, tag_keys: tuple = ()) -> bool:
+        """
+        Refresh instance details and check if instance is ready to be tagged
+
+        Args:
+            tag_keys (tuple, optional): instance is ready once any of these tag keys is present
+
+        Returns:
+            bool: True or False
+        """
+        self.reset_handler(fields=('instances',))
+        instance = self.instance
+        if not instance or not instance.get('BlockDeviceMappings'):
+            return False
+        return not tag_keys or TagSet(instance.get('Tags')).has_any(*tag_keys)
+
+    def get_instance_tags(self) -> list:
+        """
+        Retrieve tags of an instance
+
+        Args: 
+            self
+            
+        Returns: 
+            list --> list of tags
+        """        
+        try:
+            # if instance_tags are not empty, return them
+            if self.instance_tags and self.instance_name:
+                logger.info(f'getting tags of {self.instance_name}')
+                return self.instance_tags
+            elif self.instance_tags and not self.instance_name:
+                logger.info(f'getting tags of {self.instance_id}')
+                return self.instance_tags
+            elif not self.instance_tags:
+                logger.info('no tags found, returning empty list')
+                return self.instance_tags
+            
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with get_instance_tags: ')
+            return False
+        
+    def get_image_tags(self) -> list:
+        """
+        Retrieve tags of an AMI image
+
+        Args: 
+            self
+            
+        Returns: 
+            list --> list of tags
+        """        
+        try:
+            # if image_tags are not empty, return them
+            if self.ami_image_tags and self.ami_image_name:
+                logger.info(f'getting tags of {self.ami_image_name}')
+                return self.ami_image_tags
+            elif self.ami_image_tags and not self.ami_image_name:
+                logger.info(f'getting tags of {self.ami_image_id}')
+                return self.ami_image_tags
+            elif not self.ami_image_tags:
+                logger.info('no tags found, returning empty list')
+                return self.ami_image_tags
+            
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with get_image_tags: ')
+            return False
+        
+    def parse_and_tag_volumes_and_eni(self, TagEni: bool = True, retry: bool = True, tagwriter: TagWriter = None) -> bool:
+        """ 
+        Parse and tag instance volumes and ENI's using boto3 client
+
+        Args: 
+            self
+            TagEni (bool): if True create tags for ENI interface as well; if False create tags for volumes only
+            retry (bool): if True retry once after IndexError
+            tagwriter (TagWriter, optional): batch tags into writer flushed by the caller; written right away if None
+            
+        Returns: 
+            bool --> True or False
+
+        """    
+        try:
+            if is_test_event:
+                log_payload('tags on parse_and_tag_volumes_and_eni stage', self.instance_tags)
+                
+            # project instance tags onto tags propagated to volumes and ENI's
+            newtags = self.instance_tagset.project(self.PROPAGATED_TAG_KEYS)
+            if newtags:
+                logger.info(f'Parsing volumes of instance: {str(self.instance_name)}')
+                # volumes and ENI's of the instance are taken from resource graph fed with its describe
+                graph = resource_graph(self.region)
+                graph.add_instances(self.instances['Reservations'])
+                def propagate(instance_tags: dict, current: dict) -> dict:
+                    return newtags.to_dict()
+                plan = graph.plan(self.instance_id, {VOLUME: propagate, ENI: propagate} if TagEni else {VOLUME: propagate})
+
+                # volumes and ENI's share the same tags, so they are written with a single call; tags already in place are skipped
+                if tagwriter is not None:
+                    tagwriter.reconcile_plan(graph, plan)
+                else:
+                    with TagWriter(self.ec2_client) as instancewriter:
+                        instancewriter.reconcile_plan(graph, plan)
+
+                return True
+            
+            else:
+                logger.error('Cannot process tags')
+                return False            
+                            
+        except IndexError as indexerror:
+            # in case of IndexError wait up to 5 seconds for instance details and retry the method once
+            logger.info(f'Retrying parse_and_tag_volumes_and_eni after IndexError: {str(indexerror)}')
+            if retry and wait_until(self.instance_ready, 5, f'instance {self.id} details').ready:
+                return self.parse_and_tag_volumes_and_eni(TagEni, retry=False, tagwriter=tagwriter)
+            return False
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with parse_and_tag_volumes_and_eni: ')
+            return False
+
+
+    def parse_and_tag_ec2_instance(self) -> bool:
+        """ 
+        Parse and tag instances by instance_id using boto3 client
+
+        Args: 
+            self
+            
+        Returns: 
+            bool --> True or False
+        """
+        try:
+            
+            # initiliaze TagEvaluator to determine Env and Department tags# Initiliaze TagEvaluator class
+            tagevaluator = TagEvaluator()
+            logger.info(f'Checking instance: {str(self.instance_name)}')
+            # get tag keys from self.instance_tagset property
+            tagkeys = self.instance_tagset
+            
+            if is_test_event:
+                log_payload('tags on parse_and_tag_ec2_instance stage', self.instance_tags)
+            
+            # determine Department tag based on available Env tag
+            if 'Env' in tagkeys and 'Department' not in tagkeys:
+                    env_tag = tagkeys['Env'].lower()
+                    logger.info('adding Department tag')
+                    dep_tag = str(tagevaluator.determine_department_tag(env_tag))
+                    if dep_tag != '':
+                        logger.info(f'Department tag: {str(dep_tag)}')
+                        # apply tags using ec2_client
+                        self.ec2_client.create_tags(Resources=[self.instance_id], Tags=[{'Key': 'Department', 'Value': dep_tag}])
+                    else:
+                        logger.info('Cannot determine a correct Department tag, tagging as Development')
+                        # apply tags using ec2_client
+                        self.ec2_client.create_tags(Resources=[self.instance_id], Tags=[{'Key': 'Department', 'Value': 'Development'}])
+            
+            # determine Env tag based on available Name tag (ignore elasticbeanstalk instances)
+            elif 'Env' not in tagkeys and 'Name' in tagkeys and 'elasticbeanstalk:environment-name' not in tagkeys:
+                logger.info('adding Env tag')
+                env_tag = str(tagevaluator.determine_env_tag_with_regex(self.instance_name))
+                logger.info(f'Env tag: {str(env_tag)}')
+                logger.info('adding Department tag')
+                dep_tag = str(tagevaluator.determine_department_tag(env_tag))
+                logger.info(f'Department tag: {str(dep_tag)}')
+                # apply both tags with a single ec2_client call
+                self.ec2_client.create_tags(Resources=[self.instance_id], Tags=[
+                                                                            {'Key': 'Env', 'Value': env_tag},
+                                                                            {'Key': 'Department', 'Value': dep_tag}
+                                                                            ])
+            
+            # use instance id as Name tag for unnamed instances
+            elif 'Name' not in tagkeys and 'eks:nodegroup-name' not in tagkeys:
+                logger.info('detected unnamed instance without Env tag')
+                # apply tags using ec2_client
+                self.ec2_client.create_tags(Resources=[self.instance_id], Tags=[
+                                                                            {'Key': 'Name', 'Value': self.instance_id},
+                                                                            {'Key': 'Env', 'Value': 'dev'},
+                                                                            {'Key': 'Department', 'Value': 'Development'}
+                                                                            ])
+                
+            # tag unnamed EKS instances
+            elif 'eks:nodegroup-name' in tagkeys:
+                logger.info('detected unnamed instance without Env tag')
+                env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(self.instance_name)
+                logger.info(f'Env tag: {str(env_tag)}')
+                logger.info(f'Department tag: {str(dep_tag)}')
+                # apply tags using ec2_client
+                self.ec2_client.create_tags(Resources=[self.instance_id], Tags=[
+                                                                            {'Key': 'Name', 'Value': self.instance_name},
+                                                                            {'Key': 'Env', 'Value': env_tag},
+                                                                            {'Key': 'Department', 'Value': dep_tag}
+                                                                            ])
+                    
+            else:
+                logger.info('Cannot find proper conditions')
+                pass
+            
+            return True
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with parse_and_tag_ec2_instance: ')
+            return False
+
+
+    @classmethod
+    def image_tagset(cls, instance_tags, instance_name: str = None) -> TagSet:
+        """
+        Tags of AMI image created from an instance
+
+        Args:
+            instance_tags (list|dict|TagSet): tags of the instance
+            instance_name (str, optional): name of the instance; Name tag if None
+
+        Returns:
+            TagSet: instance tags without AMI_EXCLUDED_TAG_KEYS, with packer tags for images of Packer Builder instances
+        """
+        instance_tags = TagSet(instance_tags)
+        image_tags = instance_tags.without(cls.AMI_EXCLUDED_TAG_KEYS)
+        # add more tags if we are processing Packer Builder instance
+        if (instance_name or instance_tags.get('Name')) == 'Packer Builder':
+            image_tags.update({'BuiltBy': 'packer', 'Env': 'qa', 'Department': 'Operations'})
+        return image_tags
+
+    def get_tags_for_ami_image(self) -> list:
+        """ 
+        Create list of tags for AMI images using boto3 client
+
+        Args:
+            self
+            
+        Returns:
+            [list]: list of tags
+        """    
+        try:
+            # fill image tags with tags derived from instance tags
+            if self.instance_tagset:
+                image_tags = self.image_tagset(self.instance_tagset, self.instance_name)
+                
+                if image_tags:
+                    logger.info(f'Formed tags for instance: {str(self.instance_name)}')
+                    log_payload('tags', image_tags.to_dict())
+                    # return tags if list is not empty
+                    return image_tags.to_api()
+                
+            elif not self.instance_tagset:
+                logger.error('No tags found, returning empty list')
+                return []
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with get_tags_for_ami_image: ')
+            return False
+        
+        
+    def get_tags_for_eip_and_eni(self) -> list:
+        """ 
+        Create list of tags for EIP or ENI using boto3 client
+
+        Args:
+            self
+            
+        Returns:
+            [list]: list of tags
+        """    
+        try:
+            # fill list of tags with tags checking only certain tag keys actualized before in EIP_ENI_TAG_KEYS
+            eip_eni_tags = self.instance_tagset.project(self.EIP_ENI_TAG_KEYS)
+            
+            # return tags if list is not empty
+            if eip_eni_tags:
+                logger.info(f'Formed tags based on instance: {str(self.instance_name)}')
+                log_payload('tags', eip_eni_tags.to_dict())
+                return eip_eni_tags.to_api()
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with get_tags_for_eip_and_eni: ')
+            return False
+        
+    def get_tags_for_nat_eni(self) -> list:
+        """ 
+        Parse and tag NAT gateway ENI using boto3 client
+
+        Args:
+            self
+            
+        Returns:
+            [list]: list of tags
+        """    
+        try:
+            # get tags for eni interface from self.interfaces
+            for eni in self.interfaces['NetworkInterfaces']:
+                # create predefined tags if eni type if nat_gateway
+                if eni['InterfaceType'] == 'nat_gateway':
+                    nat_name = eni['Description'].split()[4]
+                    
+                    eni_tags = [
+                        {'Key': 'Name', 'Value': nat_name},
+                        {'Key': 'Env', 'Value': 'ops'},
+                        {'Key': 'Department', 'Value': 'Operations'}
+                                ]
+                
+                    if eni_tags:
+                        return eni_tags
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with get_tags_for_nat_eni: ')
+            return False
+        
+    def get_tags_from_security_group(self, sg_id: str) -> list:
+        """ 
+        Get tags from security group
+
+        Args:
+            self
+            
+        Returns:
+            [list]: list of tags
+        """    
+        try:
+            # get security group, shared with other invocations through sg_cache
+            security_groups = sg_cache.get(sg_id, lambda: self.ec2_client.describe_security_groups(GroupIds=[sg_id])['SecurityGroups'])
+            # derive existing security group tags and create a new list of tags
+            for s_group in security_groups:
+                # create a new list of tags based on existing tags
+                sg_tags = TagSet(s_group.get('Tags')).project(self.SG_TAG_KEYS)
+                
+                # return a new list of tags
+                if sg_tags:
+                    logger.info(f'Formed tags based on SG: {str(sg_id)}')
+                    
+                    return sg_tags.to_api()
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Something went wrong with get_tags_from_security_group: ')
+            return False
+        
+    def processing_ec2_tags(self, seconds: int, tag_keys: tuple = ('Name', 'Env'), wait: bool = True) -> bool:
+        """
+        Parse tags for instances which tags have not been created by the time of receiving event
+
+        Args:
+            seconds (int): timeout value
+            tag_keys (tuple, optional): stop waiting once any of these tag keys is present
+            wait (bool, optional): False if instance has already been re-checked by deferred invocation
+
+        Returns:
+            bool: True or False
+        """
+        try:
+            if wait:
+                # hand instance over to follow-up invocation if recheck queue is configured
+                if defer_recheck('ec2_instance_tags', self.region, self.id, seconds, tag_keys=list(tag_keys)) is True:
+                    return True
+                logger.info(f'tags not found, waiting up to {str(seconds)} seconds until we get tags')
+                # poll instance until tags are in place; proceed with whatever we have once timeout is reached
+                wait_until(lambda: self.instance_ready(tag_keys), seconds, f'tags of instance {self.id}')
+            # invoke parse_and_tag_ec2_instance method
+            if self.parse_and_tag_ec2_instance() is True:           
+                # invoke reset_handler and describe instance again (this way we will get actual tags)
+                self.reset_handler(fields=('instances',))
+                # invoke parse_and_tag_volumes_and_eni method to tag volumes and eni attached to instance 
+                if self.parse_and_tag_volumes_and_eni() is True:
+                    # if it exits without error, return True
+                    return True
+                else:
+                    # or exit with error
+                    return False
+            else:
+                return False
+
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Exception thrown at inner processing_ec2_tags function: ')
+            return False      
+
+def finishing_sequence(context: object = None, eventname: str = None, status: str = None, error: str = None, exception: bool = True) -> bool:
+    
+    """
+    Internal function outputting used/remaining time and results of the event processing
+
+    Args:
+        context (object): receive context from lambda_handler
+        eventname (str): receive context from lambda_handler
+        status (str): determine if sequence succeeded or failed
+        error (str, optional): output error if status is "fail". Defaults to None.
+
+    Returns:
+        bool: [description]
+    """        
+    try:
+        if status == "success":
+            if is_test_event is True:
+                logger.info(f"TestEvent succeeded while processing {str(eventname)}")
+            elif is_test_event is False:
+                logger.info(f"Function {str(context.function_name)} (version: {str(context.function_version)}) succeeded while processing {str(eventname)}")
+                            
+        elif status == "fail":
+            logger.error(f'Error message: {str(error)}')
+            logger.exception(f'Exception thrown at {eventname}: ') if exception is True else ...
+            if is_test_event is True:
+                logger.info(f"TestEvent failed while processing {str(eventname)} due to {str(error)}")
+            elif is_test_event is False:
+                logger.info(f"Function {str(context.function_name)} (version: {str(context.function_version)}) failed while processing {str(eventname)} due to {str(error)}")
+        
+        if any(cache.hits or cache.misses for cache in tag_caches):
+            logger.info(f'Tag cache: {"; ".join(cache.stats() for cache in tag_caches)}')
+        for region, graph in list(resource_graphs.items()):
+            if graph.describe_calls:
+                logger.info(f'{region} {graph.stats()}')
+        if reconcile_log:
+            logger.info(f'Reconciled tags of {len(reconcile_log)} resources: {sum(result.written for result in reconcile_log)} keys written, '
+                        f'{sum(result.deleted for result in reconcile_log)} deleted, {sum(result.unchanged for result in reconcile_log)} unchanged, '
+                        f'{sum(result.skipped_calls for result in reconcile_log)} writes skipped')
+        if wait_log:
+            logger.info(f'Waited: {"{:.3f}".format(sum(elapsed for _, elapsed, _ in wait_log))} seconds in {len(wait_log)} waits ({", ".join(f"{description}: {elapsed:.3f}s" for description, elapsed, _ in wait_log)})')
+        if metrics.invocation_throttles or metrics.invocation_retries:
+            logger.info(f'Throttled: {metrics.invocation_throttles} responses, {metrics.invocation_retries} retries')
+        logger.info(f'Used time: {"{:.3f}".format(metrics.used_time())} seconds || Remaining time: {str((int(context.get_remaining_time_in_millis()) / 1000))} seconds')
+        logger.info(f'Logged: {log_stats["records"]} records, {log_stats["bytes"]} bytes')
+            
+    except Exception as error:
+        logger.error(f'Error message: {str(error)}')
+        logger.exception('Something went wrong with finishing_sequence: ')
+
+# inner function for test event
+def test_event(detail: dict, user: str, region: str, event_time: str) -> bool:
+    """
+    Internal function for processing test CreateFunction20150331 during bitbucket pipelines execution
+
+    Args:
+        detail (dict): receive detail from event
+        user (str): receive user from lambda_handler
+        region (str): receive region from lambda_handler
+
+    Returns:
+        bool: True of False
+    """                
+    logger.info('PIPELINE TEST EVENT')
+    
+    assert len(detail) !=0, "Event details are not available"
+    assert len(user) !=0, "User is not defined"
+    assert len(region) !=0, "Region is not defined"
+    
+    # Create boto3 client connection
+    lambda_client = client_pool.client('lambda', region)
+    try:
+        function_arn = detail['responseElements']['functionArn']
+        function_name = detail['responseElements']['functionName']
+        logger.info(f'Tagging lambda function code during PIPELINE TEST EVENT: {str(function_name)} (user: {str(user)})')
+        
+        # use lambda-python function to apply tags using lambda_client
+        tagging = lambda key, value: lambda_client.tag_resource(Resource=function_arn, Tags={key: value})
+    
+        tagging('TestEvent', 'successful')
+        tagging('TestEventAt', event_time)
+        
+        return True
+        
+    except ClientError as clienterror:
+        logger.error(f'Received botocore exception: {str(clienterror)}')
+        logger.exception('Botocore Exception thrown at PIPELINE TEST EVENT: ')
+        return False 
+    
+    except Exception as error:
+        logger.error(f'Error message: {str(error)}')
+        logger.exception('Exception thrown at PIPELINE TEST EVENT: ')
+        return False
+
+# Registry of event handlers keyed by (eventSource, eventName)
+EVENT_HANDLERS = {}
+
+# module with code handlers of every event source, imported on the first event of the source, so that cold start
+# compiles only code of the incoming service; events of sources without a module are handled by tagging rules only
+HANDLER_MODULES = {
+    'acm.amazonaws.com': 'handlers.acm',
+    'apigateway.amazonaws.com': 'handlers.apigateway',
+    'autoscaling.amazonaws.com': 'handlers.autoscaling',
+    'batch.amazonaws.com': 'handlers.batch',
+    'cloudformation.amazonaws.com': 'handlers.opsworks',
+    'cloudfront.amazonaws.com': 'handlers.cloudfront',
+    'codebuild.amazonaws.com': 'handlers.codebuild',
+    'codepipeline.amazonaws.com': 'handlers.codepipeline',
+    'ec2.amazonaws.com': 'handlers.ec2',
+    'ecs.amazonaws.com': 'handlers.ecs',
+    'eks.amazonaws.com': 'handlers.ecs',
+    'elasticache.amazonaws.com': 'handlers.elasticache',
+    'elasticbeanstalk.amazonaws.com': 'handlers.elasticbeanstalk',
+    'elasticfilesystem.amazonaws.com': 'handlers.fsx',
+    'elasticloadbalancing.amazonaws.com': 'handlers.elb',
+    'fsx.amazonaws.com': 'handlers.fsx',
+    'lambda.amazonaws.com': 'handlers.awslambda',
+    'opsworks.amazonaws.com': 'handlers.opsworks',
+    'organizations.amazonaws.com': 'handlers.organizations',
+    'rds.amazonaws.com': 'handlers.rds',
+    'redshift.amazonaws.com': 'handlers.redshift',
+    'secretsmanager.amazonaws.com': 'handlers.secretsmanager',
+    'workspaces.amazonaws.com': 'handlers.workspaces',
+}
+
+# module with handler of every kind of deferred re-check
+RECHECK_MODULES = {
+    'ami_snapshots': 'handlers.ec2',
+    'ec2_instance_tags': 'handlers.ec2',
+    'ecs_service_tasks': 'handlers.ecs',
+    'ecs_tasks': 'handlers.ecs',
+}
+
+# (module, seconds) of every handler module imported by the container
+module_log = []
+
+def load_handler_module(module: str) -> None:
+    """
+    Import handler module registering its handlers, once per container
+
+    Args:
+        module (str): name of the module, e.g. "handlers.ec2"
+
+    Returns:
+        None
+    """
+    if module in sys.modules:
+        return
+    started = monotonic()
+    importlib.import_module(module)
+    elapsed = monotonic() - started
+    module_log.append((module, elapsed))
+    logger.info(f'Loaded {module} in {elapsed:.3f} seconds')
+
+def find_event_handler(eventsource: str, eventname: str):
+    """
+    Find handler of CloudTrail event, importing handler module of the event source if needed
+
+    Args:
+        eventsource (str): source of the event, e.g. "ec2.amazonaws.com"
+        eventname (str): name of the event, e.g. "RunInstances"
+
+    Returns:
+        handler function or None if the event is not supported
+    """
+    handler = EVENT_HANDLERS.get((eventsource, eventname))
+    if handler is None and eventsource in HANDLER_MODULES:
+        load_handler_module(HANDLER_MODULES[eventsource])
+        handler = EVENT_HANDLERS.get((eventsource, eventname))
+    return handler
+
+# clients created while the container initializes, together with handler modules of their services; empty value disables the warm-up
+WARM_UP_CLIENTS = [service.strip() for service in os.environ.get('WARM_UP_CLIENTS', 'ec2,elbv2,ecs').split(',') if service.strip()]
+
+def warm_up(services: list = WARM_UP_CLIENTS, region: str = None) -> None:
+    """
+    Create pooled clients and import handler modules of services ahead of the first event
+
+    Args:
+        services (list, optional): boto3 service names, e.g. "elbv2"
+        region (str, optional): region of the clients; region of the function if None
+
+    Returns:
+        None
+    """
+    region = region or os.environ.get('AWS_REGION')
+    if not services or not region:
+        return
+    started = monotonic()
+    for service in services:
+        try:
+            client = client_pool.client(service, region)
+            # handler module is found by the event source of the service, e.g. elbv2 -> elasticloadbalancing.amazonaws.com
+            module = HANDLER_MODULES.get(f'{client.meta.service_model.endpoint_prefix}.amazonaws.com')
+            if module:
+                load_handler_module(module)
+
+        except Exception as error:
+            logger.warning(f'Warm-up of {service} failed: {str(error)}')
+    logger.info(f'Warmed up {", ".join(services)} in {region} in {monotonic() - started:.3f} seconds')
+
+def event_handler(eventsource: str, eventname: str):
+    """
+    Decorator registering function as a handler of CloudTrail event
+
+    Args:
+        eventsource (str): source of the event, e.g. "ec2.amazonaws.com"
+        eventname (str): name of the event, e.g. "RunInstances"
+
+    Returns:
+        decorator registering function in EVENT_HANDLERS
+    """
+    def register(function):
+        key = (eventsource, eventname)
+        if key in EVENT_HANDLERS:
+            raise ValueError(f'Handler for {eventname} ({eventsource}) is already registered: {EVENT_HANDLERS[key].__name__}')
+        # a handler living outside of the module of its event source would never be loaded
+        if function.__module__.startswith('handlers.') and HANDLER_MODULES.get(eventsource) != function.__module__:
+            raise ValueError(f'Handler {function.__name__} of {eventname} ({eventsource}) must live in {HANDLER_MODULES.get(eventsource)}')
+        EVENT_HANDLERS[key] = function
+        return function
+
+    return register
+
+def list_event_handlers() -> list:
+    """
+    List all event handlers, importing every handler module
+
+    Returns:
+        list: sorted list of (eventsource, eventname, handler name) tuples
+    """
+    for module in sorted(set(HANDLER_MODULES.values())):
+        load_handler_module(module)
+    return sorted((eventsource, eventname, function.__name__) for (eventsource, eventname), function in EVENT_HANDLERS.items())
+
+# tags format of a writer -> function building value of its tags parameter from tag key -> value dict
+TAG_FORMATS = {
+    'list': lambda tags: [{'Key': key, 'Value': value} for key, value in tags.items()],
+    'list_lower': lambda tags: [{'key': key, 'value': value} for key, value in tags.items()],
+    'list_tagkey': lambda tags: [{'TagKey': key, 'TagValue': value} for key, value in tags.items()],
+    'map': lambda tags: dict(tags),
+    'tagset': lambda tags: {'TagSet': [{'Key': key, 'Value': value} for key, value in tags.items()]},
+}
+
+# resource parameter of writers: a single id, or a list of ids (a single id is wrapped into a list)
+RESOURCE_FORMATS = {
+    'id': lambda resource: resource,
+    'ids': lambda resource: resource if isinstance(resource, list) else [resource],
+}
+
+# codes of errors of a tagging call retried while the resource of a rule with "wait" is not ready
+RULE_WAIT_ERRORS = ('ResourceInUseException', 'ResourceNotFoundException')
+
+# values every rule template may refer to besides fields of the rule
+RULE_VALUES = ('region', 'account', 'user', 'event_time', 'eventname')
+
+class TagRule:
+    """
+    TagRule Class compiling declarative tagging rule of tag_rules.py into an event handler
+    """
+
+    def __init__(self, name: str, rule: dict):
+        """
+        main __init__ function
+
+        Args:
+            name (str): name of the rule, used as the handler name
+            rule (dict): rule as described in tag_rules.py
+
+        Returns:
+            self
+        """
+        self.__name__ = name
+        self.events = [tuple(event) for event in rule['events']]
+        self.service, self.method = rule['writer'].split('.', 1)
+        self.resource_param, self.tags_param, tags_format, *resource_format = TAG_WRITERS[rule['writer']]
+        self.tags_format = TAG_FORMATS[tags_format]
+        self.resource_format = RESOURCE_FORMATS[resource_format[0] if resource_format else 'id']
+        self.wait = rule.get('wait', 0)
+        self.wait_errors = tuple(rule.get('wait_errors', RULE_WAIT_ERRORS))
+
+        known = set(RULE_VALUES)
+        self.fields = []
+        for field, source in rule['fields'].items():
+            if '{' in source:
+                self.fields.append((field, None, self.compile_template(source, known)))
+            else:
+                self.fields.append((field, self.compile_path(source), None))
+            known.add(field)
+        self.log = self.compile_template(rule['log'], known)
+        self.env = self.compile_template(rule['env'], known) if rule.get('env') else None
+        if self.env:
+            known.update(('env', 'department'))
+        resource = self.compile_template(rule['resource'], known)
+        self.params = [(self.resource_param, lambda values: self.resource_format(resource(values)))]
+        self.params += [(param, self.compile_template(template, known)) for param, template in rule.get('params', {}).items()]
+        self.tags = [(key, self.compile_template(template, known)) for key, template in rule['tags'].items()]
+
+    def compile_path(self, path: str):
+        """
+        Compile path of keys and list indices into a function taking the value from event details
+
+        Args:
+            path (str): e.g. "responseElements.hostedZone.id|split:/:2", a "*" step takes the rest of the path from every item of a list
+
+        Returns:
+            function: detail (dict) -> value, or list of values if the path has a "*" step
+        """
+        path, _, transform = path.partition('|')
+        steps = [int(step) if step.isdigit() else step for step in path.split('.')]
+        if transform and '*' in steps:
+            raise ValueError(f'Rule {self.__name__}: transform {transform} of a list of values')
+
+        def extract(detail: dict, steps: list = steps):
+            value = detail
+            for position, step in enumerate(steps):
+                if step == '*':
+                    return [extract(item, steps[position + 1:]) for item in value]
+                value = value[step]
+            return value
+
+        if not transform:
+            return extract
+        # separator may be a colon itself, so it is whatever lies between the operation and the index
+        operation, _, arguments = transform.partition(':')
+        separator, _, index = arguments.rpartition(':')
+        if operation != 'split':
+            raise ValueError(f'Rule {self.__name__}: unknown transform {transform}')
+        index = int(index)
+        return lambda detail: extract(detail).split(separator)[index]
+
+    def compile_template(self, template: str, known: set):
+        """
+        Compile template into a function of values, checking that it refers only to known values
+
+        Args:
+            template (str): str.format template
+            known (set): names of values available to the template
+
+        Returns:
+            function: values (dict) -> str, or the value itself if template is a single {value}
+        """
+        names = [name for _, name, _, _ in Formatter().parse(template) if name is not None]
+        unknown = set(names) - known
+        if unknown:
+            raise ValueError(f'Rule {self.__name__}: template {template} refers to unknown values {", ".join(sorted(unknown))}')
+        if not names:
+            text = template.format()
+            return lambda values: text
+        if template == '{' + names[0] + '}':
+            return lambda values: values[names[0]]
+        return template.format_map
+
+    def __call__(self, context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+        """Processing of event matching the rule"""
+        # Create boto3 client/resource connection
+        client = client_pool.client(self.service, region)
+        try:
+            # get values required for tagging from event details
+            values = {'region': region, 'account': aws_account_id, 'user': user, 'event_time': event_time, 'eventname': eventname}
+            for field, extract, template in self.fields:
+                values[field] = extract(detail) if extract else template(values)
+            logger.info(self.log(values))
+
+            if self.env:
+                # initiliaze TagEvaluator to determine Env and Department tags
+                tagevaluator = TagEvaluator()
+                values['env'], values['department'] = tagevaluator.evaluate_env_and_dep_tags(self.env(values))
+
+            # apply all tags of the resource in one call
+            params = {param: template(values) for param, template in self.params}
+            params[self.tags_param] = self.tags_format({key: str(template(values)) for key, template in self.tags})
+            tagging = lambda: getattr(client, self.method)(**params) or True
+            if self.wait and wait_until(tagging, self.wait, f'tagging of {params[self.resource_param]}', retry_errors=self.wait_errors).ready:
+                return True
+            # without wait, or once the wait is over, the call raises the error itself
+            tagging()
+
+        except Exception as error:
+            finishing_sequence(context, eventname, status='fail', error=error)
+            return False
+
+        return True
+
+def register_tag_rules(rules: dict) -> list:
+    """
+    Compile tagging rules and register them in EVENT_HANDLERS
+
+    Args:
+        rules (dict): rule name -> rule, see tag_rules.py
+
+    Returns:
+        list: compiled TagRule objects
+    """
+    compiled = []
+    for name, rule in rules.items():
+        tag_rule = TagRule(name, rule)
+        for eventsource, eventname in tag_rule.events:
+            event_handler(eventsource, eventname)(tag_rule)
+        compiled.append(tag_rule)
+    return compiled
+
+# rules are compiled once per cold start, invalid rules fail the import instead of an event
+tag_rules = register_tag_rules(TAG_RULES)
+
+# Registry of deferred re-check handlers keyed by kind of work item
+RECHECK_HANDLERS = {}
+
+def recheck_handler(kind: str):
+    """
+    Decorator registering function as a handler of deferred re-check work item
+
+    Args:
+        kind (str): kind of work item, e.g. "ec2_instance_tags"
+
+    Returns:
+        decorator registering function in RECHECK_HANDLERS
+    """
+    def register(function):
+        if kind in RECHECK_HANDLERS:
+            raise ValueError(f'Recheck handler for {kind} is already registered: {RECHECK_HANDLERS[kind].__name__}')
+        if function.__module__.startswith('handlers.') and RECHECK_MODULES.get(kind) != function.__module__:
+            raise ValueError(f'Recheck handler {function.__name__} of {kind} must live in {RECHECK_MODULES.get(kind)}')
+        RECHECK_HANDLERS[kind] = function
+        return function
+
+    return register
+
+def process_recheck(item: dict) -> bool:
+    """
+    Process deferred re-check work item
+
+    Args:
+        item (dict): work item created by defer_recheck
+
+    Returns:
+        bool: True or False
+    """
+    if item.get('recheck') in RECHECK_MODULES:
+        load_handler_module(RECHECK_MODULES[item['recheck']])
+    handler = RECHECK_HANDLERS.get(item.get('recheck'))
+    if handler is None:
+        logger.warning(f'No matching recheck handler found: {str(item.get("recheck"))}')
+        return False
+    logger.info(f'Re-checking {item["recheck"]} of {item["resource_id"]} in {item["region"]} (attempt {item["attempt"]} of {RECHECK_MAX_ATTEMPTS})')
+    started = monotonic()
+    waits = len(wait_log)
+    processed = False
+    try:
+        processed = handler(item) is True
+
+    except Exception as error:
+        logger.error(f'Error message: {str(error)}')
+        logger.exception(f'Exception thrown at {item["recheck"]} re-check: ')
+
+    metrics.emit(f'Recheck:{item["recheck"]}', monotonic() - started, wait_log[waits:], processed)
+    return processed
+
+
+# max number of values of a describe filter
+FILTER_MAX_VALUES = 200
+
+def event_resource_ids(detail: dict) -> dict:
+    """
+    Find ids of instances and ENI's referenced by CloudTrail event
+
+    Args:
+        detail (dict): event details
+
+    Returns:
+        dict: "instances" and "interfaces" lists of ids
+    """
+    ids = {'instances': [], 'interfaces': []}
+    for section in (detail.get('requestParameters'), detail.get('responseElements')):
+        if not isinstance(section, dict):
+            continue
+        items = (section.get('instancesSet') or {}).get('items') or []
+        if isinstance(section.get('instances'), list):
+            items = items + section['instances']
+        ids['instances'] += [item['instanceId'] for item in items if isinstance(item, dict) and str(item.get('instanceId')).startswith('i-')]
+        if str(section.get('instanceId')).startswith('i-'):
+            ids['instances'].append(section['instanceId'])
+        interface = section.get('networkInterface') if isinstance(section.get('networkInterface'), dict) else section
+        if str(interface.get('networkInterfaceId')).startswith('eni-'):
+            ids['interfaces'].append(interface['networkInterfaceId'])
+    return ids
+
+def prefetch_event_resources(events: list) -> None:
+    """
+    Describe instances and ENI's of a batch of events with one filtered call per FILTER_MAX_VALUES ids of a region and resource type
+    and share results with handlers through instance_cache and interface_cache
+
+    Args:
+        events (list): CloudTrail events
+
+    Returns:
+        None
+    """
+    groups = {}
+    for event in events:
+        try:
+            for kind, ids in event_resource_ids(event['detail']).items():
+                groups.setdefault((event['region'], kind), set()).update(ids)
+        except (KeyError, TypeError, AttributeError):
+            continue
+
+    for (region, kind), ids in groups.items():
+        cache = instance_cache if kind == 'instances' else interface_cache
+        # nothing to share if cache is disabled
+        if not ids or cache.ttl <= 0:
+            continue
+        ec2_client = client_pool.client('ec2', region)
+        ids = sorted(ids)
+        for start in range(0, len(ids), FILTER_MAX_VALUES):
+            chunk = ids[start:start + FILTER_MAX_VALUES]
+            logger.info(f'Prefetching {len(chunk)} {kind} in {region}')
+            # filters do not fail on ids which are not visible yet, unlike InstanceIds/NetworkInterfaceIds;
+            # such resources are described by their handlers
+            try:
+                if kind == 'instances':
+                    for page in ec2_client.get_paginator('describe_instances').paginate(Filters=[{'Name': 'instance-id', 'Values': chunk}]):
+                        for reservation in page['Reservations']:
+                            for instance in reservation['Instances']:
+                                cache.put(instance['InstanceId'], {'Reservations': [dict(reservation, Instances=[instance])]})
+                else:
+                    for page in ec2_client.get_paginator('describe_network_interfaces').paginate(Filters=[{'Name': 'network-interface-id', 'Values': chunk}]):
+                        for interface in page['NetworkInterfaces']:
+                            cache.put(interface['NetworkInterfaceId'], {'NetworkInterfaces': [interface]})
+            except ClientError as error:
+                logger.info(f'Prefetching {kind} in {region} skipped: {str(error)}')
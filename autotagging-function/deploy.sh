@@ -72,15 +72,20 @@ function verify_validate_zip {
       fi
     done
 
-    pyflakes main.py
+    pyflakes main.py core.py env_classifier.py event_patterns.py resource_graph.py sweep.py tag_rules.py handlers/*.py
+    # event rules of the template have to match registered handlers
+    if ! python event_patterns.py --check; then
+        log_error "Event rules of the template are out of date"
+        exit 1
+    fi
     aws cloudformation validate-template --template-body file://autotagging-template.cfn.yaml 2>&1 > /dev/null
-    zip code-${BITBUCKET_COMMIT}.zip main.py
+    zip code-${BITBUCKET_COMMIT}.zip main.py core.py env_classifier.py resource_graph.py sweep.py tag_rules.py handlers/*.py
 }
 
 # Declare function which will run the function locally using python-lambda-local and event.json imitating an event invocation and processing
 function python_lambda_local_test {
     
-    for file in event.json main.py
+    for file in event.json main.py core.py env_classifier.py resource_graph.py sweep.py tag_rules.py handlers/__init__.py
     do 
         if ! [[ -f ${file} ]]; then 
             log_error "${file} could not be found"
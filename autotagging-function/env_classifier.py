@@ -0,0 +1,136 @@
+################################################################################
+##    FILE:  	env_classifier.py (autotagging-function)                      ##
+##                                                                            ##
+##    NOTES: 	Contains precompiled classifier evaluating Env and Department ##
+##              tags from resource names                                      ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import re
+from functools import lru_cache
+
+# Env keywords searched in resource names; the first keyword of the list found anywhere in a name wins
+ENV_KEYWORDS = ('function', 'qa', 'ops', 'prd', 'prodtest', 'uat', 'dev', 'tst', 'demo', 'imp', 'test', 'performance', 'training', 'prod', 'ia', 'base', 'pince', 'sim', 'ins', 'trn')
+
+# keywords which are synonyms of another Env tag
+ENV_SYNONYMS = {
+    'imp': 'uat',
+    'performance': 'uat',
+    'test': 'dev',
+    'pince': 'dev',
+    'training': 'trn',
+    'prod': 'prd',
+    'production': 'prd',
+    'ia': 'ins',
+    'base': 'ops',
+    'function': 'ops',
+}
+
+# Department tag of every Env tag
+ENV_DEPARTMENTS = {
+    'dev': 'Development',
+    'demo': 'Development',
+    'ins': 'Development',
+    'tst': 'Development',
+    'trn': 'Development',
+    'qa': 'Operations',
+    'ops': 'Operations',
+    'prd': 'Production',
+    'prodtest': 'Production',
+    'uat': 'Production',
+    'sim': 'Production',
+}
+
+# Env tag of names without any keyword
+DEFAULT_ENV_TAG = 'ops'
+
+class EnvClassifier:
+    """
+    EnvClassifier Class matching all Env keywords with a single precompiled regex and memoizing results per name
+    """
+
+    def __init__(self, keywords: tuple = ENV_KEYWORDS, synonyms: dict = ENV_SYNONYMS, departments: dict = ENV_DEPARTMENTS, default: str = DEFAULT_ENV_TAG, cache_size: int = 1024):
+        """
+        main __init__ function
+
+        Args:
+            keywords (tuple, optional): Env keywords in order of priority
+            synonyms (dict, optional): keyword -> Env tag it stands for
+            departments (dict, optional): Env tag -> Department tag
+            default (str, optional): Env tag of names without any keyword
+            cache_size (int, optional): number of memoized names
+
+        Returns:
+            self
+        """
+        # duplicates are dropped, the first occurrence keeps its priority
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self.synonyms = dict(synonyms)
+        self.departments = dict(departments)
+        self.default = default
+        self.priority = {keyword: index for index, keyword in enumerate(self.keywords)}
+        # zero-width lookahead reports a keyword at every position, so overlapping keywords are not skipped;
+        # where several keywords start at the same position, alternation picks the one with the highest priority
+        self.pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in self.keywords) + '))')
+        self.env_tag = lru_cache(maxsize=cache_size)(self.match_env_tag)
+
+    def match_env_tag(self, name: str) -> str:
+        """
+        Evaluate Env tag of a name without memoization
+
+        Args:
+            name (str): resource name
+
+        Returns:
+            str: Env tag
+        """
+        keyword = None
+        for match in self.pattern.finditer(name.lower()):
+            if keyword is None or self.priority[match.group(1)] < self.priority[keyword]:
+                keyword = match.group(1)
+                # nothing can beat the first keyword of the list
+                if self.priority[keyword] == 0:
+                    break
+        if keyword is None:
+            return self.default
+        return self.synonyms.get(keyword, keyword)
+
+    def department_tag(self, env_tag: str) -> str:
+        """
+        Evaluate Department tag of Env tag
+
+        Args:
+            env_tag (str): Env tag
+
+        Returns:
+            str: Department tag or None if Env tag is unknown
+        """
+        return self.departments.get(env_tag)
+
+    def classify(self, name: str) -> tuple:
+        """
+        Evaluate Env and Department tags of a name
+
+        Args:
+            name (str): resource name
+
+        Returns:
+            tuple: env_tag, dep_tag
+        """
+        env_tag = self.env_tag(name)
+        return env_tag, self.department_tag(env_tag)
+
+    def cache_info(self):
+        """
+        Statistics of memoized names
+
+        Returns:
+            functools._CacheInfo: hits, misses, maxsize, currsize
+        """
+        return self.env_tag.cache_info()
+
+# classifier shared by all callers living as long as the warm Lambda container
+env_classifier = EnvClassifier()
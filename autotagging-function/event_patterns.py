@@ -0,0 +1,243 @@
+################################################################################
+##    FILE:  	event_patterns.py (autotagging-function)                      ##
+##                                                                            ##
+##    NOTES: 	Generates EventBridge rules of the function from registered   ##
+##              event handlers into autotagging-template.cfn.yaml and checks  ##
+##              the template for drift from the handlers                      ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import yaml
+
+FUNCTION_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE = os.path.join(FUNCTION_DIR, 'autotagging-template.cfn.yaml')
+
+# function of the template invoked by the rules
+FUNCTION_RESOURCE = 'FunctionAutoTagOregon'
+# lines enclosing generated rules in Events of the function
+BEGIN_MARKER = '        # BEGIN event rules generated by event_patterns.py from registered handlers, do not edit'
+END_MARKER = '        # END event rules generated by event_patterns.py'
+# max size of a rule pattern serialized as compact JSON, characters; sources are spread over as many rules as needed
+MAX_PATTERN_SIZE = 2048
+# prefix of logical ids of generated rules
+RULE_PREFIX = 'AutoTagTrigger'
+
+def handled_events() -> dict:
+    """
+    Collect events of all registered handlers and tagging rules
+
+    Returns:
+        dict: event source -> sorted list of event names
+    """
+    # handlers are only listed, no clients are created
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ['WARM_UP_CLIENTS'] = ''
+    sys.path.insert(0, FUNCTION_DIR)
+    import core
+
+    events = {}
+    for eventsource, eventname, _ in core.list_event_handlers():
+        events.setdefault(eventsource, []).append(eventname)
+    return events
+
+def event_pattern(sources: list) -> dict:
+    """
+    EventBridge pattern matching exactly the given events of successful CloudTrail API calls
+
+    Args:
+        sources (list): (event source, list of event names) pairs
+
+    Returns:
+        dict: event pattern
+    """
+    branches = [{'eventSource': [eventsource], 'eventName': eventnames} for eventsource, eventnames in sources]
+    detail = {'errorCode': [{'exists': False}]}
+    if len(branches) == 1:
+        detail.update(branches[0])
+    else:
+        detail['$or'] = branches
+    return {'detail-type': ['AWS API Call via CloudTrail'], 'detail': detail}
+
+def pattern_size(sources: list) -> int:
+    return len(json.dumps(event_pattern(sources), separators=(',', ':')))
+
+def build_patterns(events: dict, max_size: int = MAX_PATTERN_SIZE) -> list:
+    """
+    Spread handled events over as few patterns as fit in max_size, keeping event sources in order
+
+    Args:
+        events (dict): event source -> list of event names
+        max_size (int, optional): max size of a pattern
+
+    Returns:
+        list: event patterns
+    """
+    # names of a source which alone does not fit in a pattern are split into several branches
+    pieces = []
+    for eventsource in sorted(events):
+        piece = []
+        for eventname in sorted(events[eventsource]):
+            if piece and pattern_size([(eventsource, piece + [eventname])]) > max_size:
+                pieces.append((eventsource, piece))
+                piece = []
+            piece.append(eventname)
+        pieces.append((eventsource, piece))
+
+    patterns = []
+    sources = []
+    for piece in pieces:
+        if sources and pattern_size(sources + [piece]) > max_size:
+            patterns.append(event_pattern(sources))
+            sources = []
+        sources.append(piece)
+    if sources:
+        patterns.append(event_pattern(sources))
+    return patterns
+
+def render_yaml(value, indent: int) -> list:
+    """
+    Render pattern value as block YAML in the style of the template: list items at the indent of their key
+
+    Args:
+        value: dict, list or scalar
+        indent (int): indent of the value
+
+    Returns:
+        list: lines
+    """
+    lines = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                lines.append(f'{" " * indent}{key}:')
+                lines.extend(render_yaml(item, indent if isinstance(item, list) else indent + 2))
+            else:
+                lines.append(f'{" " * indent}{key}: {json.dumps(item)}')
+    else:
+        for item in value:
+            item_lines = render_yaml(item, indent + 2) if isinstance(item, (dict, list)) else [f'{" " * (indent + 2)}{item}']
+            # first line of the item carries the dash
+            lines.append(f'{" " * indent}- {item_lines[0].lstrip()}')
+            lines.extend(item_lines[1:])
+    return lines
+
+def render_rules(patterns: list) -> str:
+    """
+    Render generated rules as Events entries of the function, enclosed in markers
+
+    Args:
+        patterns (list): event patterns
+
+    Returns:
+        str: YAML text
+    """
+    lines = [BEGIN_MARKER]
+    for number, pattern in enumerate(patterns, start=1):
+        lines.append(f'        {RULE_PREFIX}{number}:')
+        lines.append('          Type: CloudWatchEvent')
+        lines.append('          Properties:')
+        lines.append('            Pattern:')
+        lines.extend(render_yaml(pattern, 14))
+        lines.append('')
+    lines[-1] = END_MARKER
+    return '\n'.join(lines) + '\n'
+
+def split_template(text: str) -> tuple:
+    """
+    Split template into text before generated rules, generated rules and text after them
+
+    Args:
+        text (str): template
+
+    Returns:
+        tuple: head, rules, tail
+    """
+    begin = text.find(BEGIN_MARKER + '\n')
+    end = text.find(END_MARKER + '\n')
+    if begin < 0 or end < begin:
+        raise ValueError(f'{TEMPLATE} has no generated rules enclosed in markers')
+    end += len(END_MARKER) + 1
+    return text[:begin], text[begin:end], text[end:]
+
+def routed_events(text: str) -> set:
+    """
+    Events invoking the function according to the template
+
+    Args:
+        text (str): template
+
+    Returns:
+        set: (event source, event name) pairs matched by CloudWatchEvent rules of the function
+    """
+    class TemplateLoader(yaml.SafeLoader):
+        pass
+    # intrinsic functions do not matter here
+    TemplateLoader.add_multi_constructor('!', lambda loader, suffix, node: None)
+
+    template = yaml.load(text, Loader=TemplateLoader)
+    routed = set()
+    for rule in template['Resources'][FUNCTION_RESOURCE]['Properties']['Events'].values():
+        if rule['Type'] not in ('CloudWatchEvent', 'EventBridgeRule'):
+            continue
+        detail = rule['Properties']['Pattern'].get('detail', {})
+        for branch in detail.get('$or', [detail]):
+            routed.update(itertools.product(branch.get('eventSource', []), branch.get('eventName', [])))
+    return routed
+
+def check_drift(text: str, events: dict) -> list:
+    """
+    Compare events routed by the template with registered handlers
+
+    Args:
+        text (str): template
+        events (dict): event source -> list of event names
+
+    Returns:
+        list: descriptions of differences; empty if the template is up to date
+    """
+    handled = {(eventsource, eventname) for eventsource, eventnames in events.items() for eventname in eventnames}
+    routed = routed_events(text)
+    problems = [f'handled, but never invoking the function: {eventname} ({eventsource})' for eventsource, eventname in sorted(handled - routed)]
+    problems += [f'invoking the function without a handler: {eventname} ({eventsource})' for eventsource, eventname in sorted(routed - handled)]
+    try:
+        if split_template(text)[1] != render_rules(build_patterns(events)):
+            problems.append('generated rules differ from output of event_patterns.py')
+
+    except ValueError as error:
+        problems.append(str(error))
+    return problems
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Generate EventBridge rules of the autotagging function from registered handlers')
+    parser.add_argument('--check', action='store_true', help='only report drift between the template and handlers, exit with 1 on drift')
+    args = parser.parse_args()
+
+    events = handled_events()
+    with open(TEMPLATE) as template_file:
+        text = template_file.read()
+
+    if args.check:
+        problems = check_drift(text, events)
+        for problem in problems:
+            print(problem)
+        print(f'{TEMPLATE} is {"out of date, run event_patterns.py" if problems else "up to date"}')
+        return 1 if problems else 0
+
+    head, _, tail = split_template(text)
+    patterns = build_patterns(events)
+    # template keeps its CRLF line endings
+    with open(TEMPLATE, 'w', newline='\r\n') as template_file:
+        template_file.write(head + render_rules(patterns) + tail)
+    print(f'{len(patterns)} rules of {sum(map(len, events.values()))} events of {len(events)} sources written to {TEMPLATE}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
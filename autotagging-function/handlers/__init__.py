@@ -0,0 +1,11 @@
+################################################################################
+##    FILE:  	handlers/__init__.py (autotagging-function)                   ##
+##                                                                            ##
+##    NOTES: 	Package of handler modules, every module is imported by       ##
+##              core.find_event_handler on the first event of its service     ##
+##              (see HANDLER_MODULES in core.py)                              ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
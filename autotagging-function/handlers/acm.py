@@ -0,0 +1,100 @@
+################################################################################
+##    FILE:  	handlers/acm.py (autotagging-function)                        ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of AWS ACM (certificate manager) events     ##
+##              loaded on the first event of the service                      ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import re
+from core import client_pool, event_handler, finishing_sequence, logger, wait_until
+
+# AWS ACM (certificate manager) events
+@event_handler('acm.amazonaws.com', 'ImportCertificate')
+def acm_import_certificate(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of ImportCertificate event"""
+    # Create boto3 client/resource connection    
+    acm_client = client_pool.client('acm', region)
+    try:
+        # get values required for tagging from event details
+        certificate_arn = detail['responseElements']['certificateArn']
+        logger.info(f'Tagging ACM imported certificate: {str(certificate_arn)}')
+        
+        # apply tags using acm_client               
+        acm_client.add_tags_to_certificate(CertificateArn=certificate_arn, 
+                            Tags=[
+                                {'Key': 'ImportedBy', 'Value': user},
+                                {'Key': 'ImportedBy', 'Value': event_time}
+                                ]
+                            )
+        
+        # wait up to 60 seconds to get certificate details
+        domain_name = wait_until(lambda: acm_client.describe_certificate(CertificateArn=certificate_arn)['Certificate'].get('DomainName'),
+                                 60, f'details of certificate {certificate_arn}').value
+        
+        # remove wildcard from Name tag and assing certificate Name tag
+        if re.search('\*', domain_name):
+            domain_name = '.'.join(domain_name.split('.')[1:3])
+            certificate_name = region + ':wildcard:' + domain_name
+        else:
+            certificate_name = region + ':' + domain_name
+        
+        logger.info(f'ACM Name tag: {str(certificate_name)}')
+        
+        # apply tags using acm_client   
+        acm_client.add_tags_to_certificate(CertificateArn=certificate_arn, 
+                            Tags=[{'Key': 'Name', 'Value': certificate_name}])
+                        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('acm.amazonaws.com', 'RequestCertificate')
+def acm_request_certificate(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of RequestCertificate event"""
+    # Create boto3 client/resource connection    
+    acm_client = client_pool.client('acm', region)
+    try:            
+        certificate_arn = detail['responseElements']['certificateArn']
+        domain_name = detail['requestParameters']['domainName']
+        
+        # get all alternative domain name into one list
+        if 'subjectAlternativeNames' in detail['requestParameters']:
+            domain_names = []
+            domain_names.append(domain_name)
+            for alter_name in detail['requestParameters']['subjectAlternativeNames']:
+                domain_names.append(alter_name)
+            
+            logger.info(f'Tagging ACM requested certificate: {str(certificate_arn)} (domain names: {domain_names})')
+        
+        # if no alternative domain names found, proceed further
+        elif 'subjectAlternativeNames' not in detail['requestParameters']:
+            logger.info(f'Tagging ACM requested certificate: {str(certificate_arn)} (domain name: {domain_name})')
+        
+        # remove wildcard from Name tag and assing certificate Name tag
+        if re.search('\*', domain_name):
+            domain_name = '.'.join(domain_name.split('.')[1:3])
+            certificate_name = region + ':wildcard:' + domain_name
+        else:
+            certificate_name = region + ':' + domain_name
+        
+        logger.info(f'ACM Name tag: {str(certificate_name)}')
+        
+        # apply tags using acm_client
+        acm_client.add_tags_to_certificate(CertificateArn=certificate_arn, 
+                            Tags=[
+                                {'Key': 'RequestedBy', 'Value': user},
+                                {'Key': 'RequestedAt', 'Value': event_time},
+                                {'Key': 'Name', 'Value': certificate_name}
+                                  ])
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
@@ -0,0 +1,169 @@
+################################################################################
+##    FILE:  	handlers/apigateway.py (autotagging-function)                 ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of API Gateway events loaded on the first   ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import re
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# API Gateway events
+@event_handler('apigateway.amazonaws.com', 'CreateRestApi')
+def apigateway_create_rest_api(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateRestApi event"""
+    # Create boto3 client/resource connection
+    apigw_client = client_pool.client('apigateway', region)        
+    try:
+        # get values required for tagging from event details
+        api_name = detail['responseElements']['name']
+        api_id = detail['responseElements']['id']
+        api_type = "REST"
+        # retrieve arn using aws arn convention
+        api_arn = f'arn:aws:apigateway:{region}::/restapis/{api_id}'
+        logger.info(f'Tagging new REST API: {str(api_name)} (type: {str(api_type)})')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(api_name)
+        
+        # use lambda-python function to apply tags using apigw_client
+        tagging = lambda key, value: apigw_client.tag_resource(resourceArn=api_arn, tags={key: value})
+        
+        tagging('Name', api_name)
+        tagging('Protocol', api_type)
+        tagging('Env', env_tag)
+        tagging('Department', dep_tag)
+        tagging('CreatedBy', user)
+        tagging('CreatedAt', event_time)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('apigateway.amazonaws.com', 'UpdateRestApi')
+def apigateway_update_rest_api(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdateRestApi event"""
+    # Create boto3 client/resource connection
+    apigw_client = client_pool.client('apigateway', region)        
+    try:
+        # get values required for tagging from event details
+        api_name = detail['responseElements']['name']
+        api_id = detail['responseElements']['id']
+        api_type = "REST"
+        # retrieve arn using aws arn convention
+        api_arn = f'arn:aws:apigateway:{region}::/restapis/{api_id}'
+        logger.info(f'Tagging updated REST API: {str(api_name)} (type: {str(api_type)})')
+        
+        # use lambda-python function to apply tags using apigw_client
+        tagging = lambda key, value: apigw_client.tag_resource(resourceArn=api_arn, tags={key: value})
+        
+        tagging('LastUpdatedBy', user)
+        tagging('LastUpdatedAt', event_time)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('apigateway.amazonaws.com', 'CreateStage')
+def apigateway_create_stage(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateStage event"""
+    try:
+        # check if stage is related to REST API or not
+        if 'restApiId' in detail['requestParameters']:
+            # Create boto3 client/resource connection
+            apigw_client = client_pool.client('apigateway', region)
+            
+            # get values required for tagging from event details
+            api_stage_name = detail['responseElements']['stageName'] 
+            api_id = detail['requestParameters']['restApiId']
+            # retrieve arn using aws arn convention
+            api_stage_arn = f'arn:aws:apigateway:{region}::/restapis/{api_id}/stages/{api_stage_name}'
+            logger.info(f'Tagging new REST API stage: {str(api_stage_name)} (API ID: {str(api_id)})')
+            
+            # use lambda-python function to apply tags using apigw_client
+            tagging = lambda key, value: apigw_client.tag_resource(resourceArn=api_stage_arn, tags={key: value})
+            
+        elif 'restApiId' not in detail['requestParameters']:
+            # Create boto3 client/resource connection
+            apigw_client = client_pool.client('apigatewayv2', region)
+            
+            # get values required for tagging from event details
+            api_stage_name = detail['responseElements']['stageName']
+            api_id = detail['requestParameters']['apiId']
+            # retrieve arn using aws arn convention
+            api_stage_arn = f'arn:aws:apigateway:{region}::/apis/{api_id}/stages/{api_stage_name}'
+            logger.info(f'Tagging new HTTP API stage: {str(api_stage_name)} (API ID: {str(api_id)})')
+            
+            # use lambda-python function to apply tags using apigw_client
+            tagging = lambda key, value: apigw_client.tag_resource(ResourceArn=api_stage_arn, Tags={key: value})
+        
+        else:
+            logger.error('Cannot determine API type')
+            finishing_sequence(context, eventname, status='fail', error='Cannot determine API type', exception=False)
+            return False
+        
+        if tagging:
+            # remove $ sign from 'default' stage
+            if re.search('\$', api_stage_name): api_stage_name = "default"             
+            tagging('Name', api_stage_name)
+            tagging('API Id', api_id)
+            tagging('CreatedBy', user)
+            tagging('CreatedAt', event_time)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('apigateway.amazonaws.com', 'UpdateStage')
+def apigateway_update_stage(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdateStage event"""
+    try:
+        # check if Stage is related to REST API or not
+        if 'restApiId' in detail['requestParameters']:
+            # Create boto3 client/resource connection
+            apigw_client = client_pool.client('apigateway', region)
+            
+            # get values required for tagging from event details
+            api_stage_name = detail['responseElements']['stageName']
+            api_id = detail['requestParameters']['restApiId']
+            # retrieve arn using aws arn convention
+            api_stage_arn = f'arn:aws:apigateway:{region}::/restapis/{api_id}/stages/{api_stage_name}'
+            logger.info(f'Tagging updated REST API stage: {str(api_stage_name)} (API ID: {str(api_id)})')
+            
+            # use lambda-python function to apply tags using apigw_client
+            tagging = lambda key, value: apigw_client.tag_resource(resourceArn=api_stage_arn, tags={key: value})
+            
+        elif 'restApiId' not in detail['requestParameters']:
+            # Create boto3 client/resource connection
+            apigw_client = client_pool.client('apigatewayv2', region)    
+            
+            # get values required for tagging from event details
+            api_stage_name = detail['responseElements']['stageName']
+            api_id = detail['requestParameters']['apiId']
+            # retrieve arn using aws arn convention
+            api_stage_arn = f'arn:aws:apigateway:{region}::/apis/{api_id}/stages/{api_stage_name}'
+            logger.info(f'Tagging updated HTTP API stage: {str(api_stage_name)} (API ID: {str(api_id)})')
+        
+            # use lambda-python function to apply tags using apigw_client
+            tagging = lambda key, value: apigw_client.tag_resource(ResourceArn=api_stage_arn, Tags={key: value})
+        
+        if tagging:
+            tagging('LastUpdatedBy', user)
+            tagging('LastUpdatedAt', event_time)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
@@ -0,0 +1,123 @@
+################################################################################
+##    FILE:  	handlers/autoscaling.py (autotagging-function)                ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of ASG events loaded on the first event of  ##
+##              the service                                                   ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, TagSet, client_pool, event_handler, finishing_sequence, logger
+
+# ASG events
+@event_handler('autoscaling.amazonaws.com', 'CreateAutoScalingGroup')
+def autoscaling_create_auto_scaling_group(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateAutoScalingGroup event"""
+    # Create boto3 client/resource connection
+    asg_client = client_pool.client('autoscaling', region)
+    try:
+        # get values required for tagging from event details
+        asg_name = detail['requestParameters']['autoScalingGroupName']
+        logger.info(f'Tagging ASG: {str(asg_name)}')
+        # create owner tags
+        owner_tags = [
+            {
+            'Key': 'CreatedBy',
+            'PropagateAtLaunch': True,
+            'ResourceId': asg_name,
+            'ResourceType': 'auto-scaling-group',
+            'Value': user,
+            },
+            {
+            'Key': 'CreatedAt',
+            'PropagateAtLaunch': True,
+            'ResourceId': asg_name,
+            'ResourceType': 'auto-scaling-group',
+            'Value': event_time,
+            }
+            ]
+        # apply tags using asg_client
+        asg_client.create_or_update_tags(Tags=owner_tags)
+        
+        # check if there are any existing tags in ASG
+        if 'tags' in detail['requestParameters']:
+            # get tags
+            asg_tags = TagSet(detail['requestParameters']['tags'])
+            # apply tag for elasticbeanstalk ASG
+            if 'elasticbeanstalk:environment-name' in asg_tags:
+                logger.info(f'Tagging Beanstalk ASG: {str(asg_name)}')
+                logger.info('Department tag: Beanstalk')
+                # create Department tag
+                department_tag = [{
+                        'Key': 'Department',
+                        'PropagateAtLaunch': True,
+                        'ResourceId': asg_name,
+                        'ResourceType': 'auto-scaling-group',
+                        'Value': 'Beanstalk',
+                        }]
+                # apply tags using asg_client
+                asg_client.create_or_update_tags(Tags=department_tag)
+            
+            # apply tags for EKS ASG
+            elif 'eks:cluster-name' in asg_tags:
+                eks_cluster_name = asg_tags["eks:cluster-name"]
+                logger.info(f'Tagging EKS ASG: {str(asg_name)}')
+                
+                # initiliaze TagEvaluator to determine Env and Department tags
+                tagevaluator = TagEvaluator()
+                env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(eks_cluster_name)
+                
+                # create Env/Dep tags
+                env_dep_tags = [
+                    {
+                        'Key': 'Env',
+                        'PropagateAtLaunch': True,
+                        'ResourceId': asg_name,
+                        'ResourceType': 'auto-scaling-group',
+                        'Value': env_tag,
+                    },
+                    {
+                        'Key': 'Department',
+                        'PropagateAtLaunch': True,
+                        'ResourceId': asg_name,
+                        'ResourceType': 'auto-scaling-group',
+                        'Value': dep_tag,
+                    }
+                       ]
+                asg_client.create_or_update_tags(Tags=env_dep_tags)
+            
+            # apply tags for standard (EC2) ASG
+            elif 'eks:cluster-name' not in asg_tags and 'elasticbeanstalk:environment-name' not in asg_tags:
+                logger.info(f'Tagging standard ASG: {str(asg_name)}')
+                
+                # initiliaze TagEvaluator to determine Env and Department tags
+                tagevaluator = TagEvaluator()
+                env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(asg_name)
+                
+                # create Env/Dep tags
+                env_dep_tags = [
+                    {
+                        'Key': 'Env',
+                        'PropagateAtLaunch': True,
+                        'ResourceId': asg_name,
+                        'ResourceType': 'auto-scaling-group',
+                        'Value': env_tag,
+                    },
+                    {
+                        'Key': 'Department',
+                        'PropagateAtLaunch': True,
+                        'ResourceId': asg_name,
+                        'ResourceType': 'auto-scaling-group',
+                        'Value': dep_tag,
+                    }
+                       ]
+                # apply tags using asg_client
+                asg_client.create_or_update_tags(Tags=env_dep_tags)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
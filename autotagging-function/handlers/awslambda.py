@@ -0,0 +1,47 @@
+################################################################################
+##    FILE:  	handlers/awslambda.py (autotagging-function)                  ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of AWS Lambda events loaded on the first    ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger, test_event
+
+# AWS Lambda events
+@event_handler('lambda.amazonaws.com', 'CreateFunction20150331')
+def lambda_create_function(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateFunction20150331 event"""
+    # process test event sent by bitbucket pipelines
+    if detailtype == "TestEvent":
+        return test_event(detail, user, region, event_time) is True
+
+    # Create boto3 client/resource connection
+    lambda_client = client_pool.client('lambda', region)
+    try:
+        # get values required for tagging from event details
+        function_arn = detail['responseElements']['functionArn']
+        function_name = detail['responseElements']['functionName']
+        logger.info(f'Tagging new lambda function: {str(function_name)}')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(function_name)
+        
+        # use lambda-python function to apply tags using lambda_client
+        tagging = lambda key, value: lambda_client.tag_resource(Resource=function_arn, Tags={key: value})
+        
+        tagging('Name', function_name)
+        tagging('CreatedBy', user)
+        tagging('CreatedAt', event_time)
+        tagging('Env', env_tag)
+        tagging('Department', dep_tag)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
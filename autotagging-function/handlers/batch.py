@@ -0,0 +1,70 @@
+################################################################################
+##    FILE:  	handlers/batch.py (autotagging-function)                      ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of Batch events loaded on the first event   ##
+##              of the service                                                ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# Batch events
+@event_handler('batch.amazonaws.com', 'RegisterJobDefinition')
+def batch_register_job_definition(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of RegisterJobDefinition event"""
+    # Create boto3 client/resource connection
+    batch_client = client_pool.client('batch', region)
+    try:
+        # get values required for tagging from event details
+        batch_job_definition_name = detail['responseElements']['jobDefinitionName']
+        batch_job_definition_arn = detail['responseElements']['jobDefinitionArn']
+        batch_job_definition_type = [type for type in detail['requestParameters']['platformCapabilities']][0]
+        logger.info(f'Tagging new batch job definition: {str(batch_job_definition_name)} (type: {str(batch_job_definition_type)})')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(batch_job_definition_name)
+        
+        # use lambda-python function to apply tags using batch_client
+        tagging = lambda key, value: batch_client.tag_resource(resourceArn=batch_job_definition_arn, tags={key: value})
+        
+        tagging('Name', batch_job_definition_name)
+        tagging('Type', batch_job_definition_type)
+        tagging('CreatedBy', user)
+        tagging('CreatedAt', event_time)
+        tagging('Env', env_tag)
+        tagging('Department', dep_tag)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('batch.amazonaws.com', 'UpdateComputeEnvironment')
+def batch_update_compute_environment(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdateComputeEnvironment event"""
+    # Create boto3 client/resource connection
+    batch_client = client_pool.client('batch', region)
+    try:
+        # get values required for tagging from event details
+        batch_compute_env_name = detail['responseElements']['computeEnvironmentName']
+        batch_compute_env_arn = detail['responseElements']['computeEnvironmentArn']
+        batch_compute_env_type = [compute_env['computeResources']['type'] for compute_env in batch_client.describe_compute_environments(computeEnvironments=[batch_compute_env_name])['computeEnvironments']][0]
+
+        logger.info(f'Tagging updated batch compute environment: {str(batch_compute_env_name)} (type: {str(batch_compute_env_type)})')
+        
+        # use lambda-python function to apply tags using batch_client
+        tagging = lambda key, value: batch_client.tag_resource(resourceArn=batch_compute_env_arn, tags={key: value})
+        
+        tagging('LastUpdatedBy', user)
+        tagging('LastUpdatedAt', event_time)
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
@@ -0,0 +1,41 @@
+################################################################################
+##    FILE:  	handlers/cloudfront.py (autotagging-function)                 ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of Cloudfront events loaded on the first    ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import client_pool, event_handler, finishing_sequence, logger
+
+# Cloudfront events
+@event_handler('cloudfront.amazonaws.com', 'CreateDistribution')
+def cloudfront_create_distribution(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateDistribution event"""
+    # Create boto3 client/resource connection           
+    cloudfront_client = client_pool.client('cloudfront', region)
+    try:
+        # get values required for tagging from event details
+        cf_distribution_arn = detail['responseElements']['distribution']['aRN']
+        cf_distribution_id = detail['responseElements']['distribution']['id']
+        logger.info(f'Tagging updated CloudFront distribution: {str(cf_distribution_id)}')
+        
+        # apply tags using cloudfront_client
+        cloudfront_client.tag_resource(Resource=cf_distribution_arn, 
+                                       Tags={'Items': 
+                                           [
+                                           {'Key': 'CreatedBy', 'Value': user},
+                                           {'Key': 'CreatedAt', 'Value': event_time},
+                                           {'Key': 'Env', 'Value': 'ops'},
+                                           {'Key': 'Department', 'Value': 'Operations'}
+                                           ]
+                                             })
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
@@ -0,0 +1,64 @@
+################################################################################
+##    FILE:  	handlers/codebuild.py (autotagging-function)                  ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of CodeBuild events loaded on the first     ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, TagSet, client_pool, event_handler, finishing_sequence, logger
+
+# CodeBuild events
+@event_handler('codebuild.amazonaws.com', 'CreateProject')
+def codebuild_create_project(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateProject event"""
+    # Create boto3 client/resource connection
+    codebuild_client = client_pool.client('codebuild', region)
+    try:
+        # get values required for tagging from event details
+        project_name = detail['responseElements']['project']['name']
+        logger.info(f'Tagging new Codebuild project: {str(project_name)}')          
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(project_name)
+        
+        # create predefined tags
+        tags_to_add = [
+                    {'key': 'Name', 'value': project_name},
+                    {'key': 'CreatedBy', 'value': user},
+                    {'key': 'CreatedAt', 'value': event_time},
+                    {'key': 'Env', 'value': env_tag},
+                    {'key': 'Department', 'value': dep_tag}
+                    ]
+        
+        # get project information
+        describe_projects = codebuild_client.batch_get_projects(names=[project_name])
+        for project in describe_projects['projects']:
+            # retrieve existing project tags
+            if 'tags' in project:
+                # combine tags into one list, existing tags take precedence over tags_to_add
+                tags = TagSet(tags_to_add).update(project['tags']).to_cloudtrail()
+                
+                # apply tags using codebuild_client
+                codebuild_client.update_project(name=project_name, tags=tags)
+            
+            # if there are no existing tags, apply tags_to_add
+            elif 'tags' not in project:
+                # apply tags using codebuild_client
+                codebuild_client.update_project(name=project_name, tags=tags_to_add)
+                
+            else:
+                logger.error('Cannot evaluate tags status')
+                finishing_sequence(context, eventname, status='fail', error='Cannot evaluate tags status', exception=False)
+                return False  
+                
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
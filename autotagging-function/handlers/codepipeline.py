@@ -0,0 +1,70 @@
+################################################################################
+##    FILE:  	handlers/codepipeline.py (autotagging-function)               ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of CodePipeline events loaded on the first  ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# CodePipeline events
+@event_handler('codepipeline.amazonaws.com', 'CreatePipeline')
+def codepipeline_create_pipeline(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreatePipeline event"""
+    # Create boto3 client/resource connection
+    codepipeline_client = client_pool.client('codepipeline', region)
+    try:
+        # get values required for tagging from event details
+        pipeline_name = detail['responseElements']['pipeline']['name']
+        # # get arn using get_pipeline boto3 method
+        pipeline_arn = codepipeline_client.get_pipeline(name=pipeline_name)['metadata']['pipelineArn']
+        logger.info(f'Tagging new code pipeline: {str(pipeline_name)}')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(pipeline_name)
+        
+        # apply tags using codepipeline_client
+        codepipeline_client.tag_resource(resourceArn=pipeline_arn,
+                                        tags=[
+                                            {'key': 'Name', 'value': pipeline_name},
+                                            {'key': 'CreatedBy', 'value': user},
+                                            {'key': 'CreatedAt', 'value': event_time},
+                                            {'key': 'Env', 'value': env_tag},
+                                            {'key': 'Department', 'value': dep_tag}
+                                            ]
+                                        )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('codepipeline.amazonaws.com', 'UpdatePipeline')
+def codepipeline_update_pipeline(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdatePipeline event"""
+    # Create boto3 client/resource connection
+    codepipeline_client = client_pool.client('codepipeline', region)
+    try:
+        pipeline_name = detail['responseElements']['pipeline']['name']
+        pipeline_arn = codepipeline_client.get_pipeline(name=pipeline_name)['metadata']['pipelineArn']
+        logger.info(f'Tagging updated code pipeline: {str(pipeline_name)}')
+        
+        # apply tags using codepipeline_client
+        codepipeline_client.tag_resource(resourceArn=pipeline_arn,
+                                        tags=[
+                                            {'key': 'LastUpdatedBy', 'value': user},
+                                            {'key': 'LastUpdatedAt', 'value': event_time}
+                                            ]
+                                        )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False      
+
+    return True
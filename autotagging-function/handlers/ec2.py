@@ -0,0 +1,818 @@
+################################################################################
+##    FILE:  	handlers/ec2.py (autotagging-function)                        ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of EC2 instance, volume, AMI, snapshot,     ##
+##              VPC and other EC2 events loaded on the first event of the     ##
+##              service                                                       ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import os
+import re
+import core
+from core import FILTER_MAX_VALUES, TagEvaluator, TagHandler, TagSet, TagWriter, client_pool, defer_recheck, event_handler, finishing_sequence, known_instance_tags, log_payload, logger, map_concurrently, prefetch_event_resources, ready_response, recheck_handler, reconcile_tags, requeue_recheck, resource_graph, wait_until
+from resource_graph import INSTANCE, SNAPSHOT, VOLUME
+
+# max number of instances of a RunInstances event processed concurrently
+RUN_INSTANCES_WORKERS = int(os.environ.get('RUN_INSTANCES_WORKERS', 10))
+
+# EC2 Instance events
+@event_handler('ec2.amazonaws.com', 'RunInstances')
+def ec2_run_instances(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of RunInstances event"""
+    # Create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        instances = detail['responseElements']['instancesSet']['items']
+        instance_ids = [instance['instanceId'] for instance in instances]
+        # describe all launched instances with one call, handlers of instances read them from instance_cache
+        if len(instance_ids) > 1:
+            prefetch_event_resources([{'region': region, 'detail': detail}])
+        # volumes attached to launched instances, described once for all of them into resource graph of the region
+        graph = resource_graph(region)
+        for start in range(0, len(instance_ids), FILTER_MAX_VALUES):
+            graph.load_filter(VOLUME, [{'Name': 'attachment.instance-id', 'Values': instance_ids[start:start + FILTER_MAX_VALUES]}])
+
+        # tags of launched instances, their volumes and ENI's are batched and written when leaving the block
+        with TagWriter(ec2_client) as tagwriter:
+
+            def tag_instance(instance_id: str) -> str:
+                """Tag launched instance, its volumes and ENI's; returns error message or None"""
+                try:
+                    #######################
+                    # Initialize TagHandler class
+                    ec2handler = TagHandler(instance_id, region, scope="ec2")
+                    # instance id, volumes and ENI attached to an instance
+                    ids = [instance_id] + graph.descendants(instance_id, (VOLUME,))
+                    if ec2handler.instance:
+                        ids += [eni['NetworkInterfaceId'] for eni in ec2handler.instance.get('NetworkInterfaces', [])]
+
+                    # Adding Owner and CreatedAt tag
+                    logger.info(f'Tagging EC2 resources: {", ".join(ids)}')
+                    # queue tags in batching tag writer
+                    tagwriter.add(ids, [
+                                    {'Key': 'Owner', 'Value': user},
+                                    {'Key': 'CreatedAt', 'Value': event_time}
+                                    ])
+
+                    # Check if tags are in place
+                    if 'tagSpecificationSet' in detail['requestParameters']:
+
+                        # initiliaze TagEvaluator to determine Env and Department tags# Initialize TagEvaluator class
+                        tagevaluator = TagEvaluator()
+                        logger.info('found instance tags')
+                        tags = TagSet(detail['requestParameters']['tagSpecificationSet']['items'][0]['tags'])
+                        # Process instance without Env tag but with defined Name (and not related to elasticbeanstalk)
+                        if 'Env' not in tags and 'Name' in tags and 'elasticbeanstalk:environment-name' not in tags:
+                            logger.info('adding Env tag')
+                            # retrieve Name tag from available tags
+                            instance_name = tags['Name']
+                            # call a TagEvaluator class method to determine Env and Department tags
+                            env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(instance_name)
+                            # queue tags in batching tag writer
+                            tagwriter.add(ids, [
+                                            {'Key': 'Env', 'Value': env_tag},
+                                            {'Key': 'Department', 'Value': dep_tag}
+                                            ])
+                            # call a TagHandler class method to parse and tag attached volumes and eni
+                            ec2handler.parse_and_tag_volumes_and_eni(tagwriter=tagwriter)
+
+                        # Process instance with Env tag but without Department tag
+                        elif 'Env' in tags and 'Department' not in tags:
+                            # retrieve Env tag from available tags
+                            env_tag = tags['Env'].lower()
+                            logger.info(f'Env tag: {str(env_tag)}')
+                            logger.info('adding Department tag')
+                            # call a TagEvaluator class method to determine Department tags
+                            dep_tag = str(tagevaluator.determine_department_tag(env_tag))
+                            logger.info(f'Department tag: {str(dep_tag)}')
+                            # queue tags in batching tag writer
+                            tagwriter.add(ids, [
+                                            {'Key': 'Env', 'Value': env_tag},
+                                            {'Key': 'Department', 'Value': dep_tag}
+                                            ])
+                            # call a TagHandler class method to parse and tag attached volumes and eni
+                            ec2handler.parse_and_tag_volumes_and_eni(tagwriter=tagwriter)
+
+                        # Process elasticbeanstalk instance without Department tag
+                        elif 'elasticbeanstalk:environment-name' in tags and 'Department' not in tags:
+                            logger.info('adding Department tag for Beanstalk resource')
+                            dep_tag = "Beanstalk"
+                            # queue tags in batching tag writer
+                            tagwriter.add(ids, [{'Key': 'Department', 'Value': dep_tag}])
+
+                            # call a TagHandler class method to parse and tag attached volumes and eni
+                            ec2handler.parse_and_tag_volumes_and_eni(tagwriter=tagwriter)
+
+                        # Process instance without Name tag
+                        elif 'Name' not in tags and 'eks:nodegroup-name' not in tags:
+                            logger.info('found unnamed instance')
+                            # call a TagHandler class method to parse delayed tags
+                            if ec2handler.processing_ec2_tags(30) is not True:
+                                return f'Error running processing_ec2_tags function for {instance_id}'
+                            logger.info('Tags have been processed')
+
+                        # Process instance without Name tag
+                        elif 'eks:nodegroup-name' in tags:
+                            logger.info('found unnamed EKS instance')
+                            # call a TagHandler class method to parse delayed tags
+                            if ec2handler.processing_ec2_tags(60) is not True:
+                                return f'Error running processing_ec2_tags function for {instance_id}'
+                            logger.info('Tags have been processed')
+
+                        else:
+                            # call a TagHandler class method to parse and tag attached volumes and eni
+                            ec2handler.parse_and_tag_volumes_and_eni(tagwriter=tagwriter)
+
+                    # Process instances without specified list of tags; in such case we will wait until it is being created
+                    else:
+                        # call a TagHandler class method to parse delayed tags
+                        if ec2handler.processing_ec2_tags(120) is not True:
+                            return f'Error running processing_ec2_tags function for {instance_id}'
+                        logger.info('Tags have been processed')
+
+                except Exception as error:
+                    logger.error(f'Error message: {str(error)}')
+                    logger.exception(f'Exception thrown at EC2 RunInstances when tagging instance {instance_id}: ')
+                    return str(error)
+
+            # instances are processed concurrently, so that waits for delayed tags of instances overlap
+            errors = [error for error in map_concurrently(tag_instance, instance_ids, RUN_INSTANCES_WORKERS) if error]
+
+        if errors:
+            finishing_sequence(context, eventname, status='fail', error='; '.join(errors), exception=False)
+            return False
+
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@recheck_handler('ec2_instance_tags')
+def recheck_ec2_instance_tags(item: dict) -> bool:
+    """Re-check of instance which tags have not been created by the time of receiving RunInstances event"""
+    # Initialize TagHandler class
+    ec2handler = TagHandler(item['resource_id'], item['region'], scope="ec2")
+    # enqueue instance again until tags are in place or attempts are exhausted
+    if not ec2handler.instance_ready(tuple(item['params']['tag_keys'])) and requeue_recheck(item):
+        return True
+    return ec2handler.processing_ec2_tags(item['timeout'], tuple(item['params']['tag_keys']), wait=False)
+
+@event_handler('ec2.amazonaws.com', 'StartInstances')
+def ec2_start_instances(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of StartInstances event"""
+    # create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # iterate over instances in event and get instance id
+        for instance in detail['responseElements']['instancesSet']['items']:
+            instance_id = instance['instanceId']
+            logger.info(f'EC2 Instance {str(instance_id)} started by: {str(user)}')
+            # initialize Taghandler and get instance tags before tags of this event are written
+            ec2handler = TagHandler(instance_id, region, scope="ec2")
+            tags = TagSet(ec2handler.get_instance_tags())
+            
+            desired_tags = {'LastStartedBy': user, 'LastStartedAt': event_time}
+            if 'Owner' not in tags:
+                logger.info(f'Owner tag not found, setting: {str(user)}')
+                desired_tags['Owner'] = user
+                
+            # apply changed tags using ec2_client
+            reconcile_tags(ec2_client, instance_id, tags, desired_tags)
+            
+                
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ec2.amazonaws.com', 'StopInstances')
+def ec2_stop_instances(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of StopInstances event"""
+    # create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # iterate over instances in event and get instance id
+        for instance in detail['responseElements']['instancesSet']['items']:
+            instance_id = instance['instanceId']
+            logger.info(f'EC2 Instance {str(instance_id)} stopped by: {str(user)}')
+            
+            # apply changed tags using ec2_client, current tags are known if instance has been described recently
+            reconcile_tags(ec2_client, instance_id, known_instance_tags(instance_id), {'LastStoppedBy': user, 'LastStoppedAt': event_time})
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ec2.amazonaws.com', 'RebootInstances')
+def ec2_reboot_instances(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of RebootInstances event"""
+    # create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # iterate over instances in event and get instance id
+        for instance in detail['requestParameters']['instancesSet']['items']:
+            instance_id = instance['instanceId']
+            logger.info(f'EC2 Instance {str(instance_id)} rebooted by: {str(user)}')
+            
+            # apply changed tags using ec2_client, current tags are known if instance has been described recently
+            reconcile_tags(ec2_client, instance_id, known_instance_tags(instance_id), {'LastRebootedBy': user, 'LastRebootedAt': event_time})
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+# EC2 Volume events
+@event_handler('ec2.amazonaws.com', 'CreateVolume')
+def ec2_create_volume(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateVolume event"""
+    # Create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get required values for tagging
+        volume_id = detail['responseElements']['volumeId']
+        logger.info(f'Adding Owner tag for volume: {str(volume_id)}')
+
+        # Owner tag and tags of the volume evaluated below are written with a single call
+        with TagWriter(ec2_client) as tagwriter:
+            tagwriter.add([volume_id], [{'Key': 'Owner', 'Value': user}])
+
+            logger.info('Applying tags from instance')
+            # get details about volume and instances it is attached to from resource graph of the region
+            graph = resource_graph(region)
+            for vol_id in graph.load(VOLUME, [volume_id], force=True):
+                instance_ids = graph.parents_of(vol_id, INSTANCE)
+                # if volume is attached to instance, initiliaze TagHandler to parse and apply tags of instance
+                if instance_ids:
+                    for instance_id in instance_ids:
+                        ec2handler = TagHandler(instance_id, region, scope="ec2")
+                        ec2handler.parse_and_tag_volumes_and_eni(TagEni=False, tagwriter=tagwriter)
+
+                # if volume is not attached check its tags
+                else:
+                    logger.info('Volume is not attached to instance')
+                    vol_tags = TagSet(graph.tags(vol_id))
+                    # if Name tag is not available, apply predefined tags
+                    if 'Name' not in vol_tags:
+                        # queue tags in batching tag writer
+                        tagwriter.add([volume_id], [
+                                        {'Key': 'Name', 'Value': '[not-attached-volume]'},
+                                        {'Key': 'CreatedAt', 'Value': event_time},
+                                        {'Key': 'Env', 'Value': 'ops'},
+                                        {'Key': 'Department', 'Value': 'Operations'},
+                                        ])
+                    # if Name tag is present, proceed to determining Env and Department tags
+                    elif 'Name' in vol_tags:
+                        volume_name = vol_tags['Name']
+
+                        # initiliaze TagEvaluator to determine Env and Department tags
+                        tagevaluator = TagEvaluator()
+                        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(volume_name)
+                        # queue tags in batching tag writer
+                        tagwriter.add([volume_id], [
+                                        {'Key': 'Env', 'Value': env_tag},
+                                        {'Key': 'Department', 'Value': dep_tag},
+                                        {'Key': 'CreatedAt', 'Value': event_time}
+                                        ])
+    
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+# EC2 AMI events
+def ami_snapshots_ready(ec2_client: object, image_id: str) -> dict:
+    """
+    Describe AMI image and check if all of its EBS snapshots are created
+
+    Args:
+        ec2_client (object): ec2 boto3 client
+        image_id (str): id of AMI image
+
+    Returns:
+        dict: describe_images response if snapshot ids are available, otherwise None
+    """
+    images = ec2_client.describe_images(ImageIds=[image_id], Owners=TagHandler.AMI_OWNERS)
+    mappings = [mapping for image in images['Images'] for mapping in image['BlockDeviceMappings'] if 'Ebs' in mapping]
+    return images if mappings and all(mapping['Ebs'].get('SnapshotId') for mapping in mappings) else None
+
+def tag_ami_snapshots(region: str, images: dict, tags: list) -> None:
+    """
+    Tag EBS snapshots of AMI images, snapshots of all images sharing one create_tags call
+
+    Args:
+        region (str): region of AMI images
+        images (dict): describe_images response
+        tags (list): tags to apply
+
+    Returns:
+        None
+    """
+    graph = resource_graph(region)
+    graph.add_images(images['Images'])
+    snapshot_tags = TagSet(tags).to_dict()
+    with TagWriter(client_pool.client('ec2', region)) as tagwriter:
+        for ami in images['Images']:
+            logger.info(f'Parsing snaphots of ami: {str(ami["Name"])}')
+            # snapshots of AMI are its children in resource graph
+            tagwriter.reconcile_plan(graph, graph.plan(ami['ImageId'], {SNAPSHOT: lambda image_tags, current: snapshot_tags}))
+
+@event_handler('ec2.amazonaws.com', 'CreateImage')
+def ec2_create_image(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateImage event"""
+    # create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get values required for tagging from event details
+        image_id = detail['responseElements']['imageId']
+        origin_instance_id = detail['requestParameters']['instanceId'] if detail['requestParameters']['instanceId'] else ''
+        logger.info(f'Adding Owner tag for image: {str(image_id)}')
+        graph = resource_graph(region)
+        event_image_tags = []
+
+        # Owner tag and tags derived from instance are written to the image with a single call
+        with TagWriter(ec2_client) as tagwriter:
+            tagwriter.add([image_id], [
+                            {'Key': 'Owner', 'Value': user},
+                            {'Key': 'CreatedAt', 'Value': event_time}
+                            ])
+
+            # if there is no origin instance, invoke TagHandler and get a list of image_tags
+            if origin_instance_id != '':
+                ec2handler = TagHandler(origin_instance_id, region, scope="ec2")
+                event_image_tags = list(ec2handler.get_tags_for_ami_image() or [])
+                graph.link(origin_instance_id, image_id)
+
+                # if images tags available check AMI name
+                if event_image_tags:
+                    aminame = detail['requestParameters']['name']
+                    if re.search('cent7-.*', aminame):
+                        aminame = aminame.split('-')[1]
+                    # if its packer builder instance, retrieve real instance behind it, looked up by name in resource graph of the region
+                    if TagSet(event_image_tags).get('BuiltBy') == 'packer':
+                        real_instance_ids = graph.find(INSTANCE, {'Name': aminame}, load=True)
+                        if real_instance_ids:
+                            logger.info(f'Tagging AMI created by Packer: {str(aminame)}')
+                            # image is made from the real instance and inherits its tags
+                            graph.unlink(origin_instance_id, image_id)
+                            graph.link(real_instance_ids[0], image_id)
+                            event_image_tags = TagHandler.image_tagset(graph.tags(real_instance_ids[0])).to_api()
+                        else:
+                            logger.error(f'Cannot find real instance id tagging with packer tags: {str(aminame)}')
+                    else:
+                        logger.info(f'Tagging standard AMI: {str(aminame)}')
+                    # queue tags in batching tag writer
+                    tagwriter.add([image_id], event_image_tags)
+
+        if origin_instance_id == '':
+            finishing_sequence(context, eventname, status='fail', error='Cannot determine InstanceId', exception=False)
+            return False
+
+        if not event_image_tags:
+            finishing_sequence(context, eventname, status='fail', error='Cannot process event image tags', exception=False)
+            return False
+
+        # Tagging snapshots created for ami
+        event_image_tags.append({'Key': 'Owner', 'Value': user})
+        # hand snapshots over to follow-up invocation if recheck queue is configured
+        if defer_recheck('ami_snapshots', region, image_id, 35, tags=event_image_tags) is not True:
+            # wait up to 35 seconds until snapshots of AMI are known
+            logger.info('Waiting for snapshots of AMI')
+            images = wait_until(lambda: ami_snapshots_ready(ec2_client, image_id), 35, f'snapshots of {image_id}').value or ec2_client.describe_images(ImageIds=[image_id], Owners=TagHandler.AMI_OWNERS)
+            tag_ami_snapshots(region, images, event_image_tags)
+
+        logger.info('Tags have been processed')
+
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@recheck_handler('ami_snapshots')
+def recheck_ami_snapshots(item: dict) -> bool:
+    """Re-check of snapshots of AMI created by CreateImage event"""
+    # Create boto3 client connection
+    ec2_client = client_pool.client('ec2', item['region'])
+    images = ami_snapshots_ready(ec2_client, item['resource_id'])
+    # enqueue image again until snapshots are known or attempts are exhausted
+    if images is None and requeue_recheck(item):
+        return True
+    tag_ami_snapshots(item['region'], images or ec2_client.describe_images(ImageIds=[item['resource_id']], Owners=TagHandler.AMI_OWNERS), item['params']['tags'])
+    return True
+
+@event_handler('ec2.amazonaws.com', 'CopyImage')
+def ec2_copy_image(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CopyImage event"""
+    # create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get values required for tagging from event details
+        image_id = detail['responseElements']['imageId']
+        image_name = detail['requestParameters']['name']
+        source_image_id = detail['requestParameters']['sourceImageId']
+        logger.info(f'Tagging copied image: {str(image_id)} (source ami: {str(source_image_id)})')
+        
+        tags_to_add = [
+                        {'Key': 'Name', 'Value': image_name},
+                        {'Key': 'CopiedBy', 'Value': user},
+                        {'Key': 'CopiedAt', 'Value': event_time},
+                        {'Key': 'Copied', 'Value': 'yes'},
+                        {'Key': 'SourceAMI', 'Value': source_image_id}
+                    ]
+        
+        # apply tags using ec2_client
+        ec2_client.create_tags(Resources=[image_id], Tags=tags_to_add)
+        # invoke TagHandler to get tags from source AMI
+        amihandler = TagHandler(source_image_id, region, scope="ami")
+        # tags_to_add take precedence over tags of source AMI
+        source_image_tags = TagSet(amihandler.get_image_tags()).without(TagSet(tags_to_add)).to_api()
+        if core.is_test_event:
+            log_payload('source_image_tags', source_image_tags)
+        
+        # apply tags using ec2_client
+        ec2_client.create_tags(Resources=[image_id], Tags=source_image_tags)
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+# EC2 Snapshot events
+@event_handler('ec2.amazonaws.com', 'CreateSnapshot')
+def ec2_create_snapshot(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateSnapshot event"""
+    # create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get values required for tagging from event details
+        snapshot_id = detail['responseElements']['snapshotId']
+        volume_id = detail['responseElements'].get('volumeId') or detail['requestParameters'].get('volumeId')
+        logger.info(f'Tagging snapshot: {str(snapshot_id)}')
+        snapshot_tags = TagSet({'Owner': user, 'CreatedAt': event_time})
+
+        # snapshot inherits propagated tags of its volume, known from resource graph of the region, unless they are requested for the snapshot
+        if volume_id:
+            graph = resource_graph(region)
+            graph.link(volume_id, snapshot_id)
+            if graph.load(VOLUME, [volume_id]):
+                requested_tags = TagSet([tag for spec in detail['requestParameters'].get('tagSpecificationSet', {}).get('items', []) for tag in spec.get('tags', [])])
+                volume_tags = TagSet(graph.tags(volume_id))
+                # volume which is not tagged yet takes missing tags from the instance it is attached to
+                instance_id = graph.ancestor(snapshot_id, INSTANCE)
+                if 'Name' not in volume_tags and instance_id and graph.load(INSTANCE, [instance_id]):
+                    volume_tags = TagSet(graph.tags(instance_id)).update(volume_tags)
+                snapshot_tags = volume_tags.project(TagHandler.PROPAGATED_TAG_KEYS - {'Owner'}).without(requested_tags).update(snapshot_tags)
+
+        # apply tags using ec2_client
+        ec2_client.create_tags(Resources=[snapshot_id], Tags=snapshot_tags.to_api())
+                           
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+# VPC events:
+@event_handler('ec2.amazonaws.com', 'CreateVpc')
+def ec2_create_vpc(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateVpc event"""
+    # Create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get values required for tagging from event details
+        vpc_id = detail['responseElements']['vpc']['vpcId']
+        logger.info(f'Tagging new VPC: {str(vpc_id)}')
+        
+        # check if VPC contains tags
+        if 'tagSet' in detail['responseElements']['vpc']:
+            logger.info('found tags')
+            tags = TagSet(detail['responseElements']['vpc']['tagSet']['items'])
+            # determine if Name tag is present
+            if 'Name' in tags:
+                vpc_name = tags['Name']
+                logger.info(f'VPC name: {str(vpc_name)}')
+                
+                # initiliaze TagEvaluator to determine Env and Department tags
+                tagevaluator = TagEvaluator()
+                env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(vpc_name)
+
+                # apply tags using ec2_client
+                ec2_client.create_tags(Resources=[vpc_id], 
+                                        Tags=[
+                                            {'Key': 'Name', 'Value': vpc_name},
+                                            {'Key': 'CreatedBy', 'Value': user},
+                                            {'Key': 'CreatedAt', 'Value': event_time},
+                                            {'Key': 'Env', 'Value': env_tag},
+                                            {'Key': 'Department', 'Value': dep_tag}
+                                            ]
+                                            )
+            
+            # if VPC is unnamed, use its id as a Name tag
+            elif 'Name' not in tags:
+                logger.info('VPC name is not available')
+
+                # apply tags using ec2_client
+                ec2_client.create_tags(Resources=[vpc_id], 
+                                        Tags=[
+                                            {'Key': 'Name', 'Value': vpc_id},
+                                            {'Key': 'CreatedBy', 'Value': user},
+                                            {'Key': 'CreatedAt', 'Value': event_time},
+                                            {'Key': 'Env', 'Value': 'ops'},
+                                            {'Key': 'Department', 'Value': 'Operations'}
+                                            ]
+                                            )
+        
+        # if tags are not available, apply predefined tags
+        elif 'tagSet' not in detail['responseElements']['vpc']:
+            logger.info('tags not found')
+            
+            # apply tags using ec2_client
+            ec2_client.create_tags(Resources=[vpc_id], 
+                Tags=[
+                    {'Key': 'Name', 'Value': vpc_id},
+                    {'Key': 'CreatedBy', 'Value': user},
+                    {'Key': 'CreatedAt', 'Value': event_time},
+                    {'Key': 'Env', 'Value': 'ops'},
+                    {'Key': 'Department', 'Value': 'Operations'}
+                    ]
+                    )
+                            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ec2.amazonaws.com', 'CreateSubnet')
+def ec2_create_subnet(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateSubnet event"""
+    # Create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get values required for tagging from event details
+        subnet_id = detail['responseElements']['subnet']['subnetId']
+        logger.info(f'Tagging new VPC subnet: {str(subnet_id)}')
+        
+        # check if subnet contains tags
+        if 'tagSet' in detail['responseElements']['subnet']:
+            logger.info('found tags')
+            tags = TagSet(detail['responseElements']['subnet']['tagSet']['items'])
+            # determine if Name tag is present
+            if 'Name' in tags:
+                subnet_name = tags['Name']
+                logger.info(f'VPC subnet name: {str(subnet_name)}')
+                
+                # initiliaze TagEvaluator to determine Env and Department tags
+                tagevaluator = TagEvaluator()
+                env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(subnet_name)
+
+                # apply tags using ec2_client
+                ec2_client.create_tags(Resources=[subnet_id], 
+                                        Tags=[
+                                            {'Key': 'Name', 'Value': subnet_name},
+                                            {'Key': 'CreatedBy', 'Value': user},
+                                            {'Key': 'CreatedAt', 'Value': event_time},
+                                            {'Key': 'Env', 'Value': env_tag},
+                                            {'Key': 'Department', 'Value': dep_tag}
+                                            ]
+                                            )
+            
+            # if subnet is unnamed, use its id as a Name tag
+            elif 'Name' not in tags:
+                logger.info('VPC subnet name is not available')
+        
+                ec2_client.create_tags(Resources=[subnet_id], 
+                                        Tags=[
+                                            {'Key': 'Name', 'Value': subnet_id},
+                                            {'Key': 'CreatedBy', 'Value': user},
+                                            {'Key': 'CreatedAt', 'Value': event_time},
+                                            {'Key': 'Env', 'Value': 'ops'},
+                                            {'Key': 'Department', 'Value': 'Operations'}
+                                            ]
+                                            )
+        
+        # if tags are not available, apply predefined tags
+        elif 'tagSet' not in detail['responseElements']['subnet']:
+            logger.info('tags not found')
+            
+            # apply tags using ec2_client
+            ec2_client.create_tags(Resources=[subnet_id], 
+                Tags=[
+                    {'Key': 'Name', 'Value': subnet_id},
+                    {'Key': 'CreatedBy', 'Value': user},
+                    {'Key': 'CreatedAt', 'Value': event_time},
+                    {'Key': 'Env', 'Value': 'ops'},
+                    {'Key': 'Department', 'Value': 'Operations'}
+                    ]
+                    )
+                            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ec2.amazonaws.com', 'CreateNetworkInterface')
+def ec2_create_network_interface(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateNetworkInterface event"""
+    # Create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get values required for tagging from event details
+        eni_id = detail['responseElements']['networkInterface']['networkInterfaceId']
+        logger.info(f'Tagging new NetworkInterface: {str(eni_id)}')
+        # get details about ENI interface as soon as it is visible (up to 5 seconds)
+        describe_interfaces = wait_until(lambda: ready_response(ec2_client.describe_network_interfaces(NetworkInterfaceIds=[eni_id]), 'NetworkInterfaces'),
+                                         5, f'network interface {eni_id}', initial_delay=0.5).value or ec2_client.describe_network_interfaces(NetworkInterfaceIds=[eni_id])
+        for eni in describe_interfaces['NetworkInterfaces']:
+            eni_interface_type = eni['InterfaceType']
+            # check if ENI is attached
+            if 'Attachment' in eni:
+                # if attached to Instance, get instance id
+                if eni_interface_type == 'interface' and 'InstanceId' in eni['Attachment']:
+                    instance_id = eni['Attachment']['InstanceId']
+                    logger.info(f'Tagging ENI attached to instance: {str(instance_id)}')
+                    # initialize tagHandler to get instance tags
+                    ec2handler = TagHandler(instance_id, region, scope="ec2")
+                    instance_tags = list(ec2handler.get_tags_for_eip_and_eni())
+                    
+                    # apply changed tags using ec2_client if instance_tags are not empty
+                    if instance_tags:
+                        reconcile_tags(ec2_client, eni_id, eni['TagSet'], TagSet(instance_tags).update({'Owner': user}))
+                
+                # if ENI is not attached to Instance, check if it there an info about security group 
+                elif eni_interface_type == 'interface' and 'InstanceId' not in eni['Attachment']:
+                    # if attached to SG, get security group id 
+                    if eni['Groups']:
+                        sg_id = eni['Groups'][0]['GroupId']
+                        logger.info(f'Tagging ENI attached with security group: {str(sg_id)}')
+                        eni_name = re.sub(' ', '-', eni['Description'])
+                        # initialize tagHandler to get security group tags
+                        sghandler = TagHandler(region=region, scope="none")
+                        sg_tags = list(sghandler.get_tags_from_security_group(sg_id))
+                        
+                        desired_tags = TagSet()
+                        # use sg_tags if they are not empty
+                        if sg_tags:
+                            desired_tags.update(sg_tags).update({'Name': eni_name, 'Owner': user})
+                            
+                        # check if ENI is attached to ECS tasks to assign a Name tag
+                        eni_tagset = TagSet(eni['TagSet'])
+                        if eni_tagset and re.search('ecs', eni['Description']) and 'eni:ecs' not in eni_tagset:
+                            if 'aws:ecs:serviceName' in eni_tagset:
+                                eni_name_ecs = eni_tagset['aws:ecs:serviceName']
+                            elif 'aws:ecs:clusterName' in eni_tagset:
+                                eni_name_ecs = eni_tagset['aws:ecs:clusterName']
+                            else:
+                                eni_name_ecs = eni['Groups'][0]['GroupName']
+                            desired_tags.update({'eni:ecs': 'tagged', 'Name': 'eni-ecs-task-' + eni_name_ecs})
+                        
+                        # apply changed tags using ec2_client with a single call
+                        reconcile_tags(ec2_client, eni_id, eni_tagset, desired_tags)
+                    
+                    # if there is no affiliation to security group, apply predefined tags
+                    elif not eni['Groups']:
+                        logger.info('Tagging ENI without security group')
+                        eni_name = re.sub(' ', '-', eni['Description'])
+                        eni_tags = [
+                                    {'Key': 'Name', 'Value': eni_name},
+                                    {'Key': 'Owner', 'Value': user},
+                                    {'Key': 'Env', 'Value': 'ops'},
+                                    {'Key': 'Department', 'Value': 'Operations'},
+                                ]
+                        # apply tags using ec2_client
+                        ec2_client.create_tags(Resources=[eni_id], Tags=eni_tags)
+                              
+                # apply tags for eni interfaces attached to nat gateways
+                elif eni_interface_type == 'nat_gateway':
+                    eni_name = re.search(r'.*(nat-.*)$', eni['Description'], re.DOTALL) or ''
+                    if eni_name == '': eni_name = re.sub(' ', '-', eni['Description']).split('-')[5]
+                    
+                    logger.info(f'Tagging ENI attached to nat_gateway: {str(eni_name)}')
+                    
+                    eni_tags = [
+                                {'Key': 'Name', 'Value': eni_name},
+                                {'Key': 'Owner', 'Value': user},
+                                {'Key': 'Env', 'Value': 'ops'},
+                                {'Key': 'Department', 'Value': 'Operations'},
+                            ]
+                    # apply tags using ec2_client
+                    ec2_client.create_tags(Resources=[eni_id], Tags=eni_tags)
+                    
+                # apply tags for lambda interfaces attached to AWS lambda functions
+                elif eni_interface_type == 'lambda':
+                    if re.search('role/service-role/.*', session_arn): 
+                        user = session_arn.split('/')[2]
+                        
+                    eni_name = re.sub(' ', '-', eni['Description'])
+                    
+                    logger.info(f'Tagging ENI attached to AWS lambda function: {str(eni_name)}')
+                    
+                    eni_tags = [
+                                {'Key': 'Name', 'Value': eni_name},
+                                {'Key': 'Owner', 'Value': user},
+                                {'Key': 'Env', 'Value': 'ops'},
+                                {'Key': 'Department', 'Value': 'Operations'},
+                            ]
+                    # apply tags using ec2_client
+                    ec2_client.create_tags(Resources=[eni_id], Tags=eni_tags)           
+            
+            # if ENI is not attached, apply predefined tags
+            elif 'Attachment' not in eni:
+                eni_tags = [
+                        {'Key': 'Name', 'Value': '[NOT-ATTACHED]'},
+                        {'Key': 'Owner', 'Value': user},
+                        {'Key': 'Env', 'Value': 'ops'},
+                        {'Key': 'Department', 'Value': 'Operations'}
+                    ]
+                # apply tags using ec2_client                    
+                ec2_client.create_tags(Resources=[eni_id], Tags=eni_tags)
+                            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ec2.amazonaws.com', 'AllocateAddress')
+def ec2_allocate_address(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of AllocateAddress event"""
+    # Create boto3 client/resource connection
+    ec2_client = client_pool.client('ec2', region)
+    try:
+        # get values required for tagging from event details
+        allocation_id = detail['responseElements']['allocationId']
+        ip_address = detail['responseElements']['publicIp']
+        logger.info(f'Tagging new ElasticIP Address: {str(ip_address)}')
+        # get info about Elastic IP once it has an association (up to 90 seconds)
+        describe_addresses = wait_until(lambda: ready_response(ec2_client.describe_addresses(PublicIps=[ip_address], AllocationIds=[allocation_id]), 'Addresses',
+                                                               lambda address: address.get('InstanceId') or address.get('NetworkInterfaceId')),
+                                        90, f'association of Elastic IP {ip_address}').value or ec2_client.describe_addresses(PublicIps=[ip_address], AllocationIds=[allocation_id])
+        for address in describe_addresses['Addresses']:
+            instance_id = ''
+            # if EIP is attached to instance, get instance id and get instance tags using TagHandler
+            if address.get('InstanceId'):
+                logger.info('Elastic IP has instance association')
+                logger.info('tagging EC2 Elastic IP')
+                instance_id = address['InstanceId']
+                ec2handler = TagHandler(instance_id, region, scope="ec2")
+                instance_tags = list(ec2handler.get_tags_for_eip_and_eni())
+                
+                # apply tags using ec2_client if instance_tags are not empty
+                if instance_tags:
+                    ec2_client.create_tags(Resources=[allocation_id], Tags=instance_tags)
+                    ec2_client.create_tags(Resources=[allocation_id], Tags=[
+                                                                        {'Key': 'AllocatedBy', 'Value': user},
+                                                                        {'Key': 'AllocatedAt', 'Value': event_time}
+                                                                        ]
+                                            )
+            
+            # if EIP is not attached to instance, check if its NAT EIP
+            else:
+                logger.info('Elastic IP does not have instance association')
+                # proceed if EIP is attached to NAT gateway ENI
+                if address.get('NetworkInterfaceId'):
+                    logger.info('tagging NAT Elastic IP')
+                    eni_id = address['NetworkInterfaceId']
+                    # get ENI tags using TagHandler
+                    enihandler = TagHandler(eni_id, region, scope="eni")
+                    eni_tags = list(enihandler.get_tags_for_nat_eni())
+                    
+                    # apply tags using ec2_client if eni_tags are not empty
+                    if eni_tags:
+                        ec2_client.create_tags(Resources=[allocation_id], Tags=eni_tags)
+                        ec2_client.create_tags(Resources=[allocation_id], Tags=[
+                                                                            {'Key': 'AllocatedBy', 'Value': user},
+                                                                            {'Key': 'AllocatedAt', 'Value': event_time}
+                                                                            ]
+                                               )
+                # if EIP is not attached to NAT ENI, apply predefined tags                                    
+                else:
+                    logger.info('Elastic IP does not have any association')
+                    address_tags = [
+                                    {'Key': 'AllocatedBy', 'Value': user},
+                                    {'Key': 'AllocatedAt', 'Value': event_time},
+                                    {'Key': 'Env', 'Value': 'ops'},
+                                    {'Key': 'Department', 'Value': 'Operations'}
+                                ]
+                    
+                    # apply tags using ec2_client
+                    ec2_client.create_tags(Resources=[allocation_id], Tags=address_tags)
+                            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
\ No newline at end of file
@@ -0,0 +1,422 @@
+################################################################################
+##    FILE:  	handlers/ecs.py (autotagging-function)                        ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of ECS events loaded on the first event of  ##
+##              the service                                                   ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import re
+from core import FILTER_MAX_VALUES, TagEvaluator, TagHandler, TagSet, TagWriter, call_async, client_pool, defer_recheck, event_handler, finishing_sequence, gather_async, logger, ready_response, recheck_handler, requeue_recheck, run_async, sg_cache, wait_until
+
+# EKS & ECS events
+# DescribeTasks accepts up to 100 tasks in one call
+ECS_DESCRIBE_MAX_TASKS = 100
+
+def describe_ecs_tasks(ecs_client: object, cluster_name: str, task_arns: list) -> list:
+    """
+    Describe ECS tasks with one call per ECS_DESCRIBE_MAX_TASKS tasks
+
+    Args:
+        ecs_client (object): ecs boto3 client
+        cluster_name (str): name of ECS cluster
+        task_arns (list): arns of tasks to describe
+
+    Returns:
+        list: described tasks
+    """
+    tasks = []
+    for start in range(0, len(task_arns), ECS_DESCRIBE_MAX_TASKS):
+        tasks += ecs_client.describe_tasks(cluster=cluster_name, tasks=task_arns[start:start + ECS_DESCRIBE_MAX_TASKS])['tasks']
+    return tasks
+
+def ecs_tasks_ready(ecs_client: object, cluster_name: str, task_arns: list) -> dict:
+    """
+    Describe ECS tasks and check if their network interfaces are created
+
+    Args:
+        ecs_client (object): ecs boto3 client
+        cluster_name (str): name of ECS cluster
+        task_arns (list): arns of tasks to describe
+
+    Returns:
+        dict: {'tasks': described tasks} if every ENI attachment of the tasks has networkInterfaceId, otherwise None
+    """
+    return ready_response({'tasks': describe_ecs_tasks(ecs_client, cluster_name, task_arns)}, 'tasks', lambda task: all(
+        any(attachment_detail['name'] == 'networkInterfaceId' for attachment_detail in attachment['details'])
+        for attachment in task.get('attachments', []) if attachment['type'] == 'ElasticNetworkInterface'))
+
+def ecs_service_tasks_ready(ecs_client: object, cluster_name: str, service_name: str) -> dict:
+    """
+    List tasks of ECS service and check if their network interfaces are created
+
+    Args:
+        ecs_client (object): ecs boto3 client
+        cluster_name (str): name of ECS cluster
+        service_name (str): name of ECS service
+
+    Returns:
+        dict: list_tasks response if service has tasks and all of them are ready, otherwise None
+    """
+    list_tasks = ecs_client.list_tasks(cluster=cluster_name, serviceName=service_name)
+    if list_tasks.get('taskArns') and ecs_tasks_ready(ecs_client, cluster_name, list_tasks['taskArns']):
+        return list_tasks
+    return None
+
+def security_group_tags(ec2_client: object, sg_ids: list) -> dict:
+    """
+    Get tags of security groups propagated to ENI's, describing groups missing in sg_cache with one call
+
+    Args:
+        ec2_client (object): ec2 boto3 client
+        sg_ids (list): ids of security groups
+
+    Returns:
+        dict: security group id -> TagSet of SG_TAG_KEYS
+    """
+    groups = {}
+    missing = []
+    for sg_id in dict.fromkeys(sg_ids):
+        security_groups = sg_cache.get(sg_id)
+        if security_groups is None:
+            missing.append(sg_id)
+        else:
+            groups[sg_id] = security_groups[0]
+    for start in range(0, len(missing), FILTER_MAX_VALUES):
+        # filter does not fail on deleted groups, unlike GroupIds
+        for page in ec2_client.get_paginator('describe_security_groups').paginate(Filters=[{'Name': 'group-id', 'Values': missing[start:start + FILTER_MAX_VALUES]}]):
+            for security_group in page['SecurityGroups']:
+                sg_cache.put(security_group['GroupId'], [security_group])
+                groups[security_group['GroupId']] = security_group
+    return {sg_id: TagSet(security_group.get('Tags')).project(TagHandler.SG_TAG_KEYS) for sg_id, security_group in groups.items()}
+
+def ecs_eni_tags(eni: dict, sg_tags: TagSet, user: str) -> TagSet:
+    """
+    Evaluate tags of ENI attached to ECS task from tags of its security group
+
+    Args:
+        eni (dict): described network interface
+        sg_tags (TagSet): tags of the first security group of ENI
+        user (str): user who triggered event
+
+    Returns:
+        TagSet: tags ENI should have; empty if security group has no tags to propagate
+    """
+    if not sg_tags:
+        return TagSet()
+    # check if there are any existing tags and based on that determine name for the eni interface
+    eni_tags = TagSet(eni['TagSet'])
+    if eni_tags:
+        if 'aws:ecs:serviceName' in eni_tags:
+            eni_name_ecs = eni_tags['aws:ecs:serviceName']
+        elif 'aws:ecs:clusterName' in eni_tags:
+            eni_name_ecs = eni_tags['aws:ecs:clusterName']
+        else:
+            eni_name_ecs = eni['Groups'][0]['GroupName']
+    else:
+        # if no tags found, create a name using description
+        eni_name_ecs = re.sub(' ', '-', eni['Description'])
+    # security group tags and three more tags including Owner and Name
+    return TagSet(sg_tags).update({
+                                'Name': 'eni-ecs-task-' + eni_name_ecs,
+                                'eni:ecs': 'tagged',
+                                'Owner': user
+                                })
+
+def tag_ecs_eni(region: str, eni_ids: list, user: str) -> int:
+    """
+    Tag ENI's attached to ECS tasks: ENI's are described together, tags of every distinct security group are resolved once
+    and changed tags are written with one call per identical tag set
+
+    Args:
+        region (str): region of ENI's
+        eni_ids (list): ids of ENI's
+        user (str): user who triggered event
+
+    Returns:
+        int: number of create_tags calls
+    """
+    # Create boto3 client connection
+    ec2_client = client_pool.client('ec2', region)
+    eni_ids = list(dict.fromkeys(eni_ids))
+    interfaces = []
+    for start in range(0, len(eni_ids), FILTER_MAX_VALUES):
+        # filter does not fail on ENI's deleted together with stopped tasks, unlike NetworkInterfaceIds
+        for page in ec2_client.get_paginator('describe_network_interfaces').paginate(Filters=[{'Name': 'network-interface-id', 'Values': eni_ids[start:start + FILTER_MAX_VALUES]}]):
+            interfaces += page['NetworkInterfaces']
+    interfaces = [eni for eni in interfaces if eni['Groups']]
+    sg_tags = security_group_tags(ec2_client, [eni['Groups'][0]['GroupId'] for eni in interfaces])
+
+    with TagWriter(ec2_client) as tagwriter:
+        for eni in interfaces:
+            logger.info(f'Tagging ECS task ENI: {str(eni["NetworkInterfaceId"])}')
+            tagwriter.reconcile(eni['NetworkInterfaceId'], eni['TagSet'], ecs_eni_tags(eni, sg_tags.get(eni['Groups'][0]['GroupId']), user))
+    return tagwriter.calls
+
+def tag_ecs_resource(ecs_client: object, resource_arn: str, tags: list) -> bool:
+    """
+    Tag ECS resource, skipping resources of clusters which do not use long ARN format and cannot be tagged
+
+    Args:
+        ecs_client (object): ecs boto3 client
+        resource_arn (str): arn of ECS service or task
+        tags (list): tags in format of ecs tag_resource
+
+    Returns:
+        bool: True if resource is tagged, False if its cluster uses short ARN format
+    """
+    try:
+        ecs_client.tag_resource(resourceArn=resource_arn, tags=tags)
+    except ecs_client.exceptions.InvalidParameterException as error:
+        # handle exception of long arn format
+        if 'Long arn format must be used for tagging operations' not in error.response['Error']['Message']:
+            raise
+        logger.info(f'Detected cluster using long ARN format, cannot tag ECS resource: {resource_arn}')
+        return False
+    return True
+
+async def tag_ecs_tasks_eni_async(ecs_client: object, region: str, cluster_name: str, task_arns: list, user: str, task_tags: list = None) -> None:
+    """
+    Tag ECS tasks and network interfaces attached to them: tags of every task are applied while network interfaces
+    are described through their tasks and tagged; task tags are skipped if the cluster uses short ARN format
+
+    Args:
+        ecs_client (object): ecs boto3 client
+        region (str): region of ECS cluster
+        cluster_name (str): name of ECS cluster
+        task_arns (list): arns of tasks
+        user (str): user who triggered event
+        task_tags (list, optional): tags applied to tasks; only ENI are tagged if None
+
+    Returns:
+        None
+    """
+    async def tag_eni() -> None:
+        # get details on all tasks and retrieve their ENI interfaces
+        tasks = await call_async(describe_ecs_tasks, ecs_client, cluster_name, task_arns)
+        eni_ids = [detail['value'] for task in tasks for attachment in task.get('attachments', []) for detail in attachment['details'] if detail['name'] == 'networkInterfaceId']
+        if eni_ids:
+            await call_async(tag_ecs_eni, region, eni_ids, user)
+
+    for task_arn in task_arns:
+        logger.info(f'found task: {task_arn}')
+    # apply tags using ecs_client
+    await gather_async(tag_eni(), *(call_async(tag_ecs_resource, ecs_client, task_arn, task_tags) for task_arn in task_arns if task_tags))
+
+def tag_ecs_tasks_eni(ecs_client: object, region: str, cluster_name: str, task_arns: list, user: str, task_tags: list = None) -> None:
+    """Synchronous shim of tag_ecs_tasks_eni_async"""
+    run_async(tag_ecs_tasks_eni_async, ecs_client, region, cluster_name, task_arns, user, task_tags)
+
+@event_handler('ecs.amazonaws.com', 'CreateCluster')
+@event_handler('eks.amazonaws.com', 'CreateCluster')
+def ecs_eks_create_cluster(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateCluster event"""
+    try:
+        # check if cluster is related to ECS or EKS
+        if eventsource == 'ecs.amazonaws.com':
+            # Create boto3 client/resource connection
+            ecs_client = client_pool.client('ecs', region)
+            # get values required for tagging from event details
+            cluster_arn = detail['responseElements']['cluster']['clusterArn']
+            cluster_name = detail['responseElements']['cluster']['clusterName']
+            logger.info(f'Tagging ECS cluster: {str(cluster_name)}')
+            
+            # initiliaze TagEvaluator to determine Env and Department tags
+            tagevaluator = TagEvaluator()       
+            env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(cluster_name)
+            
+            # apply tags using ecs_client
+            ecs_client.tag_resource(resourceArn=cluster_arn, 
+                                    tags=[
+                                        {'key': 'Name', 'value': cluster_name},
+                                        {'key': 'CreatedBy', 'value': user},
+                                        {'key': 'CreatedAt', 'value': event_time},
+                                        {'key': 'Env', 'value': env_tag},
+                                        {'key': 'Department', 'value': dep_tag},
+                                        ]
+                                    )
+            
+        elif eventsource == 'eks.amazonaws.com':
+            # Create boto3 client/resource connection
+            eks_client = client_pool.client('eks', region)
+            # get values required for tagging from event details
+            cluster_arn = detail['responseElements']['cluster']['arn']
+            cluster_name = detail['responseElements']['cluster']['name']
+            logger.info(f'Tagging EKS cluster: {str(cluster_name)}')
+            
+            # initiliaze TagEvaluator to determine Env and Department tags
+            tagevaluator = TagEvaluator()     
+            env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(cluster_name)
+            
+            # use lambda-python function to apply tags using eks_client
+            tagging = lambda key, value: eks_client.tag_resource(resourceArn=cluster_arn, tags={key: value})
+            
+            tagging('Name', cluster_name)
+            tagging('CreatedBy', user)
+            tagging('CreatedAt', event_time)
+            tagging('Env', env_tag)
+            tagging('Department', dep_tag)
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ecs.amazonaws.com', 'CreateService')
+def ecs_create_service(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateService event"""
+    # Create boto3 client/resource connection
+    ecs_client = client_pool.client('ecs', region)
+    try:
+        # get values required for tagging from event details
+        service_arn = detail['responseElements']['service']['serviceArn']
+        service_name = detail['responseElements']['service']['serviceName']
+        cluster_name = detail['requestParameters']['cluster']
+        logger.info(f'Tagging ECS service: {str(service_name)} (cluster: {cluster_name})')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()            
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(service_name)
+        
+        # apply tags using ecs_client
+        service_tagged = tag_ecs_resource(ecs_client, service_arn, 
+                                          [
+                                              {'key': 'Name', 'value': service_name},
+                                              {'key': 'Cluster', 'value': cluster_name},
+                                              {'key': 'CreatedBy', 'value': user},
+                                              {'key': 'CreatedAt', 'value': event_time},
+                                              {'key': 'Env', 'value': env_tag},
+                                              {'key': 'Department', 'value': dep_tag},
+                                              ]
+                                          )
+        
+        # tags applied to tasks created within service, tasks of a cluster using short ARN format cannot be tagged either
+        task_tags = [
+            {'key': 'CreatedBy', 'value': user},
+            {'key': 'CreatedAt', 'value': event_time},
+            {'key': 'ECS_Service', 'value': service_name},
+            {'key': 'Env', 'value': env_tag},
+            {'key': 'Department', 'value': dep_tag},
+            ] if service_tagged else None
+
+        # hand tasks over to follow-up invocation if recheck queue is configured
+        if defer_recheck('ecs_service_tasks', region, service_name, 60, cluster=cluster_name, user=user, task_tags=task_tags) is not True:
+            logger.info('Checking ECS service tasks and network interfaces')
+            # wait up to 60 seconds to get details on tasks created within service
+            list_tasks = wait_until(lambda: ecs_service_tasks_ready(ecs_client, cluster_name, service_name), 60, f'tasks of ECS service {service_name}').value \
+                or ecs_client.list_tasks(cluster=cluster_name, serviceName=service_name)
+            tag_ecs_tasks_eni(ecs_client, region, cluster_name, list_tasks.get('taskArns', []), user, task_tags)
+
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ecs.amazonaws.com', 'UpdateService')
+def ecs_update_service(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdateService event"""
+    # Create boto3 client/resource connection
+    ecs_client = client_pool.client('ecs', region)
+    try:
+        # get values required for tagging from event details
+        service_arn = detail['responseElements']['service']['serviceArn']
+        service_name = detail['requestParameters']['service']
+        cluster_name = detail['requestParameters']['cluster']
+        logger.info(f'Tagging updated ECS service: {str(service_name)} (cluster: {cluster_name})')
+        
+        # apply tags using ecs_client
+        service_tagged = tag_ecs_resource(ecs_client, service_arn, 
+                                          [
+                                              {'key': 'LastUpdatedBy', 'value': user},
+                                              {'key': 'LastUpdatedAt', 'value': event_time}
+                                              ]
+                                          )
+        
+        # tags applied to tasks of updated service, tasks of a cluster using short ARN format cannot be tagged either
+        task_tags = [
+            {'key': 'CreatedBy', 'value': user},
+            {'key': 'LastUpdatedBy', 'value': user},
+            {'key': 'ECS_Service', 'value': service_name},
+            {'key': 'LastUpdatedAt', 'value': event_time}
+            ] if service_tagged else None
+
+        # hand tasks over to follow-up invocation if recheck queue is configured
+        if defer_recheck('ecs_service_tasks', region, service_name, 60, cluster=cluster_name, user=user, task_tags=task_tags) is not True:
+            # wait up to 60 seconds to get details on tasks created within service
+            logger.info('Checking ECS service tasks and network interfaces')
+            list_tasks = wait_until(lambda: ecs_service_tasks_ready(ecs_client, cluster_name, service_name), 60, f'tasks of ECS service {service_name}').value \
+                or ecs_client.list_tasks(cluster=cluster_name, serviceName=service_name)
+            tag_ecs_tasks_eni(ecs_client, region, cluster_name, list_tasks.get('taskArns', []), user, task_tags)
+
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('ecs.amazonaws.com', 'RunTask')
+def ecs_run_task(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of RunTask event"""
+    # Create boto3 client/resource connection
+    ecs_client = client_pool.client('ecs', region)
+    try:
+        # get values required for tagging from event details
+        cluster_name = detail['requestParameters']['cluster']
+        task_arns = [task['taskArn'] for task in detail['responseElements']['tasks']]
+        for task in detail['responseElements']['tasks']:
+            task_arn = task['taskArn']
+            task_name = [taskname['name'] for taskname in task['containers']][0]
+            logger.info(f'Tagging ECS task: {str(task_name)}')
+            
+            # apply tags using ecs_client
+            tag_ecs_resource(ecs_client, task_arn, 
+                             [
+                                 {'key': 'Name', 'value': task_name},
+                                 {'key': 'CreatedBy', 'value': user},
+                                 {'key': 'CreatedAt', 'value': event_time}
+                                 ]
+                             )
+
+        # hand network interfaces over to follow-up invocation if recheck queue is configured
+        if defer_recheck('ecs_tasks', region, cluster_name, 60, cluster=cluster_name, task_arns=task_arns, user=user) is not True:
+            logger.info('Checking network interfaces')
+            # wait until network interfaces of the tasks are created (up to 60 seconds)
+            wait_until(lambda: ecs_tasks_ready(ecs_client, cluster_name, task_arns), 60, f'network interfaces of {len(task_arns)} ECS tasks')
+            tag_ecs_tasks_eni(ecs_client, region, cluster_name, task_arns, user)
+
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@recheck_handler('ecs_service_tasks')
+def recheck_ecs_service_tasks(item: dict) -> bool:
+    """Re-check of tasks created within ECS service by CreateService and UpdateService events"""
+    # Create boto3 client connection
+    ecs_client = client_pool.client('ecs', item['region'])
+    cluster_name, service_name = item['params']['cluster'], item['resource_id']
+    list_tasks = ecs_service_tasks_ready(ecs_client, cluster_name, service_name)
+    # enqueue service again until its tasks have network interfaces or attempts are exhausted
+    if list_tasks is None and requeue_recheck(item):
+        return True
+    task_arns = (list_tasks or ecs_client.list_tasks(cluster=cluster_name, serviceName=service_name)).get('taskArns', [])
+    tag_ecs_tasks_eni(ecs_client, item['region'], cluster_name, task_arns, item['params']['user'], item['params']['task_tags'])
+    return True
+
+@recheck_handler('ecs_tasks')
+def recheck_ecs_tasks(item: dict) -> bool:
+    """Re-check of network interfaces of tasks started by RunTask event"""
+    # Create boto3 client connection
+    ecs_client = client_pool.client('ecs', item['region'])
+    cluster_name, task_arns = item['params']['cluster'], item['params']['task_arns']
+    # enqueue tasks again until their network interfaces are created or attempts are exhausted
+    if ecs_tasks_ready(ecs_client, cluster_name, task_arns) is None and requeue_recheck(item):
+        return True
+    tag_ecs_tasks_eni(ecs_client, item['region'], cluster_name, task_arns, item['params']['user'])
+    return True
@@ -0,0 +1,49 @@
+################################################################################
+##    FILE:  	handlers/elasticache.py (autotagging-function)                ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of Elasticache events loaded on the first   ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# Elasticache events
+@event_handler('elasticache.amazonaws.com', 'CreateCacheCluster')
+def elasticache_create_cache_cluster(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateCacheCluster event"""
+    # Create boto3 client/resource connection
+    elasticache_client = client_pool.client('elasticache', region)
+    try:
+        # get values required for tagging from event details
+        cache_cluster_id  = detail['responseElements']['cacheClusterId']
+        cluster_engine = detail['responseElements']['engine']
+        # get details on clusters
+        describe_cache_clusters = elasticache_client.describe_cache_clusters(CacheClusterId=cache_cluster_id)
+        for cache_cluster in describe_cache_clusters['CacheClusters']:
+             # get cluster arn
+            cache_cluster_arn = cache_cluster['ARN']
+            logger.info(f'Tagging Elasticache cluster ({str(cluster_engine)}): {str(cache_cluster_id)} ({str(cache_cluster_arn)})')
+        
+            # initiliaze TagEvaluator to determine Env and Department tags
+            tagevaluator = TagEvaluator()
+            env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(cache_cluster_id)
+            
+            # apply tags using elasticache_client
+            elasticache_client.add_tags_to_resource(ResourceName=cache_cluster_id,
+                                            Tags=[
+                                                {'Key': 'Name', 'Value': cache_cluster_id},
+                                                {'Key': 'CreatedBy', 'Value': user},
+                                                {'Key': 'Env', 'Value': env_tag},
+                                                {'Key': 'Department', 'Value': dep_tag}
+                                                ]
+                                            )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
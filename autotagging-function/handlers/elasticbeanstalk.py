@@ -0,0 +1,186 @@
+################################################################################
+##    FILE:  	handlers/elasticbeanstalk.py (autotagging-function)           ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of Elastic Beanstalk events loaded on the   ##
+##              first event of the service                                    ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import client_pool, event_handler, finishing_sequence, logger
+
+# Elastic Beanstalk events
+@event_handler('elasticbeanstalk.amazonaws.com', 'CreateEnvironment')
+def beanstalk_create_environment(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateEnvironment event"""
+    # Create boto3 client/resource connection   
+    eb_client = client_pool.client('elasticbeanstalk', region)
+    try:
+        # get values required for tagging from event details
+        environment_name = detail['requestParameters']['environmentName']
+        application_name = detail['requestParameters']['applicationName']
+        version_label = detail['requestParameters']['versionLabel']
+        
+        # get details on EB environment
+        describe_environment = eb_client.describe_environments(ApplicationName=application_name, 
+                                                            VersionLabel=version_label,
+                                                            EnvironmentNames=[environment_name])
+                        
+        if describe_environment['Environments']:
+            # iterate over EB env details to get more required values
+            for environment in describe_environment['Environments']:
+                environment_name = environment['EnvironmentName']
+                application_name = environment['ApplicationName']
+                version_label = environment['VersionLabel']
+                environment_arn = environment['EnvironmentArn']
+                logger.info(f'Tagging EB Environment (application {str(application_name)}, version {str(version_label)}): {str(environment_name)}')
+                
+                # apply tags using eb_client   
+                eb_client.update_tags_for_resource(ResourceArn=environment_arn, 
+                                                TagsToAdd=[
+                                                    {'Key': 'CreatedBy', 'Value': user},
+                                                    {'Key': 'CreatedAt', 'Value': event_time},
+                                                    {'Key': 'Department', 'Value': 'Beanstalk'}
+                                                    ])
+                
+        elif not describe_environment['Environments']:
+            logger.info('EB Environment is empty')
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('elasticbeanstalk.amazonaws.com', 'UpdateEnvironment')
+def beanstalk_update_environment(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdateEnvironment event"""
+    # Create boto3 client/resource connection   
+    eb_client = client_pool.client('elasticbeanstalk', region)
+    try:
+        # get values required for tagging from event details
+        environment_name = detail['requestParameters']['environmentName']
+        # get details on EB environment
+        describe_environment = eb_client.describe_environments(EnvironmentNames=[environment_name])
+        
+        if describe_environment['Environments']:
+            # iterate over EB env details to get more required values
+            for environment in describe_environment['Environments']:
+                environment_name = environment['EnvironmentName']
+                environment_arn = environment['EnvironmentArn']
+                logger.info(f'Tagging updated EB Environment: {str(environment_name)}')
+                
+                # apply tags using eb_client   
+                eb_client.update_tags_for_resource(ResourceArn=environment_arn, 
+                                                TagsToAdd=[
+                                                    {'Key': 'LastUpdatedBy', 'Value': user},
+                                                    {'Key': 'LastUpdatedAt', 'Value': event_time},
+                                                    {'Key': 'Department', 'Value': 'Beanstalk'}
+                                                    ]
+                                                )
+        elif not describe_environment['Environments']:
+            logger.info('EB Environment is empty')
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('elasticbeanstalk.amazonaws.com', 'CreateApplication')
+def beanstalk_create_application(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateApplication event"""
+    # Create boto3 client/resource connection   
+    eb_client = client_pool.client('elasticbeanstalk', region)
+    try:
+        # get values required for tagging from event details
+        application_name = detail['requestParameters']['applicationName']
+        # get details on EB application
+        describe_application = eb_client.describe_applications(ApplicationNames=[application_name])
+        
+        # iterate over EB app details to get more required values
+        for application in describe_application['Applications']:
+            application_name = application['ApplicationName']
+            application_arn = application['ApplicationArn']
+            logger.info(f'Tagging EB Application: {str(application_name)}')
+            
+            # apply tags using eb_client   
+            eb_client.update_tags_for_resource(ResourceArn=application_arn, 
+                                            TagsToAdd=[
+                                                {'Key': 'CreatedBy', 'Value': user},
+                                                {'Key': 'CreatedAt', 'Value': event_time},
+                                                {'Key': 'Department', 'Value': 'Beanstalk'}
+                                                ])
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('elasticbeanstalk.amazonaws.com', 'UpdateApplication')
+def beanstalk_update_application(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdateApplication event"""
+    # Create boto3 client/resource connection   
+    eb_client = client_pool.client('elasticbeanstalk', region)
+    try:
+        # get values required for tagging from event details
+        application_name = detail['requestParameters']['applicationName']
+        # get details on EB application
+        describe_application = eb_client.describe_applications(ApplicationNames=[application_name])
+        
+        # iterate over EB app details to get more required values
+        for application in describe_application['Applications']:
+            application_name = application['ApplicationName']
+            application_arn = application['ApplicationArn']
+            logger.info(f'Tagging updated EB Application: {str(application_name)}')
+            
+            # apply tags using eb_client   
+            eb_client.update_tags_for_resource(ResourceArn=application_arn, 
+                                            TagsToAdd=[
+                                                {'Key': 'LastUpdatedBy', 'Value': user},
+                                                {'Key': 'LastUpdatedAt', 'Value': event_time},
+                                                {'Key': 'Department', 'Value': 'Beanstalk'}
+                                                ]
+                                            )
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('elasticbeanstalk.amazonaws.com', 'CreateApplicationVersion')
+def beanstalk_create_application_version(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateApplicationVersion event"""
+    # Create boto3 client/resource connection   
+    eb_client = client_pool.client('elasticbeanstalk', region)
+    try:
+        # get values required for tagging from event details
+        application_name = detail['requestParameters']['applicationName']
+        version_label = detail['requestParameters']['versionLabel']
+        # get details on EB application versions
+        describe_app_version = eb_client.describe_application_versions(ApplicationName=application_name, VersionLabels=[version_label])
+        
+        # iterate over EB app version details to get more required values
+        for app_version in describe_app_version['ApplicationVersions']:
+            application_name = app_version['ApplicationName']
+            version_label = app_version['VersionLabel']
+            app_version_arn = app_version['ApplicationVersionArn']
+            logger.info(f'Tagging EB Application Version (application {str(application_name)}): {str(version_label)}')
+            
+            # apply tags using eb_client   
+            eb_client.update_tags_for_resource(ResourceArn=app_version_arn, 
+                                            TagsToAdd=[
+                                                {'Key': 'CreatedBy', 'Value': user},
+                                                {'Key': 'CreatedAt', 'Value': event_time},
+                                                {'Key': 'Department', 'Value': 'Beanstalk'}
+                                                ])
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
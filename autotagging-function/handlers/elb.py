@@ -0,0 +1,386 @@
+################################################################################
+##    FILE:  	handlers/elb.py (autotagging-function)                        ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of classic ELB and ALB events loaded on     ##
+##              the first event of the service                                ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, TagSet, TagWriter, call_async, client_pool, describe_instance_tags, event_handler, finishing_sequence, gather_async, log_payload, logger, run_async, target_group_lb_name, wait_until
+
+# EC2 ALB/ELB events
+def target_health_ready(alb_client: object, tg_arn: str, target_ids: set, registered: bool = True) -> dict:
+    """
+    Describe target health and check if targets reached expected registration state
+
+    Args:
+        alb_client (object): elbv2 boto3 client
+        tg_arn (str): target group arn
+        target_ids (set): ids of targets from event
+        registered (bool, optional): if True all targets must be reported; if False targets must be draining or absent
+
+    Returns:
+        dict: describe_target_health response if targets are ready, otherwise None
+    """
+    response = alb_client.describe_target_health(TargetGroupArn=tg_arn)
+    states = {target['Target']['Id']: target['TargetHealth']['State'] for target in response['TargetHealthDescriptions']}
+    if registered:
+        ready = target_ids <= set(states)
+    else:
+        ready = all(states.get(target_id, 'draining') in ('draining', 'unused') for target_id in target_ids)
+    return response if ready else None
+
+# classic ELB events
+@event_handler('elasticloadbalancing.amazonaws.com', 'RegisterInstancesWithLoadBalancer')
+def elb_register_instances_with_load_balancer(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of RegisterInstancesWithLoadBalancer event"""
+    # Create boto3 client/resource connections
+    ec2_client = client_pool.client('ec2', region)
+    elb_client = client_pool.client('elb', region)
+    try:
+        # get ln_name from event
+        lb_name = detail['requestParameters']['loadBalancerName']
+        instance_ids = {instance['instanceId'] for instance in detail['responseElements']['instances']}
+        # wait up to 30 seconds until LB reports instances as registered, getting tags of all instances meanwhile
+        _, instance_tags = run_async(gather_async,
+            call_async(wait_until, lambda: instance_ids <= {instance['InstanceId'] for lb in elb_client.describe_load_balancers(LoadBalancerNames=[lb_name])['LoadBalancerDescriptions'] for instance in lb['Instances']},
+                       30, f'instances registered with LB {lb_name}'),
+            call_async(describe_instance_tags, ec2_client, sorted(instance_ids)))
+        # changed tags of all instances are written with one call per identical tag set
+        with TagWriter(ec2_client) as tagwriter:
+            for instance_id, tags in instance_tags.items():
+                logger.info(f'EC2 Instance {str(instance_id)} registered with LB: {str(lb_name)}')
+
+                # apply changed tags and remove tags which are no longer actual
+                tagwriter.reconcile(instance_id, tags,
+                                    desired={
+                                        'LB_registered': 'yes',
+                                        'LB_type': 'classic',
+                                        'LB_registered_with': lb_name,
+                                        'LB_registered_by': user,
+                                        'LB_registered_at': event_time
+                                        },
+                                    remove=['LB_deregistered_at', 'LB_deregistered_by', 'LB_deregistered_from'])
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('elasticloadbalancing.amazonaws.com', 'DeregisterInstancesFromLoadBalancer')
+def elb_deregister_instances_from_load_balancer(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of DeregisterInstancesFromLoadBalancer event"""
+    # Create boto3 client/resource connections
+    ec2_client = client_pool.client('ec2', region)
+    elb_client = client_pool.client('elb', region)
+    try:
+        # get ln_name from event
+        lb_name = detail['requestParameters']['loadBalancerName']
+        instance_ids = {instance['instanceId'] for instance in detail['requestParameters']['instances']}
+        # wait up to 30 seconds until LB stops reporting instances as registered, getting tags of all instances meanwhile
+        _, instance_tags = run_async(gather_async,
+            call_async(wait_until, lambda: not instance_ids & {instance['InstanceId'] for lb in elb_client.describe_load_balancers(LoadBalancerNames=[lb_name])['LoadBalancerDescriptions'] for instance in lb['Instances']},
+                       30, f'instances deregistered from LB {lb_name}'),
+            # responseElements lists instances which are still registered, deregistered ones are taken from the request
+            call_async(describe_instance_tags, ec2_client, sorted(instance_ids)))
+        # changed tags of all instances are written with one call per identical tag set
+        with TagWriter(ec2_client) as tagwriter:
+            for instance_id, tags in instance_tags.items():
+                logger.info(f'EC2 Instance {str(instance_id)} deregistered from LB: {str(lb_name)}')
+
+                # apply changed tags and remove tags which are no longer actual
+                tagwriter.reconcile(instance_id, tags,
+                                    desired={
+                                        'LB_registered': 'no',
+                                        'LB_deregistered_from': lb_name,
+                                        'LB_deregistered_by': user,
+                                        'LB_deregistered_at': event_time
+                                        },
+                                    remove=['LB_registered_with', 'LB_registered_by', 'LB_registered_at', 'LB_type'])
+                
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+# ALB events
+@event_handler('elasticloadbalancing.amazonaws.com', 'RegisterTargets')
+def elb_register_targets(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of RegisterTargets event"""
+    # Create boto3 client/resource connections to alb and ec2
+    ec2_client = client_pool.client('ec2', region)
+    alb_client = client_pool.client('elbv2', region)
+    try:
+        # get target group arn from event
+        tg_arn = detail['requestParameters']['targetGroupArn']
+        # get information about target group
+        get_tg = alb_client.describe_target_groups(TargetGroupArns=[tg_arn])
+        for tg in get_tg['TargetGroups']:
+            # re-assign target group arn and retrieve its name
+            tg_arn = tg['TargetGroupArn']
+            tg_name = tg['TargetGroupName']
+            # proceed if target group is attached to LB
+            if tg['LoadBalancerArns']:
+                # proceed if target group is attached to instance
+                if tg['TargetType'] == 'instance':
+                    logger.info(f'Checking instances registered with TargetGroup: {tg_name}')
+                    target_ids = {target['id'] for target in detail['requestParameters']['targets']}
+                    # LB name, target group health status once registered targets are reported (up to 30 seconds)
+                    # and tags of all instances registered by event are retrieved at the same time
+                    lb_name, get_targets, instance_tags = run_async(gather_async,
+                        call_async(target_group_lb_name, alb_client, tg),
+                        call_async(lambda: wait_until(lambda: target_health_ready(alb_client, tg_arn, target_ids, registered=True),
+                                                      30, f'targets registered with {tg_name}').value or alb_client.describe_target_health(TargetGroupArn=tg_arn)),
+                        call_async(describe_instance_tags, ec2_client, sorted(target_ids)))
+                    logger.info(f'Identified LB: {lb_name}')
+                    if get_targets['TargetHealthDescriptions']:
+                        # only instances reported by target group are tagged
+                        reported = {target['Target']['Id'] for target in get_targets['TargetHealthDescriptions']}
+                        instance_tags = {instance_id: tags for instance_id, tags in instance_tags.items() if instance_id in reported}
+                        # changed tags of all instances are written with one call per identical tag set
+                        with TagWriter(ec2_client) as tagwriter:
+                            for instance_id, tags in instance_tags.items():
+                                logger.info(f'Reviewing instance: {instance_id}')
+
+                                desired_tags = {}
+                                # check if LB_target_groups tag is present
+                                if 'LB_target_groups' in tags:
+                                    t_groups = tags['LB_target_groups']
+
+                                    # if target group is not in values of LB_target_groups, add it
+                                    if tg_name not in t_groups.split(':'):
+                                        desired_tags['LB_target_groups'] = t_groups + ":" + tg_name
+
+                                # if LB_target_groups tag is not present, create it
+                                else:
+                                    desired_tags['LB_target_groups'] = tg_name
+
+                                # if target group is not tagged as registered, add necessary groups
+                                if 'LB_registered' not in tags or tags.get('LB_registered') == 'no' or 'LB_registered_with' not in tags:
+                                    desired_tags.update({
+                                        'LB_registered': 'yes',
+                                        'LB_type': 'application',
+                                        'LB_registered_with': lb_name,
+                                        'LB_registered_at': event_time,
+                                        'LB_registered_by': user
+                                        })
+                                # queue changed tags; if target group was previously deregistered from LB and tagged accordingly, remove those tags
+                                tagwriter.reconcile(instance_id, tags, desired_tags,
+                                                    remove=['LB_deregistered_from', 'LB_deregistered_at', 'LB_deregistered_by'] if 'LB_deregistered_from' in tags else ())
+                    
+                    # if target group does not have instances attached, exit            
+                    elif not get_targets['TargetHealthDescriptions']:
+                        logger.info(f'Target group {tg_name} without instances')
+                
+                # if target group type is not 'instance', exit
+                elif tg['TargetType'] != 'instance':
+                    logger.info(f'\'TargetType\' of TG {tg_name} is not \'instance\'')
+                    
+            # if target group is not attached to LB, exit
+            elif not tg['LoadBalancerArns']:
+                logger.info(f'Target group {tg_name} is not connected to LB')    
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('elasticloadbalancing.amazonaws.com', 'DeregisterTargets')
+def elb_deregister_targets(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of DeregisterTargets event"""
+    # Create boto3 client/resource connections to alb and ec2
+    ec2_client = client_pool.client('ec2', region)   
+    alb_client = client_pool.client('elbv2', region)
+    try:
+        # get target group arn from event
+        tg_arn = detail['requestParameters']['targetGroupArn']
+        # get information about target group
+        get_tg = alb_client.describe_target_groups(TargetGroupArns=[tg_arn])
+        for tg in get_tg['TargetGroups']:
+            # retrieve target group name
+            tg_name = tg['TargetGroupName']
+            # proceed if target group is attached to LB
+            if tg['LoadBalancerArns']:
+                # proceed if target group is attached to instance
+                if tg['TargetType'] == 'instance':
+                    
+                    logger.info(f'Checking instances deregistered with TargetGroup: {tg_name}')
+                    target_ids = {target['id'] for target in detail['requestParameters']['targets']}
+                    # LB name, target group health status once deregistered targets are draining (up to 30 seconds)
+                    # and tags of all instances deregistered by event are retrieved at the same time
+                    lb_name, _, instance_tags = run_async(gather_async,
+                        call_async(target_group_lb_name, alb_client, tg),
+                        call_async(wait_until, lambda: target_health_ready(alb_client, tg_arn, target_ids, registered=False),
+                                   30, f'targets deregistered from {tg_name}'),
+                        call_async(describe_instance_tags, ec2_client, sorted(target_ids)))
+                    logger.info(f'Identified LB: {lb_name}')
+                    # targets are tagged even if they are no longer reported by target group
+                    if target_ids:
+                        # changed tags of all instances are written with one call per identical tag set
+                        with TagWriter(ec2_client) as tagwriter:
+                            for instance_id, tags in instance_tags.items():
+                                logger.info(f'Reviewing instance: {instance_id}')
+
+                                # if target group was previously registered with LB and tagged accordingly, remove those tags and create deregistered tags
+                                if 'LB_registered_with' in tags and tags.get('LB_registered') == 'yes':
+                                    # queue changed tags and removal of tags which are no longer actual
+                                    tagwriter.reconcile(instance_id, tags,
+                                                        desired={
+                                                            'LB_registered': 'no',
+                                                            'LB_deregistered_from': lb_name,
+                                                            'LB_deregistered_at': event_time,
+                                                            'LB_deregistered_by': user
+                                                            },
+                                                        remove=['LB_type', 'LB_registered_with', 'LB_registered_at', 'LB_registered_by', 'LB_target_groups'])
+                    # if event does not have targets, exit
+                    else:
+                        logger.info(f'No targets deregistered from {tg_name}')
+                        
+                # if target group type is not 'instance', exit        
+                elif tg['TargetType'] != 'instance':
+                    logger.info(f'\'TargetType\' of TG {tg_name} is not \'instance\'')
+                    
+            # if target group is not attached to LB, exit        
+            elif not tg['LoadBalancerArns']:
+                logger.info(f'Target group {tg_name} is not connected to LB')
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+# ELB/ALB events
+@event_handler('elasticloadbalancing.amazonaws.com', 'CreateLoadBalancer')
+def elb_create_load_balancer(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateLoadBalancer event"""
+    try:
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        if 'type' in detail['requestParameters']:
+            # Create boto3 client/resource connection
+            elb_client = client_pool.client('elbv2', region)
+            # get values required for tagging from event details
+            lb_type = detail['requestParameters']['type']
+            lb_name = detail['responseElements']['loadBalancers'][0]['loadBalancerName']
+            lb_arn = detail['responseElements']['loadBalancers'][0]['loadBalancerArn']
+            logger.info(f'Tagging LB of {str(lb_type)}: {str(lb_name)}')                    
+            
+            # determine Env and Department tags
+            env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(lb_name)
+            
+            # apply tags using elb_client
+            elb_client.add_tags(ResourceArns=[lb_arn], 
+                                Tags=[
+                                    {'Key': 'CreatedBy', 'Value': user},
+                                    {'Key': 'CreatedAt', 'Value': event_time},
+                                    {'Key': 'Name', 'Value': lb_name},
+                                    {'Key': 'Env', 'Value': env_tag}, 
+                                    {'Key': 'Department', 'Value': dep_tag}
+                                    ])
+            
+        else:           
+            # Create boto3 client/resource connection
+            elb_client = client_pool.client('elb', region)
+            # get values required for tagging from event details
+            lb_name = detail['requestParameters']['loadBalancerName']
+            logger.info(f'Tagging LB of Classic type: {str(lb_name)}')
+            # apply tags using elb_client 
+            elb_client.add_tags(LoadBalancerNames=[lb_name], 
+                                Tags=[
+                                    {'Key': 'CreatedBy', 'Value': user},
+                                    {'Key': 'CreatedAt', 'Value': event_time}
+                                    ]
+                                )
+            
+            # check if there are existing tags
+            if 'tags' in detail['requestParameters']:
+                tags = TagSet(detail['requestParameters']['tags'])
+                # if Name tag is not present, create it
+                if 'Name' not in tags:
+                    logger.info(f'Name tag: {str(lb_name)}')
+                    # apply tags using elb_client
+                    elb_client.add_tags(LoadBalancerNames=[lb_name], Tags=[{'Key': 'Name', 'Value': lb_name}])
+                # if Env tag is not present, create it along with Department tag
+                if 'Env' not in tags:
+                    # determine Env and Department tags
+                    env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(lb_name)
+                    # apply tags using elb_client
+                    elb_client.add_tags(LoadBalancerNames=[lb_name], 
+                                        Tags=[
+                                                {'Key': 'Env', 'Value': env_tag},
+                                                {'Key': 'Department', 'Value': dep_tag}
+                                             ]
+                                        )
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('elasticloadbalancing.amazonaws.com', 'CreateTargetGroup')
+def elb_create_target_group(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateTargetGroup event"""
+    # Create boto3 client/resource connection
+    elb_client = client_pool.client('elbv2', region)
+    try:
+        # get values required for tagging from event details
+        for tg in detail['responseElements']['targetGroups']:
+            tg_name = tg['targetGroupName']
+            tg_arn = tg['targetGroupArn']
+            logger.info(f'Tagging Target Group: {str(tg_name)}')
+            
+            # get details on target group using boto3 describe_target_groups method
+            describe_tg = elb_client.describe_target_groups(TargetGroupArns=[tg_arn])
+            for tg in describe_tg['TargetGroups']:
+                # check if target group is attached to LB
+                if tg['LoadBalancerArns']:
+                    # get arn of LB
+                    lb_arn = tg['LoadBalancerArns']
+                    logger.info(f'Found LB behind Target Group: {str(lb_arn)}')
+                    # get tags of LB
+                    describe_tags = elb_client.describe_tags(ResourceArns=lb_arn)
+                    tags = TagSet(describe_tags['TagDescriptions'][0]['Tags'])
+                    # create a list of tags for target group using LB tags
+                    tags_list = ['Env', 'Department', 'Customers', 'Cluster', 'Id', 'tenant', 'stage', 'Project', 'Class', 'Role', 'application']
+                    newtags = tags.project(tags_list).to_api()
+                                
+                    log_payload('tags', newtags)
+                    
+                    # apply tags using elb_client
+                    elb_client.add_tags(ResourceArns=[tg_arn], 
+                        Tags=[
+                            {'Key': 'CreatedBy', 'Value': user},
+                            {'Key': 'Name', 'Value': tg_name}
+                            ])
+                    elb_client.add_tags(ResourceArns=[tg_arn], Tags=newtags)
+
+                # if target group is not attached to LB, apply predefined tags
+                if not tg['LoadBalancerArns']:
+                    logger.info('LB not found')
+                    
+                    # initiliaze TagEvaluator to determine Env and Department tags
+                    tagevaluator = TagEvaluator()
+                    env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(tg_name)
+                    
+                    # apply tags using elb_client
+                    elb_client.add_tags(ResourceArns=[tg_arn], 
+                        Tags=[
+                            {'Key': 'CreatedBy', 'Value': user},
+                            {'Key': 'Name', 'Value': tg_name},
+                            {'Key': 'Env', 'Value': env_tag}, 
+                            {'Key': 'Department', 'Value': dep_tag}
+                            ])
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
@@ -0,0 +1,159 @@
+################################################################################
+##    FILE:  	handlers/fsx.py (autotagging-function)                        ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of FSx and EFS events loaded on the         ##
+##              first event of the service                                    ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, TagSet, client_pool, event_handler, finishing_sequence, logger
+
+# FSx and EFS events
+@event_handler('fsx.amazonaws.com', 'CreateFileSystem')
+@event_handler('elasticfilesystem.amazonaws.com', 'CreateFileSystem')
+def fsx_efs_create_file_system(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateFileSystem event"""
+    try:
+        # processing of CreateFileSystem event for FSx
+        if eventsource == 'fsx.amazonaws.com':
+            # Create boto3 client/resource connection
+            fsx_client = client_pool.client('fsx', region)
+            
+            # get values required for tagging from event details
+            fsx_arn = detail['responseElements']['fileSystem']['resourceARN']
+            fsx_id = detail['responseElements']['fileSystem']['fileSystemId']
+            logger.info(f'Tagging FSx file system: {str(fsx_id)}')
+            
+            # apply tags using fsx_client
+            fsx_client.tag_resource(ResourceARN=fsx_arn, 
+                                Tags=[
+                                    {'Key': 'CreatedBy', 'Value': user},
+                                    {'Key': 'CreatedAt', 'Value': event_time}
+                                    ]
+                                )
+            
+            # if existing tags found, get Name tag
+            if 'tags' in detail['responseElements']['fileSystem']:
+                logger.info('found tags')
+                tags = TagSet(detail['responseElements']['fileSystem']['tags'])
+                # if Name tag is available use it to get Env and Department tags
+                if 'Name' in tags:
+                    logger.info('found Name tag')
+                    fsx_name = tags['Name']
+                    
+                    # initiliaze TagEvaluator to determine Env and Department tags
+                    tagevaluator = TagEvaluator()            
+                    env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(fsx_name)
+                    
+                    # apply tags using fsx_client
+                    fsx_client.tag_resource(ResourceARN=fsx_arn, Tags=[
+                                                                        {'Key': 'Env', 'Value': env_tag},
+                                                                        {'Key': 'Department', 'Value': dep_tag}
+                                                                        ])
+            # if tags are not availabe, apply predefined tags
+            elif 'tags' not in detail['responseElements']['fileSystem']:
+                logger.info('no tags')
+                fsx_client.tag_resource(ResourceARN=fsx_arn, Tags=[
+                                                                        {'Key': 'Env', 'Value': 'ops'},
+                                                                        {'Key': 'Department', 'Value': 'Operations'}
+                                                                        ])     
+        
+        # processing of CreateFileSystem event for EFS
+        elif eventsource == 'elasticfilesystem.amazonaws.com':
+            # Create boto3 client/resource connection
+            efs_client = client_pool.client('efs', region)
+            # get values required for tagging from event details
+            filesystem_id = detail['responseElements']['fileSystemId']
+            filesystem_name = detail['responseElements']['name']
+            logger.info(f'Tagging EFS file system: {str(filesystem_name)}')
+            
+            # apply tags using efs_client
+            efs_client.tag_resource(ResourceId=filesystem_id, 
+                                Tags=[
+                                    {'Key': 'Name', 'Value': filesystem_name},
+                                    {'Key': 'CreatedBy', 'Value': user},
+                                    {'Key': 'CreatedAt', 'Value': event_time}
+                                    ]
+                                )
+            
+            # if there are existing tags, get Name tag
+            if 'tags' in detail['responseElements']:
+                logger.info('found tags')
+                tags = TagSet(detail['responseElements']['tags'])
+                # if Name tag is available use it to get Env and Department tags
+                if 'Name' in tags:
+                    logger.info('found Name tag')
+                    fs_name = tags['Name']
+                    
+                    # initiliaze TagEvaluator to determine Env and Department tags
+                    tagevaluator = TagEvaluator()            
+                    env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(fs_name)
+                    
+                    # apply tags using efs_client
+                    efs_client.tag_resource(ResourceId=filesystem_id, Tags=[
+                                                                        {'Key': 'Env', 'Value': env_tag},
+                                                                        {'Key': 'Department', 'Value': dep_tag}
+                                                                         ])
+            # if tags not availabe, apply predefined tags
+            elif 'tags' not in detail['responseElements']:
+                logger.info('no tags')
+                efs_client.tag_resource(ResourceId=filesystem_id, Tags=[
+                                                                        {'Key': 'Env', 'Value': 'ops'},
+                                                                        {'Key': 'Department', 'Value': 'Operations'}
+                                                                        ])                 
+                    
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('fsx.amazonaws.com', 'UpdateFileSystem')
+@event_handler('elasticfilesystem.amazonaws.com', 'UpdateFileSystem')
+def fsx_efs_update_file_system(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of UpdateFileSystem event"""
+    try:
+        if eventsource == 'fsx.amazonaws.com':
+            # Create boto3 client/resource connection
+            fsx_client = client_pool.client('fsx', region)
+            # get values required for tagging from event details
+            fsx_arn = detail['responseElements']['fileSystem']['resourceARN']
+            fsx_id = detail['responseElements']['fileSystem']['fileSystemId']
+            logger.info(f'Tagging updated FSx file system: {str(fsx_id)}')
+            
+            # apply tags using fsx_client
+            fsx_client.tag_resource(ResourceARN=fsx_arn, 
+                                Tags=[
+                                    {'Key': 'LastUpdatedBy', 'Value': user},
+                                    {'Key': 'LastUpdatedAt', 'Value': event_time}
+                                    ]
+                                )  
+            
+        elif eventsource == 'elasticfilesystem.amazonaws.com':
+            # Create boto3 client/resource connection
+            efs_client = client_pool.client('efs', region)
+            # get values required for tagging from event details
+            filesystem_id = detail['responseElements']['fileSystemId']
+            filesystem_name = detail['responseElements']['name']
+            logger.info(f'Tagging updated EFS file system: {str(filesystem_name)}')
+            
+            # apply tags using efs_client
+            efs_client.tag_resource(ResourceId=filesystem_id, 
+                                Tags=[
+                                    {'Key': 'LastUpdatedBy', 'Value': user},
+                                    {'Key': 'LastUpdatedAt', 'Value': event_time}
+                                    ]
+                                )                                      
+        
+    except Exception as error:
+        eventsource = eventsource.split('.')[0].upper()
+        logger.error(f'Error message: {str(error)}')
+        logger.exception(f'Exception thrown at {str(eventsource)} UpdateFileSystem: ')
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
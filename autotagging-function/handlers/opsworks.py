@@ -0,0 +1,217 @@
+################################################################################
+##    FILE:  	handlers/opsworks.py (autotagging-function)                   ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of OpsWorks events loaded on the first      ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# OpsWorks events
+@event_handler('opsworks.amazonaws.com', 'CreateStack')
+@event_handler('cloudformation.amazonaws.com', 'CreateStack')
+def opsworks_cloudformation_create_stack(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateStack event for OpsWorks"""
+    if eventsource == 'opsworks.amazonaws.com':
+        # Create boto3 client/resource connection
+        opsworks_client = client_pool.client('opsworks', region)
+        try:
+            # get values required for tagging from event details
+            stack_name_request = detail['requestParameters']['name']
+            # get info on stacks
+            stacks = opsworks_client.describe_stacks()
+            # iterate over stacks
+            for stack in stacks['Stacks']:
+                stack_name_response = stack['Name']
+                # determine that stack in request is the same as in the event
+                if stack_name_request == stack_name_response:
+                    # get stack arn
+                    stack_arn = stack['Arn']
+                    logger.info(f'Tagging new OpsWorks stack: {str(stack_name_request)}')
+                    
+                    # initiliaze TagEvaluator to determine Env and Department tags
+                    tagevaluator = TagEvaluator()
+                    env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(stack_name_response)
+                    
+                    # use lambda-python function to apply tags using opsworks_client
+                    tagging = lambda key, value: opsworks_client.tag_resource(ResourceArn=stack_arn, Tags={key: value})
+            
+                    tagging('Name', stack_name_response)
+                    tagging('CreatedBy', user)
+                    tagging('CreatedAt', event_time)
+                    tagging('Env', env_tag)
+                    tagging('Department', dep_tag)
+                    
+                else:
+                    logger.error('Cannot find stack: ' + str(stack_name_request))
+                    finishing_sequence(context, eventname, status='fail', error='Cannot find stack', exception=False)
+                    return False
+                    
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Exception thrown at OpsWorks CreateStack: ')
+            finishing_sequence(context, eventname, status='fail', error=error)
+            return False
+    
+    # processing of CreateStack event for Cloudformation 
+    elif eventsource == 'cloudformation.amazonaws.com':
+        # timesleep(300)
+        # cloudformation_client = client_pool.client('cloudformation', region)
+        
+        # def update_cfn_stack(stack_name: str, tags: list) -> bool:
+        #     try:
+        #         describe_stacks = cloudformation_client.describe_stacks(StackName=stack_name)
+        #         for stack in describe_stacks['Stacks']:
+        #             stack_status = stack['StackStatus']
+                    
+        #             stack_capabilities = list(stack['Capabilities']) if 'Capabilities' in stack else None
+        #             stack_params = list(stack['Parameters']) if 'Parameters' in stack else None
+                    
+        #             if stack_status == 'CREATE_COMPLETE' or stack_status == 'UPDATE_COMPLETE':
+        #                 logger.info(f'Updating Cloudformation stack: (status: {str(stack_status)})')
+                        
+        #                 updating_stack = lambda params, capabils: cloudformation_client.update_stack(StackName=stack_name, UsePreviousTemplate=True, Tags=tags,
+        #                                                     Parameters=params, Capabilities=capabils)
+                        
+        #                 if stack_params and stack_capabilities:
+        #                     logger.info('found stack with parameters and capabilities')
+        #                     print(stack_params)
+        #                     print(stack_capabilities)
+        #                     updating_stack(stack_params, stack_capabilities)
+                            
+        #                 elif stack_params and not stack_capabilities:
+        #                     logger.info('found stack with parameters only')
+        #                     print(stack_params)
+        #                     updating_stack(stack_params, [])
+                            
+        #                 elif not stack_params and stack_capabilities:
+        #                     logger.info('found stack with capabilities only')
+        #                     print(stack_capabilities)
+        #                     updating_stack([], stack_capabilities)
+                            
+        #                 elif not stack_params and not stack_capabilities:
+        #                     logger.info('found stack without parameters and capabilities')
+        #                     updating_stack([], [])
+                        
+        #                 return True
+                            
+        #             else:
+        #                 logger.error(f'Cannot update Cloudformation stack due to the current stack status: {str(stack_status)}')
+        #                 return False
+                    
+        #     except Exception as error:
+        #         logger.error(f'Error message: {str(error)}')
+        #         logger.exception('Exception thrown at Cloudformation CreateStack update_cfn_stack: ')
+        #         finishing_sequence(context, eventname, status='fail', error=error)
+        #         return False
+        
+        try:
+            logger.info('Detected Cloudformation CreateStack event, skipping')
+            pass
+        
+            # stack_name = detail['requestParameters']['stackName']
+            # logger.info(f'Tagging new Cloudformation stack: {str(stack_name)}')
+            
+            # initiliaze TagEvaluator to determine Env and Department tags
+            # tagevaluator = TagEvaluator()
+            # env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(stack_name)
+            
+            # tags_to_add = [
+            #                 {'Key': 'cfn:stack:name', 'Value': stack_name},
+            #                 {'Key': 'cfn:stack:resource', 'Value': 'true'},
+            #                 {'Key': 'cfn:stack:created-by', 'Value': user},
+            #                 {'Key': 'cfn:stack:created-at', 'Value': event_time},
+            #                 {'Key': 'Env', 'Value': env_tag},
+            #                 {'Key': 'Department', 'Value': dep_tag}
+            #             ]
+            
+            # if 'tags' in detail['requestParameters']:
+            #     logger.info('found predefined stack tags')
+            #     stack_tags = list(detail['requestParameters']['tags'])                       
+                
+            #     if stack_tags:
+            #         new_stack_tags = []
+                
+            #         for item in stack_tags:
+            #             new_stack_tags.append({k.capitalize():v for k,v in item.items()})
+                                                                                                                                                                            
+            #         for item in tags_to_add:
+            #             if item['Key'] in [tag['Key'] for tag in new_stack_tags]:
+            #                 tags_to_add = [tag for tag in tags_to_add if tag.get('Key') != item['Key']]
+                            
+            #         tags = new_stack_tags + tags_to_add
+                
+            #     elif not stack_tags:
+            #         tags = tags_to_add
+                                        
+            # elif 'tags' not in detail['requestParameters']:
+            #     logger.info('not found predefined stack tags')
+            #     tags = tags_to_add
+            
+            # if tags:
+            #     if update_cfn_stack(stack_name, tags) is True:
+            #         logger.error('Stack update succeeded')
+            #         pass
+            #     else:
+            #         logger.error('Stack update failed')
+            #         return False
+            
+            # elif not tags:
+            #     logger.error('Cannot form tags')
+            #     return False
+        
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.exception('Exception thrown at Cloudformation CreateStack: ')
+            finishing_sequence(context, eventname, status='fail', error=error)
+            return False
+
+    return True
+
+@event_handler('opsworks.amazonaws.com', 'CloneStack')
+def opsworks_clone_stack(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CloneStack event"""
+    if eventsource == 'opsworks.amazonaws.com':
+        # Create boto3 client/resource connection
+        opsworks_client = client_pool.client('opsworks', region)
+        try:
+            # get values required for tagging from event details
+            stack_name_request = detail['requestParameters']['stackName']
+            # get info on stacks
+            stacks = opsworks_client.describe_stacks()
+            # iterate over stacks
+            for stack in stacks['Stacks']:
+                stack_name_response = stack['Name']
+                # determine that stack in request is the same as in the event
+                if stack_name_request == stack_name_response:
+                    # get stack arn
+                    stack_arn = stack['Arn']
+                    logger.info(f'Tagging copied OpsWorks stack: {str(stack_name_request)}')
+                    
+                    # initiliaze TagEvaluator to determine Env and Department tags
+                    tagevaluator = TagEvaluator()
+                    env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(stack_name_response)
+                    
+                    # use lambda-python function to apply tags using opsworks_client
+                    tagging = lambda key, value: opsworks_client.tag_resource(ResourceArn=stack_arn, Tags={key: value})
+            
+                    tagging('Name', stack_name_response)
+                    tagging('ClonnedBy', user)
+                    tagging('ClonnedAt', event_time)
+                    tagging('Env', env_tag)
+                    tagging('Department', dep_tag)
+                    
+                else:
+                    logger.error('Cannot find stack: ' + str(stack_name_request))
+                    
+        except Exception as error:
+            logger.error(f'Error message: {str(error)}')
+            logger.error('Exception thrown at OpsWorks CloneStack: ')
+            finishing_sequence(context, eventname, status='fail', error=error)
+            return False
+
+    return True
@@ -0,0 +1,47 @@
+################################################################################
+##    FILE:  	handlers/organizations.py (autotagging-function)              ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of Organizations events loaded on the       ##
+##              first event of the service                                    ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# Organizations events
+@event_handler('organizations.amazonaws.com', 'CreateAccount')
+def organizations_create_account(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateAccount event"""
+    # Create boto3 client/resource connection
+    organizations_client = client_pool.client('organizations', region)
+    try:
+        # get values required for tagging from event details
+        create_account_request_id = detail['responseElements']['createAccountStatus']['id']
+        # get account id using describe_create_account_status boto3 method
+        account_id = organizations_client.describe_create_account_status(CreateAccountRequestId=create_account_request_id)['CreateAccountStatus']['AccountId']
+        # get account id using describe_account boto3 method
+        account_name = organizations_client.describe_account(AccountId=account_id)['Account']['Name']
+        logger.info(f'Tagging new Organizations account: {str(account_name)} (account id: {str(account_id)})')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(account_name)
+        
+        # apply tags using organizations_client
+        organizations_client.tag_resource(ResourceId=account_id, 
+                                Tags=[
+                                    {'Key': 'Name', 'Value': account_name},
+                                    {'Key': 'CreatedBy', 'Value': user},
+                                    {'Key': 'CreatedAt', 'Value': event_time},
+                                    {'Key': 'Env', 'Value': env_tag},
+                                    {'Key': 'Department', 'Value': dep_tag}
+                                    ])
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
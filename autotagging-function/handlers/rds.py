@@ -0,0 +1,175 @@
+################################################################################
+##    FILE:  	handlers/rds.py (autotagging-function)                        ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of RDS events loaded on the first event of  ##
+##              the service                                                   ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, call_async, client_pool, event_handler, finishing_sequence, gather_async, logger, run_async
+
+# RDS events
+@event_handler('rds.amazonaws.com', 'CreateDBInstanceReadReplica')
+def rds_create_db_instance_read_replica(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateDBInstanceReadReplica event"""
+    # Create boto3 client/resource connection
+    rds_client = client_pool.client('rds', region)
+    try:
+        # get values required for tagging from event details
+        db_replica_instance_identifier = detail['responseElements']['dBInstanceIdentifier']
+        db_replica_instance_arn = detail['responseElements']['dBInstanceArn']
+        db_source_instance_arn = detail['requestParameters']['sourceDBInstanceIdentifier']
+        # get db_source_instance_identifier from arn
+        db_source_instance_identifier = db_source_instance_arn.split(":")[6]
+        logger.info(f'Tagging read replica RDS DB instance: {str(db_replica_instance_identifier)} (replica of {str(db_source_instance_identifier)})')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(db_replica_instance_identifier)
+        
+        # apply tags using rds_client
+        rds_client.add_tags_to_resource(ResourceName=db_replica_instance_arn,
+                                        Tags=[
+                                            {'Key': 'Name', 'Value': db_replica_instance_identifier},
+                                            {'Key': 'CreatedBy', 'Value': user},
+                                            {'Key': 'CreatedAt', 'Value': event_time},
+                                            {'Key': 'Env', 'Value': env_tag},
+                                            {'Key': 'Department', 'Value': dep_tag},
+                                            {'Key': 'SourceDB', 'Value': db_source_instance_identifier}
+                                            ]
+                                        )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('rds.amazonaws.com', 'ModifyDBParameterGroup')
+def rds_modify_db_parameter_group(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of ModifyDBParameterGroup event"""
+    # Create boto3 client/resource connection
+    rds_client = client_pool.client('rds', region)
+    try:
+        # get values required for tagging from event details
+        db_param_group_name = detail['requestParameters']['dBParameterGroupName']
+        # get details on db parameter group
+        describe_db_param_group = rds_client.describe_db_parameter_groups(DBParameterGroupName=db_param_group_name)
+        for db_param_group in describe_db_param_group['DBParameterGroups']:
+            # get arn
+            db_param_group_arn = db_param_group['DBParameterGroupArn']
+            logger.info(f'Tagging modified RDS DB Parameter Group: {str(db_param_group_name)} ({str(db_param_group_arn)})')
+
+            # apply tags using rds_client
+            rds_client.add_tags_to_resource(ResourceName=db_param_group_arn,
+                                            Tags=[
+                                                {'Key': 'LastModifiedBy', 'Value': user},
+                                                {'Key': 'LastModifiedAt', 'Value': event_time}
+                                                ]
+                                            )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('rds.amazonaws.com', 'ModifyDBClusterParameterGroup')
+def rds_modify_db_cluster_parameter_group(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of ModifyDBClusterParameterGroup event"""
+    # Create boto3 client/resource connection
+    rds_client = client_pool.client('rds', region)
+    try:
+        # get values required for tagging from event details
+        db_cluster_param_group_name = detail['responseElements']['dBClusterParameterGroupName']
+        # get details on db cluster parameter group to get its arn
+        describe_db_cluster_param_group = rds_client.describe_db_cluster_parameter_groups(DBClusterParameterGroupName=db_cluster_param_group_name)
+        for db_cluster_param_group in describe_db_cluster_param_group['DBClusterParameterGroups']:
+            db_param_group_arn = db_cluster_param_group['DBClusterParameterGroupArn']
+            logger.info(f'Tagging modified RDS DB Cluster Parameter group: {str(db_cluster_param_group_name)}')
+
+            # apply tags using rds_client
+            rds_client.add_tags_to_resource(ResourceName=db_param_group_arn,
+                                            Tags=[
+                                                {'Key': 'LastModifiedBy', 'Value': user},
+                                                {'Key': 'LastModifiedAt', 'Value': event_time}
+                                                ]
+                                            )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('rds.amazonaws.com', 'CreateGlobalCluster')
+def rds_create_global_cluster(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateGlobalCluster event"""
+    # Create boto3 client/resource connection
+    rds_client = client_pool.client('rds', region)
+    try:
+        # get values required for tagging from event details
+        global_cluster_identifier = detail['responseElements']['globalClusterIdentifier']
+        global_cluster_engine = detail['responseElements']['engine']
+        global_cluster_engine_version = detail['responseElements']['engineVersion']
+        logger.info(f'Tagging new RDS global cluster: {str(global_cluster_identifier)} ({str(global_cluster_engine)}-{str(global_cluster_engine_version)})')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(global_cluster_identifier)
+        
+        # get db cluster arn
+        db_cluster_arns = [db_cluster['dBClusterArn'] for db_cluster in detail['responseElements']['globalClusterMembers']]
+        for db_cluster_arn in db_cluster_arns:
+            logger.info(f'Tagging member of RDS global cluster: {str(db_cluster_arn)}')
+            
+        # apply tags using rds_client, all members at the same time
+        run_async(gather_async, *(call_async(rds_client.add_tags_to_resource, ResourceName=db_cluster_arn,
+                                             Tags=[
+                                                {'Key': 'CreatedBy', 'Value': user},
+                                                {'Key': 'ClusterType', 'Value': 'global'},
+                                                {'Key': 'GlobalClusterName', 'Value': global_cluster_identifier},
+                                                {'Key': 'Engine', 'Value': global_cluster_engine},
+                                                {'Key': 'EngineVersion', 'Value': global_cluster_engine_version},
+                                                {'Key': 'Env', 'Value': env_tag},
+                                                {'Key': 'Department', 'Value': dep_tag}
+                                                ]
+                                             ) for db_cluster_arn in db_cluster_arns))
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
+
+@event_handler('rds.amazonaws.com', 'ModifyGlobalCluster')
+def rds_modify_global_cluster(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of ModifyGlobalCluster event"""
+    # Create boto3 client/resource connection
+    rds_client = client_pool.client('rds', region)
+    try:
+        # get values required for tagging from event details
+        global_cluster_identifier = detail['responseElements']['globalClusterIdentifier']
+        logger.info(f'Tagging modified RDS Global Cluster: {str(global_cluster_identifier)}')
+        
+        # get db global cluster arn
+        db_global_cluster_arns = [db_global_cluster['dBClusterArn'] for db_global_cluster in detail['responseElements']['globalClusterMembers']]
+        for db_global_cluster_arn in db_global_cluster_arns:
+            logger.info(f'Tagging modified member of RDS Global Cluster: {str(db_global_cluster_arn)}')
+        
+        # apply tags using rds_client, all members at the same time
+        run_async(gather_async, *(call_async(rds_client.add_tags_to_resource, ResourceName=db_global_cluster_arn,
+                                             Tags=[
+                                                {'Key': 'LastModifiedBy', 'Value': user},
+                                                {'Key': 'LastModifiedAt', 'Value': event_time}
+                                                ]
+                                             ) for db_global_cluster_arn in db_global_cluster_arns))
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
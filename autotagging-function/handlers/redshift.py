@@ -0,0 +1,48 @@
+################################################################################
+##    FILE:  	handlers/redshift.py (autotagging-function)                   ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of Redshift events loaded on the first      ##
+##              event of the service                                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# Redshift events
+@event_handler('redshift.amazonaws.com', 'CreateCluster')
+def redshift_create_cluster(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateCluster event"""
+    # Create boto3 client/resource connection
+    redshift_client = client_pool.client('redshift', region)
+    try:
+        # get values required for tagging from event details
+        cluster_identifier = detail['responseElements']['clusterIdentifier']
+        # get details on clusters
+        describe_clusters = redshift_client.describe_clusters(ClusterIdentifier=cluster_identifier)
+        for cluster in describe_clusters['Clusters']:
+            # get cluster arn
+            cluster_arn = cluster['ClusterNamespaceArn']
+            logger.info(f'Tagging Redshift Cluster: {str(cluster_arn)} ({str(cluster_identifier)})')
+        
+            # initiliaze TagEvaluator to determine Env and Department tags
+            tagevaluator = TagEvaluator()
+            env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(cluster_identifier)
+            
+            # apply tags using redshift_client
+            redshift_client.create_tags(ResourceName=cluster_arn,
+                                            Tags=[
+                                                {'Key': 'Name', 'Value': cluster_identifier},
+                                                {'Key': 'CreatedBy', 'Value': user},
+                                                {'Key': 'Env', 'Value': env_tag},
+                                                {'Key': 'Department', 'Value': dep_tag}
+                                                ]
+                                            )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
@@ -0,0 +1,44 @@
+################################################################################
+##    FILE:  	handlers/secretsmanager.py (autotagging-function)             ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of Secrets Manager events loaded on the     ##
+##              first event of the service                                    ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import re
+from core import TagEvaluator, client_pool, event_handler, finishing_sequence, logger
+
+# Secrets Manager events
+@event_handler('secretsmanager.amazonaws.com', 'CreateSecret')
+def secrets_create_secret(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateSecret event"""
+    # Create boto3 client/resource connection
+    secretsmanager_client = client_pool.client('secretsmanager', region)
+    try:
+        # get values required for tagging from event details
+        secret_name = detail['requestParameters']['name']
+        logger.info(f'Tagging AWS Secret: {str(secret_name)}')
+        
+        # initiliaze TagEvaluator to determine Env and Department tags
+        tagevaluator = TagEvaluator()
+        env_tag, dep_tag = tagevaluator.evaluate_env_and_dep_tags(secret_name)
+        
+        # apply tags using secretsmanager_client
+        secretsmanager_client.tag_resource(SecretId=secret_name,
+                                        Tags=[
+                                            {'Key': 'Name', 'Value': re.sub('[\!\?\;\>\<]','', secret_name)},
+                                            {'Key': 'CreatedBy', 'Value': user},
+                                            {'Key': 'Env', 'Value': env_tag},
+                                            {'Key': 'Department', 'Value': dep_tag}
+                                            ]
+                                        )
+        
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
@@ -0,0 +1,50 @@
+################################################################################
+##    FILE:  	handlers/workspaces.py (autotagging-function)                 ##
+##                                                                            ##
+##    NOTES: 	Contains handlers of AWS WorkSpaces events loaded on the      ##
+##              first event of the service                                    ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+from core import client_pool, event_handler, finishing_sequence, logger
+
+# AWS WorkSpaces events
+@event_handler('workspaces.amazonaws.com', 'CreateWorkspaces')
+def workspaces_create_workspaces(context: object, eventname: str, eventsource: str, detail: dict, detailtype: str, region: str, aws_account_id: str, user: str, session_arn: str, event_time: str) -> bool:
+    """Processing of CreateWorkspaces event"""
+    # Create boto3 client/resource connection           
+    workspaces_client = client_pool.client('workspaces', region)
+    try:
+        # get values required for tagging from event details
+        for id in detail['responseElements']['pendingRequests']:
+            directory_id = id['directoryId']
+            workspace_id = id['workspaceId']
+            logger.info(f'Tagging AWS Directory: {str(directory_id)}')
+            
+            # apply tags to directory using workspaces_client
+            workspaces_client.create_tags(ResourceId=directory_id, 
+                               Tags=[
+                                   {'Key': 'CreatedBy', 'Value': user},
+                                   {'Key': 'CreatedAt', 'Value': event_time},
+                                   {'Key': 'Env', 'Value': 'ops'},
+                                   {'Key': 'Department', 'Value': 'Operations'}
+                                   ])
+            logger.info(f'Tagging AWS Workspace: {str(workspace_id)}')
+            
+            # apply tags to workspace using workspaces_client
+            workspaces_client.create_tags(ResourceId=workspace_id, 
+                               Tags=[
+                                   {'Key': 'CreatedBy', 'Value': user},
+                                   {'Key': 'CreatedAt', 'Value': event_time},
+                                   {'Key': 'Env', 'Value': 'ops'},
+                                   {'Key': 'Department', 'Value': 'Operations'}
+                                     ])
+            
+    except Exception as error:
+        finishing_sequence(context, eventname, status='fail', error=error)
+        return False
+
+    return True
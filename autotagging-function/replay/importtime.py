@@ -0,0 +1,193 @@
+################################################################################
+##    FILE:  	importtime.py (autotagging-function)                          ##
+##                                                                            ##
+##    NOTES: 	Profiles cold start of the function: python -X importtime     ##
+##              report of "import main", import time of every handler module  ##
+##              and creation time of warm-up clients                          ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+
+REPLAY_DIR = os.path.dirname(os.path.abspath(__file__))
+FUNCTION_DIR = os.path.dirname(REPLAY_DIR)
+
+# modules of the function itself; everything else comes from the runtime
+OWN_MODULES = ('main', 'core', 'env_classifier', 'resource_graph', 'tag_rules', 'handlers')
+
+# measured in a fresh interpreter after "import main": seconds of every handler module import and of first client of warm-up services
+FIRST_EVENT_PROBE = '''
+import importlib, json, sys
+from time import perf_counter
+import core, main
+modules = {}
+for module in sorted(set(core.HANDLER_MODULES.values())):
+    started = perf_counter()
+    importlib.import_module(module)
+    modules[module] = perf_counter() - started
+clients = {}
+for service in sys.argv[1:]:
+    started = perf_counter()
+    core.client_pool.client(service, 'us-east-1')
+    clients[service] = perf_counter() - started
+print(json.dumps({'modules': modules, 'clients': clients}))
+'''
+
+def cold_environment() -> dict:
+    """
+    Environment of a cold container: no warm-up, no credentials needed, quiet logs
+
+    Returns:
+        dict: environment variables of profiled interpreters
+    """
+    env = dict(os.environ)
+    env.pop('AWS_REGION', None)
+    env.update({
+        'AWS_DEFAULT_REGION': 'us-east-1',
+        'WARM_UP_CLIENTS': '',
+        'RECHECK_QUEUE_BACKEND': 'none',
+        'EMF_METRICS': 'no',
+        'LOG_LEVEL': 'WARNING',
+    })
+    return env
+
+def clear_bytecode() -> None:
+    """
+    Remove compiled modules of the function, Lambda compiles them from source on every cold start
+
+    Returns:
+        None
+    """
+    for directory in (FUNCTION_DIR, os.path.join(FUNCTION_DIR, 'handlers')):
+        shutil.rmtree(os.path.join(directory, '__pycache__'), ignore_errors=True)
+
+def run_python(args: list) -> subprocess.CompletedProcess:
+    """
+    Run fresh interpreter in function directory without writing bytecode of the function
+
+    Args:
+        args (list): interpreter arguments
+
+    Returns:
+        subprocess.CompletedProcess: finished process with captured stdout and stderr
+    """
+    clear_bytecode()
+    process = subprocess.run([sys.executable, '-B'] + args, cwd=FUNCTION_DIR, env=cold_environment(), capture_output=True, text=True)
+    if process.returncode != 0:
+        sys.exit(f'profiled interpreter failed: {process.stderr[-2000:]}')
+    return process
+
+def parse_importtime(stderr: str, root: str = 'main') -> list:
+    """
+    Parse output of python -X importtime, keeping imports done by the root module
+
+    Args:
+        stderr (str): stderr of the interpreter
+        root (str, optional): module imported by the profiled command
+
+    Returns:
+        list: (module, depth below root, self seconds, cumulative seconds) in order of output
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        # a module is reported after all its imports, so the root closes its own subtree
+        if depth == 0 and name.strip() != root:
+            entries = []
+            continue
+        entries.append((name.strip(), depth, int(self_us) / 1e6, int(cumulative_us) / 1e6))
+        if depth == 0:
+            break
+    return entries
+
+def profile(runs: int, services: list) -> dict:
+    """
+    Profile cold start in fresh interpreters, keeping median of every measurement
+
+    Args:
+        runs (int): number of interpreters per measurement
+        services (list): boto3 services of warm-up clients
+
+    Returns:
+        dict: median seconds of import of main, of every imported module and handler module, and of client creation
+    """
+    imports = {}
+    for _ in range(runs):
+        for name, depth, self_s, cumulative_s in parse_importtime(run_python(['-X', 'importtime', '-c', 'import main']).stderr):
+            entry = imports.setdefault(name, {'depth': depth, 'self': [], 'cumulative': []})
+            entry['self'].append(self_s)
+            entry['cumulative'].append(cumulative_s)
+
+    probes = [json.loads(run_python(['-c', FIRST_EVENT_PROBE] + services).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+    return {
+        'imports': {name: {'depth': entry['depth'], 'self': statistics.median(entry['self']), 'cumulative': statistics.median(entry['cumulative'])}
+                    for name, entry in imports.items()},
+        'modules': {module: statistics.median(probe['modules'][module] for probe in probes) for module in probes[0]['modules']},
+        'clients': {service: statistics.median(probe['clients'][service] for probe in probes) for service in services},
+    }
+
+def format_report(result: dict, runs: int, top: int) -> str:
+    """
+    Format profile as text report
+
+    Args:
+        result (dict): output of profile
+        runs (int): number of interpreters per measurement
+        top (int): number of slowest modules listed
+
+    Returns:
+        str: report
+    """
+    imports = result['imports']
+    own = {name: entry for name, entry in imports.items() if name.split('.')[0] in OWN_MODULES}
+    lines = [f'Cold start profile: python {platform.python_version()}, median of {runs} fresh interpreters, bytecode of the function compiled from source', '']
+    lines.append(f'import main (cumulative)                  {imports["main"]["cumulative"] * 1000:9.1f} ms')
+    lines.append(f'  modules of the function (self)          {sum(entry["self"] for entry in own.values()) * 1000:9.1f} ms')
+    for name, entry in sorted(own.items(), key=lambda item: -item[1]['self']):
+        lines.append(f'    {name:<37} {entry["self"] * 1000:9.1f} ms')
+    lines.append('')
+    lines.append(f'Slowest {top} imports of main (cumulative, including nested imports)')
+    nested = [(name, entry) for name, entry in imports.items() if entry['depth'] >= 1]
+    for name, entry in sorted(nested, key=lambda item: -item[1]['cumulative'])[:top]:
+        lines.append(f'  {name:<40} {entry["cumulative"] * 1000:9.1f} ms')
+    lines.append('')
+    lines.append('Handler modules, imported on the first event of their service')
+    for module, seconds in sorted(result['modules'].items(), key=lambda item: -item[1]):
+        lines.append(f'  {module:<40} {seconds * 1000:9.1f} ms')
+    lines.append('')
+    lines.append('First client of warm-up services (created during init with WARM_UP_CLIENTS)')
+    for service, seconds in result['clients'].items():
+        lines.append(f'  {service:<40} {seconds * 1000:9.1f} ms')
+    return '\n'.join(lines) + '\n'
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Profile cold start of the autotagging function with python -X importtime')
+    parser.add_argument('--runs', type=int, default=5, help='number of fresh interpreters per measurement')
+    parser.add_argument('--top', type=int, default=15, help='number of slowest imports listed')
+    parser.add_argument('--clients', default='ec2,elbv2,ecs', help='boto3 services of warm-up clients')
+    parser.add_argument('--output', help='also save report to this file, e.g. replay/importtime.txt')
+    args = parser.parse_args()
+
+    report = format_report(profile(args.runs, [service for service in args.clients.split(',') if service]), args.runs, args.top)
+    print(report, end='')
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(report)
+        print(f'Report saved: {args.output}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,337 @@
+################################################################################
+##    FILE:  	replay.py (autotagging-function)                              ##
+##                                                                            ##
+##    NOTES: 	Replays recorded CloudTrail events through lambda_handler     ##
+##              against moto-mocked AWS with virtualized sleeps, reports      ##
+##              throughput, latency and API call counts per event type and    ##
+##              compares them with a baseline file                            ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+from time import perf_counter
+
+# function runs against mocked AWS: fake credentials, waits inside invocation, no EMF output and quiet logs
+os.environ.update({
+    'AWS_ACCESS_KEY_ID': 'replay',
+    'AWS_SECRET_ACCESS_KEY': 'replay',
+    'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION', 'us-west-2'),
+    'RECHECK_QUEUE_BACKEND': 'none',
+    'EMF_METRICS': 'no',
+    'LOG_LEVEL': os.environ.get('LOG_LEVEL', 'WARNING'),
+})
+
+try:
+    import boto3
+    from moto import mock_aws
+except ImportError as error:
+    sys.exit(f'replay requires boto3 and moto (pip install boto3 moto): {str(error)}')
+
+REPLAY_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(REPLAY_DIR))
+
+# {{kind:name}} or {{kind:name.Attribute}} placeholders of the corpus resolved to ids of mocked resources
+PLACEHOLDER = re.compile(r'\{\{([a-z-]+):([^}.]+)(?:\.([A-Za-z]+))?\}\}')
+
+# growth of virtual waits per event type never reported as regression, seconds
+WAIT_SLACK_S = 1.0
+
+class VirtualClock:
+    """
+    VirtualClock Class replacing sleeps of the function: sleep returns at once and moves monotonic clock forward
+    """
+
+    def __init__(self, monotonic):
+        """
+        main __init__ function
+
+        Args:
+            monotonic (callable): real monotonic clock
+
+        Returns:
+            self
+        """
+        self.real_monotonic = monotonic
+        self.slept = 0.0
+
+    def monotonic(self) -> float:
+        return self.real_monotonic() + self.slept
+
+    def sleep(self, seconds: float) -> None:
+        self.slept += max(seconds, 0)
+
+class Fixtures:
+    """
+    Fixtures Class creating mocked resources referenced by placeholders of the corpus, once per kind and name
+    """
+
+    def __init__(self, region: str):
+        """
+        main __init__ function
+
+        Args:
+            region (str): region of mocked resources
+
+        Returns:
+            self
+        """
+        self.ec2_client = boto3.client('ec2', region_name=region)
+        self.resources = {}
+        self.image_id = self.ec2_client.describe_images(Owners=['amazon'])['Images'][0]['ImageId']
+        self.vpc_id = self.ec2_client.create_vpc(CidrBlock='10.0.0.0/16')['Vpc']['VpcId']
+        self.subnet_id = self.ec2_client.create_subnet(VpcId=self.vpc_id, CidrBlock='10.0.0.0/20')['Subnet']['SubnetId']
+        self.cidr_index = 16
+
+    def get(self, kind: str, name: str) -> dict:
+        """
+        Get attributes of mocked resource, creating it on first use
+
+        Args:
+            kind (str): kind of resource, e.g. "instance"
+            name (str): name of resource; part after "/" only distinguishes resources with the same Name tag
+
+        Returns:
+            dict: attributes of resource, "Id" is used by placeholders without attribute
+        """
+        key = (kind, name)
+        if key not in self.resources:
+            creator = getattr(self, 'create_' + kind.replace('-', '_'), None)
+            if creator is None:
+                raise ValueError(f'Unknown fixture kind: {kind}')
+            self.resources[key] = creator(name.split('/')[0])
+        return self.resources[key]
+
+    def create_instance(self, name: str, tags: bool = True) -> dict:
+        tag_specifications = [{'ResourceType': 'instance', 'Tags': [{'Key': 'Name', 'Value': name}]}] if tags else []
+        instance = self.ec2_client.run_instances(ImageId=self.image_id, MinCount=1, MaxCount=1, SubnetId=self.subnet_id,
+                                                 BlockDeviceMappings=[{'DeviceName': '/dev/sda1', 'Ebs': {'VolumeSize': 8}}],
+                                                 TagSpecifications=tag_specifications)['Instances'][0]
+        return {'Id': instance['InstanceId']}
+
+    def create_bare_instance(self, name: str) -> dict:
+        return self.create_instance(name, tags=False)
+
+    def create_sg(self, name: str) -> dict:
+        return {'Id': self.ec2_client.create_security_group(GroupName=name, Description=name, VpcId=self.vpc_id)['GroupId']}
+
+    def create_vpc(self, name: str) -> dict:
+        return {'Id': self.ec2_client.create_vpc(CidrBlock='10.1.0.0/16')['Vpc']['VpcId']}
+
+    def create_subnet(self, name: str) -> dict:
+        self.cidr_index += 16
+        return {'Id': self.ec2_client.create_subnet(VpcId=self.vpc_id, CidrBlock=f'10.0.{self.cidr_index}.0/20')['Subnet']['SubnetId']}
+
+    def create_volume(self, name: str) -> dict:
+        return {'Id': self.ec2_client.create_volume(AvailabilityZone=self.ec2_client.meta.region_name + 'a', Size=8)['VolumeId']}
+
+    def create_eip(self, name: str) -> dict:
+        address = self.ec2_client.allocate_address(Domain='vpc')
+        return {'Id': address['AllocationId'], 'PublicIp': address['PublicIp']}
+
+    def create_eni(self, name: str) -> dict:
+        sg_id = self.get('sg', name)['Id']
+        eni = self.ec2_client.create_network_interface(SubnetId=self.subnet_id, Groups=[sg_id], Description=name)['NetworkInterface']
+        return {'Id': eni['NetworkInterfaceId']}
+
+def resolve(value, fixtures: Fixtures):
+    """
+    Replace placeholders in strings of recorded event
+
+    Args:
+        value: event or any part of it
+        fixtures (Fixtures): mocked resources
+
+    Returns:
+        value with ids of mocked resources
+    """
+    if isinstance(value, dict):
+        return {key: resolve(item, fixtures) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve(item, fixtures) for item in value]
+    if isinstance(value, str):
+        return PLACEHOLDER.sub(lambda match: fixtures.get(match.group(1), match.group(2))[match.group(3) or 'Id'], value)
+    return value
+
+def load_corpus(path: str) -> list:
+    """
+    Load recorded events, one EventBridge event per line; empty lines and lines starting with # are skipped
+
+    Args:
+        path (str): path of corpus file
+
+    Returns:
+        list: events
+    """
+    with open(path) as corpus_file:
+        return [json.loads(line) for line in corpus_file if line.strip() and not line.lstrip().startswith('#')]
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)] if ordered else 0.0
+
+class Context:
+    """
+    Context Class standing in for Lambda context object
+    """
+    function_name = 'autotag-function-replay'
+    function_version = '$LATEST'
+
+    def get_remaining_time_in_millis(self) -> int:
+        return 360000
+
+def replay(events: list, repeat: int = 1) -> dict:
+    """
+    Feed events through lambda_handler against mocked AWS
+
+    Args:
+        events (list): recorded events
+        repeat (int, optional): number of passes over events; resources are shared between passes like in a warm container
+
+    Returns:
+        dict: report with totals and per event type latency, waits and API call counts
+    """
+    with mock_aws():
+        import core
+        import main
+
+        clock = VirtualClock(main.monotonic)
+        main.monotonic = core.monotonic = clock.monotonic
+        core.timesleep = clock.sleep
+        # same jitter of backoff delays on every run
+        random.seed(0)
+
+        # "<service>.<operation>" -> number of calls made by pooled clients while processing current event
+        calls = {}
+
+        def count_call(event_name: str, **kwargs) -> None:
+            operation = event_name.split('.', 1)[1]
+            calls[operation] = calls.get(operation, 0) + 1
+
+        core.client_pool.register('before-call', count_call)
+
+        fixtures = {}
+        stats = {}
+        started = perf_counter()
+        for _ in range(repeat):
+            for recorded in events:
+                region = recorded.get('region', os.environ['AWS_DEFAULT_REGION'])
+                if region not in fixtures:
+                    fixtures[region] = Fixtures(region)
+                event = resolve(recorded, fixtures[region])
+                eventname = event['detail']['eventName']
+
+                calls.clear()
+                slept = clock.slept
+                event_started = perf_counter()
+                processed = main.lambda_handler(event, Context())
+                elapsed = perf_counter() - event_started
+
+                event_stats = stats.setdefault(eventname, {'events': 0, 'failed': 0, 'latency_ms': [], 'waited_s': 0.0, 'api_calls': {}})
+                event_stats['events'] += 1
+                event_stats['failed'] += int(processed is not True)
+                event_stats['latency_ms'].append(elapsed * 1000)
+                event_stats['waited_s'] += clock.slept - slept
+                for operation, count in calls.items():
+                    event_stats['api_calls'][operation] = event_stats['api_calls'].get(operation, 0) + count
+        wall_time = perf_counter() - started
+
+    report = {'repeat': repeat, 'events': sum(event_stats['events'] for event_stats in stats.values()), 'wall_time_s': round(wall_time, 3), 'event_types': {}}
+    report['throughput_eps'] = round(report['events'] / wall_time, 1) if wall_time else 0.0
+    for eventname, event_stats in sorted(stats.items()):
+        report['event_types'][eventname] = {
+            'events': event_stats['events'],
+            'failed': event_stats['failed'],
+            'p50_ms': round(percentile(event_stats['latency_ms'], 0.5), 3),
+            'p99_ms': round(percentile(event_stats['latency_ms'], 0.99), 3),
+            'waited_s': round(event_stats['waited_s'], 3),
+            'api_calls': dict(sorted(event_stats['api_calls'].items())),
+        }
+    return report
+
+def compare(report: dict, baseline: dict, latency_tolerance: float, latency_slack_ms: float) -> list:
+    """
+    Compare report with baseline
+
+    Args:
+        report (dict): report of current run
+        baseline (dict): report saved with --update-baseline
+        latency_tolerance (float): allowed ratio of p50/p99 to baseline
+        latency_slack_ms (float): latency growth below this many milliseconds is never a regression
+
+    Returns:
+        list: descriptions of regressions
+    """
+    if report['repeat'] != baseline.get('repeat', 1):
+        return [f'baseline was recorded with --repeat {baseline.get("repeat", 1)}, replay ran with --repeat {report["repeat"]}']
+    regressions = []
+    for eventname, expected in baseline.get('event_types', {}).items():
+        actual = report['event_types'].get(eventname)
+        if actual is None:
+            regressions.append(f'{eventname}: missing from replay')
+            continue
+        if actual['failed'] > expected['failed']:
+            regressions.append(f'{eventname}: {actual["failed"]} failed events (baseline {expected["failed"]})')
+        for operation in sorted(set(actual['api_calls']) | set(expected['api_calls'])):
+            count, expected_count = actual['api_calls'].get(operation, 0), expected['api_calls'].get(operation, 0)
+            if count > expected_count:
+                regressions.append(f'{eventname}: {count} {operation} calls (baseline {expected_count})')
+        for key in ('p50_ms', 'p99_ms'):
+            if actual[key] > expected[key] * latency_tolerance and actual[key] - expected[key] > latency_slack_ms:
+                regressions.append(f'{eventname}: {key} {actual[key]:.1f} (baseline {expected[key]:.1f})')
+        # last sleep of a wait is cut at the deadline, which moves with real time spent in mocked calls
+        if actual['waited_s'] > expected['waited_s'] + WAIT_SLACK_S:
+            regressions.append(f'{eventname}: waited {actual["waited_s"]:.3f}s (baseline {expected["waited_s"]:.3f}s)')
+    return regressions
+
+def print_report(report: dict) -> None:
+    print(f'{"event":<40} {"events":>6} {"failed":>6} {"p50 ms":>9} {"p99 ms":>9} {"waited s":>9} {"API calls":>9}')
+    for eventname, event_stats in report['event_types'].items():
+        print(f'{eventname:<40} {event_stats["events"]:>6} {event_stats["failed"]:>6} {event_stats["p50_ms"]:>9.1f} {event_stats["p99_ms"]:>9.1f} '
+              f'{event_stats["waited_s"]:>9.1f} {sum(event_stats["api_calls"].values()):>9}')
+        for operation, count in event_stats['api_calls'].items():
+            print(f'    {operation:<36} {count:>6}')
+    print(f'{report["events"]} events in {report["wall_time_s"]:.3f}s ({report["throughput_eps"]} events/s)')
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Replay recorded CloudTrail events through the autotagging function against mocked AWS')
+    parser.add_argument('--corpus', default=os.path.join(REPLAY_DIR, 'events.jsonl'), help='recorded events, one per line')
+    parser.add_argument('--baseline', default=os.path.join(REPLAY_DIR, 'baseline.json'), help='baseline report')
+    parser.add_argument('--update-baseline', action='store_true', help='save report as new baseline instead of comparing')
+    parser.add_argument('--repeat', type=int, default=1, help='number of passes over the corpus')
+    parser.add_argument('--latency-tolerance', type=float, default=3.0, help='allowed ratio of p50/p99 latency to baseline')
+    parser.add_argument('--latency-slack-ms', type=float, default=50.0, help='latency growth never reported as regression')
+    args = parser.parse_args()
+
+    report = replay(load_corpus(args.corpus), args.repeat)
+    print_report(report)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(report, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        print(f'Baseline saved: {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f'No baseline found: {args.baseline}; run with --update-baseline')
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        regressions = compare(report, json.load(baseline_file), args.latency_tolerance, args.latency_slack_ms)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    if regressions:
+        return 1
+    print('No regressions against baseline')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,481 @@
+################################################################################
+##    FILE:  	resource_graph.py (autotagging-function)                      ##
+##                                                                            ##
+##    NOTES: 	Contains relationship graph of EC2 instances, volumes, ENI's, ##
+##              snapshots and AMI images built from bulk describes, planning  ##
+##              propagation of tags from a resource to its descendants        ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import threading
+from collections import deque
+from time import monotonic
+
+# kinds of resources kept in the graph
+INSTANCE = 'instance'
+VOLUME = 'volume'
+ENI = 'eni'
+SNAPSHOT = 'snapshot'
+IMAGE = 'image'
+
+# id prefix of every kind
+ID_PREFIXES = {'i-': INSTANCE, 'vol-': VOLUME, 'eni-': ENI, 'snap-': SNAPSHOT, 'ami-': IMAGE}
+
+# describe operation, response key and id filter of every kind
+DESCRIBE = {
+    INSTANCE: ('describe_instances', 'Reservations', 'instance-id'),
+    VOLUME: ('describe_volumes', 'Volumes', 'volume-id'),
+    ENI: ('describe_network_interfaces', 'NetworkInterfaces', 'network-interface-id'),
+    SNAPSHOT: ('describe_snapshots', 'Snapshots', 'snapshot-id'),
+    IMAGE: ('describe_images', 'Images', 'image-id'),
+}
+
+# values accepted by one describe filter
+FILTER_MAX_VALUES = 200
+
+# volume id of snapshots copied from another snapshot or imported, which have no source volume
+UNKNOWN_VOLUME_ID = 'vol-ffffffff'
+
+def kind_of(resource_id: str) -> str:
+    """
+    Kind of EC2 resource by its id
+
+    Args:
+        resource_id (str): id of EC2 resource
+
+    Returns:
+        str: INSTANCE, VOLUME, ENI, SNAPSHOT, IMAGE or None
+    """
+    for prefix, kind in ID_PREFIXES.items():
+        if resource_id.startswith(prefix):
+            return kind
+    return None
+
+def tag_dict(tags: list) -> dict:
+    return {tag['Key']: tag.get('Value', '') for tag in tags or ()}
+
+class ResourceGraph:
+    """
+    ResourceGraph Class keeping tags and relationships of EC2 resources of a region:
+    instance -> volumes and ENI's, volume -> snapshots, instance -> AMI images, AMI image -> snapshots
+    """
+
+    def __init__(self, ec2_client: object, owners: list = ('self',), ttl: float = 300, maxsize: int = 4096):
+        """
+        main __init__ function
+
+        Args:
+            ec2_client (object): ec2 boto3 client of the region
+            owners (list, optional): owners of described snapshots and AMI images
+            ttl (float, optional): seconds described tags of a resource are trusted
+            maxsize (int, optional): number of described resources above which expired resources are dropped
+
+        Returns:
+            self
+        """
+        self.ec2_client = ec2_client
+        self.owners = list(owners)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # resource id -> {tag key: tag value} of described resources; resources only known from relationships have no tags
+        self.tags_of = {}
+        # resource id -> monotonic time of describe
+        self.described_at = {}
+        # resource id -> ids of parents/children in order of linking
+        self.parents = {}
+        self.children = {}
+        self.describe_calls = 0
+        # graph is fed from worker threads
+        self.lock = threading.RLock()
+
+    # relationships
+    def link(self, parent_id: str, child_id: str) -> None:
+        with self.lock:
+            self.parents.setdefault(child_id, {})[parent_id] = None
+            self.children.setdefault(parent_id, {})[child_id] = None
+
+    def unlink(self, parent_id: str, child_id: str) -> None:
+        with self.lock:
+            self.parents.get(child_id, {}).pop(parent_id, None)
+            self.children.get(parent_id, {}).pop(child_id, None)
+
+    def set_children(self, parent_id: str, kind: str, child_ids: list) -> None:
+        """
+        Replace children of a kind of resource with the described ones
+
+        Args:
+            parent_id (str): id of parent resource
+            kind (str): kind of children
+            child_ids (list): ids of current children
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for child_id in [child_id for child_id in self.children.get(parent_id, {}) if kind_of(child_id) == kind and child_id not in child_ids]:
+                self.unlink(parent_id, child_id)
+            for child_id in child_ids:
+                self.link(parent_id, child_id)
+
+    def set_parents(self, child_id: str, kind: str, parent_ids: list) -> None:
+        """
+        Replace parents of a kind of resource with the described ones
+
+        Args:
+            child_id (str): id of child resource
+            kind (str): kind of parents
+            parent_ids (list): ids of current parents
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for parent_id in [parent_id for parent_id in self.parents.get(child_id, {}) if kind_of(parent_id) == kind and parent_id not in parent_ids]:
+                self.unlink(parent_id, child_id)
+            for parent_id in parent_ids:
+                self.link(parent_id, child_id)
+
+    def put(self, resource_id: str, tags: list) -> None:
+        with self.lock:
+            self.tags_of[resource_id] = tag_dict(tags)
+            self.described_at[resource_id] = monotonic()
+
+    # feeding from describe responses
+    def add_instances(self, reservations: list) -> list:
+        """
+        Add instances of describe_instances reservations with their volumes and ENI's
+
+        Args:
+            reservations (list): Reservations of describe_instances response
+
+        Returns:
+            list: ids of added instances
+        """
+        instance_ids = []
+        with self.lock:
+            for reservation in reservations:
+                for instance in reservation['Instances']:
+                    instance_id = instance['InstanceId']
+                    instance_ids.append(instance_id)
+                    self.put(instance_id, instance.get('Tags'))
+                    self.set_children(instance_id, VOLUME, [mapping['Ebs']['VolumeId'] for mapping in instance.get('BlockDeviceMappings', []) if 'Ebs' in mapping])
+                    self.set_children(instance_id, ENI, [eni['NetworkInterfaceId'] for eni in instance.get('NetworkInterfaces', [])])
+        return instance_ids
+
+    def add_volumes(self, volumes: list) -> list:
+        """
+        Add volumes of describe_volumes response with instances they are attached to
+
+        Args:
+            volumes (list): Volumes of describe_volumes response
+
+        Returns:
+            list: ids of added volumes
+        """
+        with self.lock:
+            for volume in volumes:
+                self.put(volume['VolumeId'], volume.get('Tags'))
+                self.set_parents(volume['VolumeId'], INSTANCE, [attachment['InstanceId'] for attachment in volume.get('Attachments', [])])
+        return [volume['VolumeId'] for volume in volumes]
+
+    def add_interfaces(self, interfaces: list) -> list:
+        """
+        Add ENI's of describe_network_interfaces response with instances they are attached to
+
+        Args:
+            interfaces (list): NetworkInterfaces of describe_network_interfaces response
+
+        Returns:
+            list: ids of added ENI's
+        """
+        with self.lock:
+            for eni in interfaces:
+                self.put(eni['NetworkInterfaceId'], eni.get('TagSet'))
+                instance_id = eni.get('Attachment', {}).get('InstanceId')
+                self.set_parents(eni['NetworkInterfaceId'], INSTANCE, [instance_id] if instance_id else [])
+        return [eni['NetworkInterfaceId'] for eni in interfaces]
+
+    def add_snapshots(self, snapshots: list) -> list:
+        """
+        Add snapshots of describe_snapshots response with volumes they are taken from
+
+        Args:
+            snapshots (list): Snapshots of describe_snapshots response
+
+        Returns:
+            list: ids of added snapshots
+        """
+        with self.lock:
+            for snapshot in snapshots:
+                self.put(snapshot['SnapshotId'], snapshot.get('Tags'))
+                volume_id = snapshot.get('VolumeId')
+                self.set_parents(snapshot['SnapshotId'], VOLUME, [volume_id] if volume_id and volume_id != UNKNOWN_VOLUME_ID else [])
+        return [snapshot['SnapshotId'] for snapshot in snapshots]
+
+    def add_images(self, images: list) -> list:
+        """
+        Add AMI images of describe_images response with their EBS snapshots
+
+        Args:
+            images (list): Images of describe_images response
+
+        Returns:
+            list: ids of added images
+        """
+        with self.lock:
+            for image in images:
+                self.put(image['ImageId'], image.get('Tags'))
+                self.set_children(image['ImageId'], SNAPSHOT, [mapping['Ebs']['SnapshotId'] for mapping in image.get('BlockDeviceMappings', []) if mapping.get('Ebs', {}).get('SnapshotId')])
+        return [image['ImageId'] for image in images]
+
+    # loading
+    def fresh(self, resource_id: str) -> bool:
+        described_at = self.described_at.get(resource_id)
+        return described_at is not None and monotonic() - described_at < self.ttl
+
+    def load_filter(self, kind: str, filters: list) -> list:
+        """
+        Describe resources of a kind matching filters with one paginated call and add them to the graph
+
+        Args:
+            kind (str): kind of resources
+            filters (list): describe filters
+
+        Returns:
+            list: ids of described resources
+        """
+        operation, key, _ = DESCRIBE[kind]
+        params = {'Filters': filters}
+        if kind == SNAPSHOT:
+            params['OwnerIds'] = self.owners
+        elif kind == IMAGE:
+            params['Owners'] = self.owners
+        add = {INSTANCE: self.add_instances, VOLUME: self.add_volumes, ENI: self.add_interfaces, SNAPSHOT: self.add_snapshots, IMAGE: self.add_images}[kind]
+
+        resource_ids = []
+        for page in self.ec2_client.get_paginator(operation).paginate(**params):
+            self.describe_calls += 1
+            resource_ids += add(page[key])
+        if len(self.described_at) > self.maxsize:
+            self.prune()
+        return resource_ids
+
+    def load(self, kind: str, resource_ids: list, force: bool = False) -> list:
+        """
+        Describe resources of a kind which are not fresh in the graph, FILTER_MAX_VALUES ids per call
+
+        Args:
+            kind (str): kind of resources
+            resource_ids (list): ids of resources
+            force (bool, optional): describe fresh resources as well
+
+        Returns:
+            list: ids of resources known to exist; unknown or deleted resources are left out
+        """
+        resource_ids = list(dict.fromkeys(resource_ids))
+        missing = [resource_id for resource_id in resource_ids if force or not self.fresh(resource_id)]
+        for start in range(0, len(missing), FILTER_MAX_VALUES):
+            # filter does not fail on unknown ids, unlike ids parameter
+            self.load_filter(kind, [{'Name': DESCRIBE[kind][2], 'Values': missing[start:start + FILTER_MAX_VALUES]}])
+        return [resource_id for resource_id in resource_ids if resource_id in self.tags_of]
+
+    def load_children(self, kind: str, parent_ids: list) -> list:
+        """
+        Describe snapshots of volumes or AMI images of snapshots with one call per FILTER_MAX_VALUES parents
+
+        Args:
+            kind (str): SNAPSHOT or IMAGE
+            parent_ids (list): ids of volumes or snapshots
+
+        Returns:
+            list: ids of described children
+        """
+        name = {SNAPSHOT: 'volume-id', IMAGE: 'block-device-mapping.snapshot-id'}[kind]
+        parent_ids = list(dict.fromkeys(parent_ids))
+        child_ids = []
+        for start in range(0, len(parent_ids), FILTER_MAX_VALUES):
+            child_ids += self.load_filter(kind, [{'Name': name, 'Values': parent_ids[start:start + FILTER_MAX_VALUES]}])
+        return child_ids
+
+    def invalidate(self, *resource_ids: str) -> None:
+        """
+        Forget described tags of resources, e.g. after they are written; relationships are kept until resources are described again
+
+        Args:
+            resource_ids (str): ids of resources
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for resource_id in resource_ids:
+                self.tags_of.pop(resource_id, None)
+                self.described_at.pop(resource_id, None)
+
+    def prune(self) -> None:
+        """
+        Drop expired resources together with their relationships
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for resource_id in [resource_id for resource_id in self.described_at if not self.fresh(resource_id)]:
+                for parent_id in list(self.parents.get(resource_id, ())):
+                    self.unlink(parent_id, resource_id)
+                for child_id in list(self.children.get(resource_id, ())):
+                    self.unlink(resource_id, child_id)
+                self.parents.pop(resource_id, None)
+                self.children.pop(resource_id, None)
+                self.invalidate(resource_id)
+
+    # queries answered in memory
+    def tags(self, resource_id: str) -> dict:
+        """
+        Described tags of resource
+
+        Args:
+            resource_id (str): id of resource
+
+        Returns:
+            dict: tag key -> value or None if tags of resource are not known
+        """
+        tags = self.tags_of.get(resource_id)
+        return dict(tags) if tags is not None else None
+
+    def parents_of(self, resource_id: str, kind: str = None) -> list:
+        return [parent_id for parent_id in self.parents.get(resource_id, ()) if kind is None or kind_of(parent_id) == kind]
+
+    def parent(self, resource_id: str, kind: str = None) -> str:
+        parent_ids = self.parents_of(resource_id, kind)
+        return parent_ids[0] if parent_ids else None
+
+    def ancestor(self, resource_id: str, kind: str = None) -> str:
+        """
+        Nearest ancestor of a kind, e.g. instance of a snapshot taken from its volume
+
+        Args:
+            resource_id (str): id of resource
+            kind (str, optional): kind of ancestor; the most distant ancestor along first parents if None
+
+        Returns:
+            str: id of ancestor or None
+        """
+        if kind is None:
+            seen = {resource_id}
+            while self.parent(resource_id) and self.parent(resource_id) not in seen:
+                resource_id = self.parent(resource_id)
+                seen.add(resource_id)
+            return resource_id if len(seen) > 1 else None
+
+        queue = deque(self.parents.get(resource_id, ()))
+        seen = set(queue)
+        while queue:
+            parent_id = queue.popleft()
+            if kind_of(parent_id) == kind:
+                return parent_id
+            for grandparent_id in self.parents.get(parent_id, ()):
+                if grandparent_id not in seen:
+                    seen.add(grandparent_id)
+                    queue.append(grandparent_id)
+        return None
+
+    def descendants(self, resource_id: str, kinds: tuple = None) -> list:
+        """
+        Descendants of resource, nearest first, e.g. volumes, ENI's, snapshots and AMI images of an instance
+
+        Args:
+            resource_id (str): id of resource
+            kinds (tuple, optional): kinds of returned descendants; all kinds if None
+
+        Returns:
+            list: ids of descendants
+        """
+        found = []
+        queue = deque([resource_id])
+        seen = {resource_id}
+        while queue:
+            for child_id in self.children.get(queue.popleft(), ()):
+                if child_id not in seen:
+                    seen.add(child_id)
+                    queue.append(child_id)
+                    if kinds is None or kind_of(child_id) in kinds:
+                        found.append(child_id)
+        return found
+
+    def find(self, kind: str, tags: dict, load: bool = False) -> list:
+        """
+        Fresh resources of a kind having all given tag values
+
+        Args:
+            kind (str): kind of resources
+            tags (dict): tag key -> value
+            load (bool, optional): if nothing is found, describe resources by tag filters once and search again
+
+        Returns:
+            list: ids of resources
+        """
+        def matches() -> list:
+            return [resource_id for resource_id, resource_tags in list(self.tags_of.items())
+                    if kind_of(resource_id) == kind and self.fresh(resource_id) and all(resource_tags.get(key) == value for key, value in tags.items())]
+
+        found = matches()
+        if not found and load:
+            self.load_filter(kind, [{'Name': f'tag:{key}', 'Values': [value]} for key, value in tags.items()])
+            found = matches()
+        return found
+
+    # propagation
+    def plan(self, resource_id: str, rules: dict, tags: dict = None) -> dict:
+        """
+        Desired tags of descendants of resource, evaluated top-down so that every resource inherits planned tags of its parent
+
+        Args:
+            resource_id (str): id of resource tags are propagated from
+            rules (dict): kind -> callable(tags of parent, known tags of resource or None) returning desired tags of resource;
+                          descendants of kinds without rule are neither tagged nor traversed
+            tags (dict, optional): tags of resource itself; its described tags if None
+
+        Returns:
+            dict: resource id -> desired tags; resources which should get no tags are left out
+        """
+        planned = {resource_id: dict(tags if tags is not None else self.tags(resource_id) or {})}
+        desired = {}
+        queue = deque([resource_id])
+        while queue:
+            parent_id = queue.popleft()
+            for child_id in self.children.get(parent_id, ()):
+                rule = rules.get(kind_of(child_id))
+                if rule is None or child_id in planned:
+                    continue
+                current = self.tags(child_id)
+                child_tags = dict(rule(planned[parent_id], current) or {})
+                planned[child_id] = dict(current or {}, **child_tags)
+                if child_tags:
+                    desired[child_id] = child_tags
+                queue.append(child_id)
+        return desired
+
+    def changes(self, plan: dict) -> dict:
+        """
+        Diff planned tags against described tags, grouping resources getting identical changes
+
+        Args:
+            plan (dict): resource id -> desired tags
+
+        Returns:
+            dict: tuple of changed (tag key, value) pairs -> ids of resources; all desired tags of resources with unknown tags
+        """
+        groups = {}
+        for resource_id, desired in plan.items():
+            current = self.tags(resource_id) or {}
+            changed = tuple((key, value) for key, value in desired.items() if current.get(key) != value)
+            if changed:
+                groups.setdefault(changed, []).append(resource_id)
+        return groups
+
+    def stats(self) -> str:
+        return f'resource graph: {len(self.tags_of)} described resources, {sum(map(len, self.children.values()))} relationships, {self.describe_calls} describe calls'
@@ -0,0 +1,264 @@
+################################################################################
+##    FILE:  	sweep.py (autotagging-function)                               ##
+##                                                                            ##
+##    NOTES: 	Contains scheduled sweep finding resources of all types       ##
+##              missing required tags with Resource Groups Tagging API and    ##
+##              tagging them in batches                                       ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+import json
+import os
+from time import monotonic, time
+from core import TagEvaluator, finishing_sequence, client_pool, logger, metrics
+
+# tags every resource has to carry; resources missing any of them are tagged by the sweep
+SWEEP_REQUIRED_TAGS = [key.strip() for key in os.environ.get('SWEEP_REQUIRED_TAGS', 'Env,Department,Owner').split(',') if key.strip()]
+# resource types swept, e.g. "ec2:instance,rds,s3"; all types supported by Resource Groups Tagging API if empty
+SWEEP_RESOURCE_TYPES = [resource_type.strip() for resource_type in os.environ.get('SWEEP_RESOURCE_TYPES', '').split(',') if resource_type.strip()]
+# regions swept; region of the function if empty
+SWEEP_REGIONS = [region.strip() for region in os.environ.get('SWEEP_REGIONS', '').split(',') if region.strip()]
+# only log tags the sweep would apply
+SWEEP_DRY_RUN = os.environ.get('SWEEP_DRY_RUN', 'no').lower() in ('yes', 'true', '1')
+# sweep stops paging once less time than this is left of the invocation, seconds; the next run resumes from the saved PaginationToken
+SWEEP_TIME_RESERVE = float(os.environ.get('SWEEP_TIME_RESERVE', 30))
+# seconds between starts of full sweeps of a region by scheduled runs; scheduled runs in between only resume stopped sweeps
+SWEEP_INTERVAL = float(os.environ.get('SWEEP_INTERVAL', 86400))
+# prefix of SSM parameters keeping progress of the sweep of every region between runs; progress is not kept if empty
+SWEEP_STATE_PARAMETER = os.environ.get('SWEEP_STATE_PARAMETER', '/autotagging/sweep').rstrip('/')
+
+# GetResources PaginationToken is valid for 15 minutes, older saved tokens are dropped
+PAGINATION_TOKEN_TTL = 840
+
+# ARNs accepted by one TagResources call
+TAG_RESOURCES_MAX_ARNS = 20
+# resources returned by one GetResources page
+GET_RESOURCES_PAGE_SIZE = 100
+
+def resource_name(arn: str, tags: dict) -> str:
+    """
+    Name of the resource Env tag is evaluated from: Name tag or the last part of its ARN
+
+    Args:
+        arn (str): ARN of the resource
+        tags (dict): current tags of the resource
+
+    Returns:
+        str: resource name
+    """
+    if tags.get('Name'):
+        return tags['Name']
+    resource = arn.split(':', 5)[-1]
+    return resource.replace(':', '/').rstrip('/').split('/')[-1]
+
+def missing_tags(arn: str, tags: dict, required: list = SWEEP_REQUIRED_TAGS) -> dict:
+    """
+    Evaluate required tags the resource is missing with the evaluator of the event path
+
+    Args:
+        arn (str): ARN of the resource
+        tags (dict): current tags of the resource
+        required (list, optional): required tag keys
+
+    Returns:
+        dict: tag key -> value of tags to apply; tags which cannot be evaluated are left out
+    """
+    missing = [key for key in required if not tags.get(key)]
+    if not missing:
+        return {}
+    # existing Env tag is kept and only completed with its Department
+    env_tag = tags.get('Env') or TagEvaluator.determine_env_tag_with_regex(resource_name(arn, tags))
+    evaluated = {
+        'Env': env_tag,
+        'Department': TagEvaluator.determine_department_tag(env_tag) if env_tag else None,
+        # owner of a resource created before it was tagged on creation is only known from CreatedBy tag
+        'Owner': tags.get('CreatedBy'),
+    }
+    return {key: evaluated[key] for key in missing if evaluated.get(key)}
+
+def tag_resources(tagging_client: object, arns: list, tags: dict, dry_run: bool = SWEEP_DRY_RUN) -> dict:
+    """
+    Apply the same tags to resources, TAG_RESOURCES_MAX_ARNS resources per call
+
+    Args:
+        tagging_client (object): resourcegroupstaggingapi boto3 client
+        arns (list): ARNs of resources
+        tags (dict): tag key -> value
+        dry_run (bool, optional): only log tags
+
+    Returns:
+        dict: ARN -> error message of resources which could not be tagged
+    """
+    failed = {}
+    for index in range(0, len(arns), TAG_RESOURCES_MAX_ARNS):
+        batch = arns[index:index + TAG_RESOURCES_MAX_ARNS]
+        logger.info(f'{"Would tag" if dry_run else "Tagging"} {len(batch)} resources with {tags}: {", ".join(batch)}')
+        if dry_run:
+            continue
+        response = tagging_client.tag_resources(ResourceARNList=batch, Tags=tags)
+        for arn, failure in response.get('FailedResourcesMap', {}).items():
+            failed[arn] = f'{failure.get("ErrorCode")}: {failure.get("ErrorMessage")}'
+    return failed
+
+def load_sweep_state(region: str) -> dict:
+    """
+    Progress of the sweep of a region saved by the previous run
+
+    Args:
+        region (str): swept region
+
+    Returns:
+        dict: PaginationToken and time it was saved at, time the last full sweep completed at; empty if nothing is saved
+    """
+    ssm_client = client_pool.client('ssm', os.environ.get('AWS_REGION'))
+    try:
+        return json.loads(ssm_client.get_parameter(Name=f'{SWEEP_STATE_PARAMETER}/{region}')['Parameter']['Value'])
+    except ssm_client.exceptions.ParameterNotFound:
+        return {}
+
+def save_sweep_state(region: str, state: dict) -> None:
+    """
+    Save progress of the sweep of a region for the next run
+
+    Args:
+        region (str): swept region
+        state (dict): PaginationToken, saved_at and completed_at
+
+    Returns:
+        None
+    """
+    ssm_client = client_pool.client('ssm', os.environ.get('AWS_REGION'))
+    ssm_client.put_parameter(Name=f'{SWEEP_STATE_PARAMETER}/{region}', Value=json.dumps(state), Type='String', Overwrite=True)
+
+def sweep_region(region: str, resource_types: list = SWEEP_RESOURCE_TYPES, dry_run: bool = SWEEP_DRY_RUN, deadline: float = None, pagination_token: str = '') -> dict:
+    """
+    Find resources of a region missing required tags and tag them, grouping resources with the same missing tags
+
+    Args:
+        region (str): region to sweep
+        resource_types (list, optional): ResourceTypeFilters of GetResources; all types if empty
+        dry_run (bool, optional): only log tags
+        deadline (float, optional): monotonic time paging stops at
+        pagination_token (str, optional): token of GetResources page to resume from
+
+    Returns:
+        dict: numbers of scanned, tagged, failed resources and of resources missing tags which cannot be evaluated;
+              PaginationToken of the next page if the deadline stopped the sweep
+    """
+    tagging_client = client_pool.client('resourcegroupstaggingapi', region)
+    stats = {'scanned': 0, 'tagged': 0, 'failed': 0, 'unresolved': 0}
+    # (tag key, value) pairs -> ARNs of resources missing exactly these tags
+    pending = {}
+
+    def flush(tags: tuple, arns: list) -> None:
+        failed = tag_resources(tagging_client, arns, dict(tags), dry_run)
+        for arn, error in failed.items():
+            logger.warning(f'Cannot tag {arn}: {error}')
+        stats['failed'] += len(failed)
+        stats['tagged'] += len(arns) - len(failed)
+
+    params = {'ResourcesPerPage': GET_RESOURCES_PAGE_SIZE}
+    if resource_types:
+        params['ResourceTypeFilters'] = resource_types
+    while True:
+        try:
+            page = tagging_client.get_resources(PaginationToken=pagination_token, **params)
+        except tagging_client.exceptions.PaginationTokenExpiredException:
+            # token of a stopped sweep is only valid for a while, sweep starts over then
+            if not pagination_token or stats['scanned']:
+                raise
+            logger.warning(f'Sweep of {region} cannot resume from expired PaginationToken, starting from the first page')
+            pagination_token = ''
+            continue
+        for resource in page.get('ResourceTagMappingList', []):
+            stats['scanned'] += 1
+            tags = {tag['Key']: tag['Value'] for tag in resource.get('Tags', [])}
+            to_add = missing_tags(resource['ResourceARN'], tags)
+            if len(to_add) < len([key for key in SWEEP_REQUIRED_TAGS if not tags.get(key)]):
+                stats['unresolved'] += 1
+            if to_add:
+                pending.setdefault(tuple(sorted(to_add.items())), []).append(resource['ResourceARN'])
+
+        # full batches are tagged while paging, the rest once all pages are read
+        for tags, arns in pending.items():
+            full = len(arns) - len(arns) % TAG_RESOURCES_MAX_ARNS
+            if full:
+                flush(tags, arns[:full])
+                del arns[:full]
+
+        pagination_token = page.get('PaginationToken', '')
+        if not pagination_token:
+            break
+        if deadline is not None and monotonic() > deadline:
+            logger.warning(f'Sweep of {region} stopped before deadline, next page: {pagination_token}')
+            stats['PaginationToken'] = pagination_token
+            break
+
+    for tags, arns in pending.items():
+        if arns:
+            flush(tags, arns)
+    logger.info(f'Swept {region}: {stats["scanned"]} resources scanned, {stats["tagged"]} {"would be " if dry_run else ""}tagged, '
+                f'{stats["failed"]} failed, {stats["unresolved"]} missing tags which cannot be evaluated')
+    return stats
+
+def lambda_handler(event, context) -> dict:
+    """
+    Scheduled sweep of resources missing required tags
+
+    Args:
+        event: scheduled event; "regions", "resource_types", "dry_run" and per region "pagination_tokens" override configuration of a manual run
+        context: a context object to the handler
+
+    Returns:
+        dict: region -> stats of sweep_region
+    """
+    metrics.start_invocation()
+    event = event if isinstance(event, dict) else {}
+    regions = event.get('regions') or SWEEP_REGIONS or [os.environ.get('AWS_REGION')]
+    resource_types = event.get('resource_types', SWEEP_RESOURCE_TYPES)
+    dry_run = bool(event.get('dry_run', SWEEP_DRY_RUN))
+    tokens = event.get('pagination_tokens', {})
+    scheduled = event.get('source') == 'aws.events'
+    # progress of a dry run is not saved, the next run would skip resources which were not tagged
+    keep_state = bool(SWEEP_STATE_PARAMETER) and not dry_run
+    deadline = monotonic() + context.get_remaining_time_in_millis() / 1000 - SWEEP_TIME_RESERVE
+
+    results = {}
+    failures = 0
+    for region in regions:
+        if monotonic() > deadline:
+            logger.warning(f'Sweep of {region} not started before deadline')
+            results[region] = {'skipped': 'deadline'}
+            continue
+        started = monotonic()
+        try:
+            state = load_sweep_state(region) if keep_state else {}
+            token = tokens.get(region, '')
+            if not token and state.get('PaginationToken'):
+                if time() - state.get('saved_at', 0) < PAGINATION_TOKEN_TTL:
+                    token = state['PaginationToken']
+                else:
+                    logger.warning(f'Saved PaginationToken of {region} is expired, starting from the first page')
+            # scheduled runs start a full sweep of a region once per SWEEP_INTERVAL and otherwise only resume it
+            if scheduled and not token and time() - state.get('completed_at', 0) < SWEEP_INTERVAL:
+                results[region] = {'skipped': 'swept recently'}
+                continue
+
+            results[region] = sweep_region(region, resource_types, dry_run, deadline, token)
+            if keep_state:
+                next_token = results[region].get('PaginationToken', '')
+                save_sweep_state(region, {'PaginationToken': next_token, 'saved_at': time(),
+                                          'completed_at': state.get('completed_at', 0) if next_token else time()})
+
+        except Exception as error:
+            failures += 1
+            results[region] = {'error': str(error)}
+            finishing_sequence(context, f'Sweep of {region}', status='fail', error=error)
+        metrics.emit('Sweep', monotonic() - started, processed='error' not in results[region])
+
+    if not failures:
+        finishing_sequence(context, 'Sweep', status='success')
+    return results
@@ -0,0 +1,2583 @@
+################################################################################
+##    FILE:  	tag_rules.py (autotagging-function)                           ##
+##                                                                            ##
+##    NOTES: 	Contains declarative tagging rules of events which only need  ##
+##              values from event details to tag a single resource            ##
+##                                                                            ##
+##    AUTHOR:	Stepan Litsevych                                              ##
+##                                                                            ##
+##    Copyright 2020 - Baxter Planning Systems, Inc. All rights reserved      ##
+################################################################################
+
+# Rules are compiled once at cold start by TagRule (core.py) into handlers registered in EVENT_HANDLERS.
+#
+# Every rule is keyed by the name of its handler and consists of:
+#   events    - (eventSource, eventName) pairs handled by the rule
+#   writer    - "service.method" of TAG_WRITERS used to apply tags
+#   fields    - values taken from event details, in order of evaluation; a value is either a path of keys
+#               and list indices separated by dots, optionally followed by "|split:<separator>:<index>",
+#               or a template built of previously taken values; a "*" step of a path takes the rest of the path
+#               from every item of a list, giving a list of values
+#   resource  - template of the resource parameter of the writer
+#   params    - optional templates of other parameters of the writer
+#   log       - template of the message logged before tagging
+#   env       - optional template of the name Env and Department tags are evaluated from
+#   tags      - tag key -> template of tag value, values are converted to strings
+#   wait      - optional seconds the tagging call is retried for while the resource is not ready to be tagged
+#   wait_errors - optional error codes of the tagging call retried during wait, ResourceInUseException and
+#               ResourceNotFoundException by default; other errors fail the event at once
+#
+# Templates use str.format syntax; besides fields they may refer to {region}, {account}, {user}, {event_time}, {eventname}
+# and, with "env" set, to {env} and {department}. A template consisting of a single {value} passes the value unchanged.
+
+# Tagging call of every service: "service.method" -> (resource parameter, tags parameter, tags format[, resource format])
+# where resource format is "id" (default) or "ids" for calls taking a list of resource ids
+TAG_WRITERS = {
+    'apigateway.tag_resource': ('resourceArn', 'tags', 'map'),
+    'apigatewayv2.tag_resource': ('ResourceArn', 'Tags', 'map'),
+    'appflow.tag_resource': ('resourceArn', 'tags', 'map'),
+    'appsync.tag_resource': ('resourceArn', 'tags', 'map'),
+    'backup.tag_resource': ('ResourceArn', 'Tags', 'map'),
+    'batch.tag_resource': ('resourceArn', 'tags', 'map'),
+    'cloudtrail.add_tags': ('ResourceId', 'TagsList', 'list'),
+    'cloudwatch.tag_resource': ('ResourceARN', 'Tags', 'list'),
+    'codeartifact.tag_resource': ('resourceArn', 'tags', 'list_lower'),
+    'codecommit.tag_resource': ('resourceArn', 'tags', 'map'),
+    'codedeploy.tag_resource': ('ResourceArn', 'Tags', 'list'),
+    'codestar.tag_project': ('id', 'tags', 'map'),
+    'cognito-idp.tag_resource': ('ResourceArn', 'Tags', 'map'),
+    'dynamodb.tag_resource': ('ResourceArn', 'Tags', 'list'),
+    'ec2.create_tags': ('Resources', 'Tags', 'list', 'ids'),
+    'ecr.tag_resource': ('resourceArn', 'tags', 'list'),
+    'ecs.tag_resource': ('resourceArn', 'tags', 'list_lower'),
+    'efs.tag_resource': ('ResourceId', 'Tags', 'list'),
+    'eks.tag_resource': ('resourceArn', 'tags', 'map'),
+    'emr.add_tags': ('ResourceId', 'Tags', 'list'),
+    'events.tag_resource': ('ResourceARN', 'Tags', 'list'),
+    'firehose.tag_delivery_stream': ('DeliveryStreamName', 'Tags', 'list'),
+    'glacier.add_tags_to_vault': ('vaultName', 'Tags', 'map'),
+    'glue.tag_resource': ('ResourceArn', 'TagsToAdd', 'map'),
+    'iam.tag_open_id_connect_provider': ('OpenIDConnectProviderArn', 'Tags', 'list'),
+    'iam.tag_policy': ('PolicyArn', 'Tags', 'list'),
+    'iam.tag_role': ('RoleName', 'Tags', 'list'),
+    'iam.tag_saml_provider': ('SAMLProviderArn', 'Tags', 'list'),
+    'iam.tag_user': ('UserName', 'Tags', 'list'),
+    'kinesis.add_tags_to_stream': ('StreamName', 'Tags', 'map'),
+    'kinesisanalytics.tag_resource': ('ResourceARN', 'Tags', 'list'),
+    'kms.tag_resource': ('KeyId', 'Tags', 'list_tagkey'),
+    'lambda.tag_resource': ('Resource', 'Tags', 'map'),
+    'logs.tag_log_group': ('logGroupName', 'tags', 'map'),
+    'opsworkscm.tag_resource': ('ResourceArn', 'Tags', 'list'),
+    'rds.add_tags_to_resource': ('ResourceName', 'Tags', 'list'),
+    'route53.change_tags_for_resource': ('ResourceId', 'AddTags', 'list'),
+    'route53resolver.tag_resource': ('ResourceArn', 'Tags', 'list'),
+    's3.put_bucket_tagging': ('Bucket', 'Tagging', 'tagset'),
+    'secretsmanager.tag_resource': ('SecretId', 'Tags', 'list'),
+    'servicecatalog.update_portfolio': ('Id', 'AddTags', 'list'),
+    'servicecatalog.update_product': ('Id', 'AddTags', 'list'),
+    'sns.tag_resource': ('ResourceArn', 'Tags', 'list'),
+    'sqs.tag_queue': ('QueueUrl', 'Tags', 'map'),
+    'ssm.add_tags_to_resource': ('ResourceId', 'Tags', 'list'),
+    'stepfunctions.tag_resource': ('resourceArn', 'tags', 'list_lower'),
+}
+
+TAG_RULES = {
+    # AWS Lambda events
+    'lambda_update_function_configuration': {
+        'events': [('lambda.amazonaws.com', 'UpdateFunctionConfiguration20150331v2')],
+        'writer': 'lambda.tag_resource',
+        'fields': {
+            'function_arn': 'responseElements.functionArn',
+            'function_name': 'responseElements.functionName',
+            'last_update_status': 'responseElements.lastUpdateStatus',
+        },
+        'resource': '{function_arn}',
+        'log': 'Tagging updated Lambda function config: {function_name}',
+        'tags': {
+            'LastConfigModifiedBy': '{user}',
+            'LastConfigModifiedAt': '{event_time}',
+            'LastConfigUpdateStatus': '{last_update_status}',
+        },
+    },
+    'lambda_update_function_code': {
+        'events': [('lambda.amazonaws.com', 'UpdateFunctionCode20150331v2')],
+        'writer': 'lambda.tag_resource',
+        'fields': {
+            'function_arn': 'responseElements.functionArn',
+            'function_name': 'responseElements.functionName',
+            'last_update_status': 'responseElements.lastUpdateStatus',
+        },
+        'resource': '{function_arn}',
+        'log': 'Tagging updated Lambda function code: {function_name}',
+        'tags': {
+            'LastCodeModifiedBy': '{user}',
+            'LastCodeModifiedAt': '{event_time}',
+            'LastCodeUpdateStatus': '{last_update_status}',
+        },
+    },
+
+    # Step Functions events
+    'stepfunctions_create_state_machine': {
+        'events': [('states.amazonaws.com', 'CreateStateMachine')],
+        'writer': 'stepfunctions.tag_resource',
+        'fields': {
+            'state_machine_name': 'requestParameters.name',
+            'state_machine_arn': 'responseElements.stateMachineArn',
+        },
+        'resource': '{state_machine_arn}',
+        'log': 'Tagging new Step Function machine: {state_machine_name}',
+        'env': '{state_machine_name}',
+        'tags': {
+            'Name': '{state_machine_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'stepfunctions_update_state_machine': {
+        'events': [('states.amazonaws.com', 'UpdateStateMachine')],
+        'writer': 'stepfunctions.tag_resource',
+        'fields': {
+            'state_machine_name': 'requestParameters.stateMachineArn|split:::6',
+            'state_machine_arn': 'requestParameters.stateMachineArn',
+        },
+        'resource': '{state_machine_arn}',
+        'log': 'Tagging updated Step Function machine: {state_machine_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'stepfunctions_create_activity': {
+        'events': [('states.amazonaws.com', 'CreateActivity')],
+        'writer': 'stepfunctions.tag_resource',
+        'fields': {
+            'activity_name': 'requestParameters.name',
+            'activity_arn': 'responseElements.activityArn',
+        },
+        'resource': '{activity_arn}',
+        'log': 'Tagging new Step Function activity: {activity_name}',
+        'env': '{activity_name}',
+        'tags': {
+            'Name': '{activity_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # AppFlow events
+    'appflow_create_flow': {
+        'events': [('appflow.amazonaws.com', 'CreateFlow')],
+        'writer': 'appflow.tag_resource',
+        'fields': {
+            'appflow_name': 'requestParameters.flowName',
+            'appflow_arn': 'responseElements.flowArn',
+        },
+        'resource': '{appflow_arn}',
+        'log': 'Tagging new appflow Flow: {appflow_name}',
+        'env': '{appflow_name}',
+        'tags': {
+            'Name': '{appflow_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'appflow_update_flow': {
+        'events': [('appflow.amazonaws.com', 'UpdateFlow')],
+        'writer': 'appflow.tag_resource',
+        'fields': {
+            'appflow_name': 'requestParameters.flowName',
+            'appflow_arn': 'arn:aws:appflow:{region}:{account}:flow/{appflow_name}',
+        },
+        'resource': '{appflow_arn}',
+        'log': 'Tagging updated appflow Flow: {appflow_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # Batch events
+    'batch_create_job_queue': {
+        'events': [('batch.amazonaws.com', 'CreateJobQueue')],
+        'writer': 'batch.tag_resource',
+        'fields': {
+            'batch_job_queue_name': 'responseElements.jobQueueName',
+            'batch_job_queue_arn': 'responseElements.jobQueueArn',
+        },
+        'resource': '{batch_job_queue_arn}',
+        'log': 'Tagging new batch Job Queue: {batch_job_queue_name}',
+        'env': '{batch_job_queue_name}',
+        'tags': {
+            'Name': '{batch_job_queue_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'batch_create_compute_environment': {
+        'events': [('batch.amazonaws.com', 'CreateComputeEnvironment')],
+        'writer': 'batch.tag_resource',
+        'fields': {
+            'batch_compute_env_name': 'responseElements.computeEnvironmentName',
+            'batch_compute_env_arn': 'responseElements.computeEnvironmentArn',
+            'batch_compute_env_type': 'requestParameters.computeResources.type',
+        },
+        'resource': '{batch_compute_env_arn}',
+        'log': 'Tagging new batch compute environment: {batch_compute_env_name} (type: {batch_compute_env_type})',
+        'env': '{batch_compute_env_name}',
+        'tags': {
+            'Name': '{batch_compute_env_name}',
+            'Type': '{batch_compute_env_type}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'batch_submit_job': {
+        'events': [('batch.amazonaws.com', 'SubmitJob')],
+        'writer': 'batch.tag_resource',
+        'fields': {
+            'batch_job_name': 'responseElements.jobName',
+            'batch_job_arn': 'responseElements.jobArn',
+            'batch_job_queue': 'requestParameters.jobQueue',
+        },
+        'resource': '{batch_job_arn}',
+        'log': 'Tagging new batch job definition: {batch_job_name} (queue: {batch_job_queue})',
+        'env': '{batch_job_name}',
+        'tags': {
+            'Name': '{batch_job_name}',
+            'Queue': '{batch_job_queue}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'batch_update_job_queue': {
+        'events': [('batch.amazonaws.com', 'UpdateJobQueue')],
+        'writer': 'batch.tag_resource',
+        'fields': {
+            'batch_job_queue_name': 'responseElements.jobQueueName',
+            'batch_job_queue_arn': 'responseElements.jobQueueArn',
+        },
+        'resource': '{batch_job_queue_arn}',
+        'log': 'Tagging updated batch Job Queue: {batch_job_queue_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # Route53 events
+    'route53_create_hosted_zone': {
+        'events': [('route53.amazonaws.com', 'CreateHostedZone')],
+        'writer': 'route53.change_tags_for_resource',
+        'fields': {
+            'hosted_zone_id': 'responseElements.hostedZone.id|split:/:2',
+            'hosted_zone_name': 'responseElements.hostedZone.name',
+        },
+        'resource': '{hosted_zone_id}',
+        'params': {'ResourceType': 'hostedzone'},
+        'log': 'Tagging new route53 hosted zone: {hosted_zone_name}',
+        'tags': {
+            'Name': '{hosted_zone_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'route53_create_health_check': {
+        'events': [('route53.amazonaws.com', 'CreateHealthCheck')],
+        'writer': 'route53.change_tags_for_resource',
+        'fields': {
+            'health_check_id': 'responseElements.healthCheck.id',
+        },
+        'resource': '{health_check_id}',
+        'params': {'ResourceType': 'healthcheck'},
+        'log': 'Tagging new route53 health check: {health_check_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'route53_update_health_check': {
+        'events': [('route53.amazonaws.com', 'UpdateHealthCheck')],
+        'writer': 'route53.change_tags_for_resource',
+        'fields': {
+            'health_check_id': 'responseElements.healthCheck.id',
+        },
+        'resource': '{health_check_id}',
+        'params': {'ResourceType': 'healthcheck'},
+        'log': 'Tagging updated route53 health check: {health_check_id}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # Route53 Resolver events
+    'resolver_create_resolver_rule': {
+        'events': [('route53resolver.amazonaws.com', 'CreateResolverRule')],
+        'writer': 'route53resolver.tag_resource',
+        'fields': {
+            'resolver_rule_arn': 'responseElements.resolverRule.arn',
+            'resolver_rule_name': 'responseElements.resolverRule.name',
+        },
+        'resource': '{resolver_rule_arn}',
+        'log': 'Tagging new route53 resolver rule: {resolver_rule_name}',
+        'tags': {
+            'Name': '{resolver_rule_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'resolver_update_resolver_rule': {
+        'events': [('route53resolver.amazonaws.com', 'UpdateResolverRule')],
+        'writer': 'route53resolver.tag_resource',
+        'fields': {
+            'resolver_rule_arn': 'responseElements.resolverRule.arn',
+            'resolver_rule_name': 'responseElements.resolverRule.name',
+        },
+        'resource': '{resolver_rule_arn}',
+        'log': 'Tagging updated route53 resolver rule: {resolver_rule_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'resolver_create_resolver_endpoint': {
+        'events': [('route53resolver.amazonaws.com', 'CreateResolverEndpoint')],
+        'writer': 'route53resolver.tag_resource',
+        'fields': {
+            'resolver_endpoint_arn': 'responseElements.resolverEndpoint.arn',
+            'resolver_endpoint_name': 'responseElements.resolverEndpoint.name',
+        },
+        'resource': '{resolver_endpoint_arn}',
+        'log': 'Tagging new route53 resolver rule: {resolver_endpoint_name}',
+        'tags': {
+            'Name': '{resolver_endpoint_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'resolver_update_resolver_endpoint': {
+        'events': [('route53resolver.amazonaws.com', 'UpdateResolverEndpoint')],
+        'writer': 'route53resolver.tag_resource',
+        'fields': {
+            'resolver_endpoint_arn': 'responseElements.resolverEndpoint.arn',
+            'resolver_endpoint_name': 'responseElements.resolverEndpoint.name',
+        },
+        'resource': '{resolver_endpoint_arn}',
+        'log': 'Tagging updated route53 resolver rule: {resolver_endpoint_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # RDS events
+    'rds_create_db_instance': {
+        'events': [('rds.amazonaws.com', 'CreateDBInstance')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_instance_identifier': 'responseElements.dBInstanceIdentifier',
+            'db_instance_arn': 'responseElements.dBInstanceArn',
+        },
+        'resource': '{db_instance_arn}',
+        'log': 'Tagging new RDS DB instance: {db_instance_identifier}',
+        'env': '{db_instance_identifier}',
+        'tags': {
+            'Name': '{db_instance_identifier}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'rds_create_db_snapshot': {
+        'events': [('rds.amazonaws.com', 'CreateDBSnapshot')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_snapshot_identifier': 'responseElements.dBSnapshotIdentifier',
+            'db_snapshot_arn': 'responseElements.dBSnapshotArn',
+            'db_instance_identifier': 'responseElements.dBInstanceIdentifier',
+        },
+        'resource': '{db_snapshot_arn}',
+        'log': 'Tagging new DB Instance Snapshot: {db_snapshot_identifier} (taken from {db_instance_identifier} instance)',
+        'env': '{db_snapshot_identifier}',
+        'tags': {
+            'Name': '{db_snapshot_identifier}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+            'SourceDB': '{db_instance_identifier}',
+        },
+    },
+    'rds_create_db_cluster_snapshot': {
+        'events': [('rds.amazonaws.com', 'CreateDBClusterSnapshot')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_cluster_snapshot_identifier': 'responseElements.dBClusterSnapshotIdentifier',
+            'db_cluster_snapshot_arn': 'responseElements.dBClusterSnapshotArn',
+            'db_cluster_identifier': 'responseElements.dBClusterIdentifier',
+        },
+        'resource': '{db_cluster_snapshot_arn}',
+        'log': 'Tagging new DB Cluster Snapshot: {db_cluster_snapshot_identifier} (taken from {db_cluster_identifier} cluster)',
+        'env': '{db_cluster_snapshot_identifier}',
+        'tags': {
+            'Name': '{db_cluster_snapshot_identifier}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+            'SourceDB': '{db_cluster_identifier}',
+        },
+    },
+    'rds_reboot_db_instance': {
+        'events': [('rds.amazonaws.com', 'RebootDBInstance')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_instance_identifier': 'responseElements.dBInstanceIdentifier',
+            'db_instance_arn': 'responseElements.dBInstanceArn',
+        },
+        'resource': '{db_instance_arn}',
+        'log': 'RDS DB instance has been rebooted: {db_instance_identifier}',
+        'tags': {
+            'LastRebootedBy': '{user}',
+            'LastRebootedAt': '{event_time}',
+        },
+    },
+    'rds_start_db_instance': {
+        'events': [('rds.amazonaws.com', 'StartDBInstance')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_instance_identifier': 'responseElements.dBInstanceIdentifier',
+            'db_instance_arn': 'responseElements.dBInstanceArn',
+        },
+        'resource': '{db_instance_arn}',
+        'log': 'RDS DB instance has been started: {db_instance_identifier}',
+        'tags': {
+            'LastStartedBy': '{user}',
+            'LastStartedAt': '{event_time}',
+        },
+    },
+    'rds_stop_db_instance': {
+        'events': [('rds.amazonaws.com', 'StopDBInstance')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_instance_identifier': 'responseElements.dBInstanceIdentifier',
+            'db_instance_arn': 'responseElements.dBInstanceArn',
+        },
+        'resource': '{db_instance_arn}',
+        'log': 'RDS DB instance has been stopped: {db_instance_identifier}',
+        'tags': {
+            'LastStoppedBy': '{user}',
+            'LastStoppedAt': '{event_time}',
+        },
+    },
+    'rds_modify_db_instance': {
+        'events': [('rds.amazonaws.com', 'ModifyDBInstance')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_instance_identifier': 'responseElements.dBInstanceIdentifier',
+            'db_instance_arn': 'responseElements.dBInstanceArn',
+        },
+        'resource': '{db_instance_arn}',
+        'log': 'RDS DB instance has been modified: {db_instance_identifier}',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+    'rds_create_db_subnet_group': {
+        'events': [('rds.amazonaws.com', 'CreateDBSubnetGroup')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_subnet_group_name': 'responseElements.dBSubnetGroupName',
+            'db_subnet_group_arn': 'responseElements.dBSubnetGroupArn',
+        },
+        'resource': '{db_subnet_group_arn}',
+        'log': 'Tagging new RDS DB Subnet Group: {db_subnet_group_name} ({db_subnet_group_arn})',
+        'env': '{db_subnet_group_name}',
+        'tags': {
+            'Name': '{db_subnet_group_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'rds_modify_db_subnet_group': {
+        'events': [('rds.amazonaws.com', 'ModifyDBSubnetGroup')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_subnet_group_name': 'responseElements.dBSubnetGroupName',
+            'db_subnet_group_arn': 'responseElements.dBSubnetGroupArn',
+        },
+        'resource': '{db_subnet_group_arn}',
+        'log': 'Tagging modified RDS DB Subnet Group: {db_subnet_group_name} ({db_subnet_group_arn})',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+    'rds_create_db_parameter_group': {
+        'events': [('rds.amazonaws.com', 'CreateDBParameterGroup')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_param_group_name': 'responseElements.dBParameterGroupName',
+            'db_param_group_arn': 'responseElements.dBParameterGroupArn',
+        },
+        'resource': '{db_param_group_arn}',
+        'log': 'Tagging new RDS DB Parameter Group: {db_param_group_name} ({db_param_group_arn})',
+        'env': '{db_param_group_name}',
+        'tags': {
+            'Name': '{db_param_group_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'rds_create_option_group': {
+        'events': [('rds.amazonaws.com', 'CreateOptionGroup')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_option_group_name': 'responseElements.optionGroupName',
+            'db_option_group_arn': 'responseElements.optionGroupArn',
+        },
+        'resource': '{db_option_group_arn}',
+        'log': 'Tagging new RDS DB Option Group: {db_option_group_name} ({db_option_group_arn})',
+        'env': '{db_option_group_name}',
+        'tags': {
+            'Name': '{db_option_group_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'rds_modify_option_group': {
+        'events': [('rds.amazonaws.com', 'ModifyOptionGroup')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_option_group_name': 'responseElements.optionGroupName',
+            'db_option_group_arn': 'responseElements.optionGroupArn',
+        },
+        'resource': '{db_option_group_arn}',
+        'log': 'Tagging modified RDS DB Option Group: {db_option_group_name} ({db_option_group_arn})',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+    'rds_create_event_subscription': {
+        'events': [('rds.amazonaws.com', 'CreateEventSubscription')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_event_subscription_name': 'responseElements.custSubscriptionId',
+            'db_event_subscription_arn': 'responseElements.eventSubscriptionArn',
+        },
+        'resource': '{db_event_subscription_arn}',
+        'log': 'Tagging new RDS DB Event Subscription: {db_event_subscription_name} ({db_event_subscription_arn})',
+        'env': '{db_event_subscription_name}',
+        'tags': {
+            'Name': '{db_event_subscription_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'rds_modify_event_subscription': {
+        'events': [('rds.amazonaws.com', 'ModifyEventSubscription')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_event_subscription_name': 'responseElements.custSubscriptionId',
+            'db_event_subscription_arn': 'responseElements.eventSubscriptionArn',
+        },
+        'resource': '{db_event_subscription_arn}',
+        'log': 'Tagging modified RDS DB Event Subscription: {db_event_subscription_name} ({db_event_subscription_arn})',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+    'rds_create_db_proxy': {
+        'events': [('rds.amazonaws.com', 'CreateDBProxy')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_proxy_name': 'responseElements.dBProxy.dBProxyName',
+            'db_proxy_arn': 'responseElements.dBProxy.dBProxyArn',
+        },
+        'resource': '{db_proxy_arn}',
+        'log': 'Tagging new RDS DB Proxy: {db_proxy_name} ({db_proxy_arn})',
+        'env': '{db_proxy_name}',
+        'tags': {
+            'Name': '{db_proxy_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'rds_modify_db_proxy': {
+        'events': [('rds.amazonaws.com', 'ModifyDBProxy')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_proxy_name': 'responseElements.dBProxy.dBProxyName',
+            'db_proxy_arn': 'responseElements.dBProxy.dBProxyArn',
+        },
+        'resource': '{db_proxy_arn}',
+        'log': 'Tagging modified RDS DB Proxy: {db_proxy_name} ({db_proxy_arn})',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+    'rds_create_db_cluster_parameter_group': {
+        'events': [('rds.amazonaws.com', 'CreateDBClusterParameterGroup')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_cluster_param_group_name': 'responseElements.dBClusterParameterGroupName',
+            'db_cluster_param_group_arn': 'responseElements.dBClusterParameterGroupArn',
+        },
+        'resource': '{db_cluster_param_group_arn}',
+        'log': 'Tagging new RDS DB Cluster Parameter group: {db_cluster_param_group_name}',
+        'env': '{db_cluster_param_group_name}',
+        'tags': {
+            'Name': '{db_cluster_param_group_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'rds_create_db_cluster': {
+        'events': [('rds.amazonaws.com', 'CreateDBCluster')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_cluster_identifier': 'responseElements.dBClusterIdentifier',
+            'db_cluster_arn': 'responseElements.dBClusterArn',
+            'db_cluster_engine': 'responseElements.engine',
+            'db_cluster_engine_version': 'responseElements.engineVersion',
+        },
+        'resource': '{db_cluster_arn}',
+        'log': 'Tagging new RDS DB cluster: {db_cluster_identifier} ({db_cluster_engine}-{db_cluster_engine_version})',
+        'env': '{db_cluster_identifier}',
+        'tags': {
+            'Name': '{db_cluster_identifier}',
+            'CreatedBy': '{user}',
+            'ClusterType': 'regional',
+            'Env': '{env}',
+            'Engine': '{db_cluster_engine}',
+            'EngineVersion': '{db_cluster_engine_version}',
+            'Department': '{department}',
+        },
+    },
+    'rds_modify_db_cluster': {
+        'events': [('rds.amazonaws.com', 'ModifyDBCluster')],
+        'writer': 'rds.add_tags_to_resource',
+        'fields': {
+            'db_cluster_identifier': 'responseElements.dBClusterIdentifier',
+            'db_cluster_arn': 'responseElements.dBClusterArn',
+        },
+        'resource': '{db_cluster_arn}',
+        'log': 'Tagging modified RDS DB Cluster: {db_cluster_identifier} ({db_cluster_arn})',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+
+    # Secrets Manager events
+    'secrets_update_secret': {
+        'events': [('secretsmanager.amazonaws.com', 'UpdateSecret')],
+        'writer': 'secretsmanager.tag_resource',
+        'fields': {
+            'secret_name': 'requestParameters.secretId',
+        },
+        'resource': '{secret_name}',
+        'log': 'Tagging updated AWS Secret: {secret_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # CodeStar events
+    'codestar_create_project': {
+        'events': [('codestar.amazonaws.com', 'CreateProject')],
+        'writer': 'codestar.tag_project',
+        'fields': {
+            'codestar_project_id': 'responseElements.id',
+            'codestar_project_name': 'requestParameters.name',
+        },
+        'resource': '{codestar_project_id}',
+        'log': 'Tagging new CodeStar project: {codestar_project_name}',
+        'env': '{codestar_project_name}',
+        'tags': {
+            'Name': '{codestar_project_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'codestar_update_project': {
+        'events': [('codestar.amazonaws.com', 'UpdateProject')],
+        'writer': 'codestar.tag_project',
+        'fields': {
+            'codestar_project_id': 'requestParameters.id',
+            'codestar_project_name': 'requestParameters.name',
+        },
+        'resource': '{codestar_project_id}',
+        'log': 'Tagging updated CodeStart project: {codestar_project_name}',
+        'tags': {
+            'LastUpdateBy': '{user}',
+            'LastUpdateAt': '{event_time}',
+        },
+    },
+
+    # CodeArtifact events
+    'codeartifact_create_repository': {
+        'events': [('codeartifact.amazonaws.com', 'CreateRepository')],
+        'writer': 'codeartifact.tag_resource',
+        'fields': {
+            'codeartifact_domain_name': 'responseElements.repository.domainName',
+            'codeartifact_repo_name': 'responseElements.repository.name',
+            'codeartifact_repo_arn': 'responseElements.repository.arn',
+        },
+        'resource': '{codeartifact_repo_arn}',
+        'log': 'Tagging new CodeArtifact repository: {codeartifact_repo_name}',
+        'env': '{codeartifact_repo_name}',
+        'tags': {
+            'Name': '{codeartifact_repo_name}',
+            'Domain': '{codeartifact_domain_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'codeartifact_create_domain': {
+        'events': [('codeartifact.amazonaws.com', 'CreateDomain')],
+        'writer': 'codeartifact.tag_resource',
+        'fields': {
+            'codeartifact_domain_name': 'responseElements.domain.name',
+            'codeartifact_domain_arn': 'responseElements.domain.arn',
+        },
+        'resource': '{codeartifact_domain_arn}',
+        'log': 'Tagging new CodeArtifact domain: {codeartifact_domain_name}',
+        'env': '{codeartifact_domain_name}',
+        'tags': {
+            'Name': '{codeartifact_domain_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'codeartifact_update_repository': {
+        'events': [('codeartifact.amazonaws.com', 'UpdateRepository')],
+        'writer': 'codeartifact.tag_resource',
+        'fields': {
+            'codeartifact_repo_name': 'responseElements.repository.name',
+            'codeartifact_repo_arn': 'responseElements.repository.arn',
+        },
+        'resource': '{codeartifact_repo_arn}',
+        'log': 'Tagging updated CodeArtifact repository: {codeartifact_repo_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # CodeCommit events
+    'codecommit_create_repository': {
+        'events': [('codecommit.amazonaws.com', 'CreateRepository')],
+        'writer': 'codecommit.tag_resource',
+        'fields': {
+            'codecommit_repo_name': 'responseElements.repositoryMetadata.repositoryName',
+            'codecommit_repo_arn': 'responseElements.repositoryMetadata.arn',
+        },
+        'resource': '{codecommit_repo_arn}',
+        'log': 'Tagging new CodeCommit repository: {codecommit_repo_name}',
+        'env': '{codecommit_repo_name}',
+        'tags': {
+            'Name': '{codecommit_repo_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'codecommit_update_repository_name': {
+        'events': [('codecommit.amazonaws.com', 'UpdateRepositoryName')],
+        'writer': 'codecommit.tag_resource',
+        'fields': {
+            'codecommit_repo_new_name': 'requestParameters.newName',
+            'codecommit_repo_arn': 'arn:aws:codecommit:{region}:{account}:{codecommit_repo_new_name}',
+        },
+        'resource': '{codecommit_repo_arn}',
+        'log': 'Tagging updated CodeCommit repository name: {codecommit_repo_new_name}',
+        'tags': {
+            'Name': '{codecommit_repo_new_name}',
+            'NameUpdatedBy': '{user}',
+            'NameUpdatedAt': '{event_time}',
+        },
+    },
+    'codecommit_update_repository_description': {
+        'events': [('codecommit.amazonaws.com', 'UpdateRepositoryDescription')],
+        'writer': 'codecommit.tag_resource',
+        'fields': {
+            'codecommit_repo_name': 'requestParameters.repositoryName',
+            'codecommit_repo_arn': 'arn:aws:codecommit:{region}:{account}:{codecommit_repo_name}',
+        },
+        'resource': '{codecommit_repo_arn}',
+        'log': 'Tagging updated CodeCommit repository description: {codecommit_repo_name}',
+        'tags': {
+            'DescriptionUpdatedBy': '{user}',
+            'DescriptionUpdatedAt': '{event_time}',
+        },
+    },
+
+    # CodeDeploy events
+    'codedeploy_create_application': {
+        'events': [('codedeploy.amazonaws.com', 'CreateApplication')],
+        'writer': 'codedeploy.tag_resource',
+        'fields': {
+            'deploy_app_name': 'requestParameters.applicationName',
+            'deploy_app_arn': 'arn:aws:codedeploy:{region}:{account}:application:{deploy_app_name}',
+        },
+        'resource': '{deploy_app_arn}',
+        'log': 'Tagging new CodeDeploy application: {deploy_app_name}',
+        'env': '{deploy_app_name}',
+        'tags': {
+            'Name': '{deploy_app_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'codedeploy_create_deployment_group': {
+        'events': [('codedeploy.amazonaws.com', 'CreateDeploymentGroup')],
+        'writer': 'codedeploy.tag_resource',
+        'fields': {
+            'deploy_group_name': 'requestParameters.deploymentGroupName',
+            'deploy_app_name': 'requestParameters.applicationName',
+            'deploy_group_arn': 'arn:aws:codedeploy:{region}:{account}:deploymentgroup:{deploy_app_name}/{deploy_group_name}',
+        },
+        'resource': '{deploy_group_arn}',
+        'log': 'Tagging new CodeDeploy deployment group: {deploy_group_name} (connected to application {deploy_app_name})',
+        'env': '{deploy_group_name}',
+        'tags': {
+            'Name': '{deploy_group_name}',
+            'Application': '{deploy_app_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'codedeploy_update_deployment_group': {
+        'events': [('codedeploy.amazonaws.com', 'UpdateDeploymentGroup')],
+        'writer': 'codedeploy.tag_resource',
+        'fields': {
+            'deploy_group_name': 'requestParameters.newDeploymentGroupName',
+            'deploy_app_name': 'requestParameters.applicationName',
+            'deploy_group_arn': 'arn:aws:codedeploy:{region}:{account}:deploymentgroup:{deploy_app_name}/{deploy_group_name}',
+        },
+        'resource': '{deploy_group_arn}',
+        'log': 'Tagging new CodeDeploy deployment group: {deploy_group_name} (connected to application {deploy_app_name})',
+        'env': '{deploy_group_name}',
+        'tags': {
+            'Name': '{deploy_group_name}',
+            'Application': '{deploy_app_name}',
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # API Gateway events
+    'apigateway_create_api': {
+        'events': [('apigateway.amazonaws.com', 'CreateApi')],
+        'writer': 'apigatewayv2.tag_resource',
+        'fields': {
+            'api_name': 'responseElements.name',
+            'api_id': 'responseElements.apiId',
+            'api_type': 'responseElements.protocolType',
+            'api_arn': 'arn:aws:apigateway:{region}::/apis/{api_id}',
+        },
+        'resource': '{api_arn}',
+        'log': 'Tagging new API: {api_name} (type: {api_type})',
+        'env': '{api_name}',
+        'tags': {
+            'Name': '{api_name}',
+            'Protocol': '{api_type}',
+            'Env': '{env}',
+            'Department': '{department}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'apigateway_import_api': {
+        'events': [('apigateway.amazonaws.com', 'ImportApi')],
+        'writer': 'apigatewayv2.tag_resource',
+        'fields': {
+            'api_name': 'responseElements.name',
+            'api_id': 'responseElements.apiId',
+            'api_type': 'responseElements.protocolType',
+            'api_arn': 'arn:aws:apigateway:{region}::/apis/{api_id}',
+        },
+        'resource': '{api_arn}',
+        'log': 'Tagging new imported API: {api_name} (type: {api_type})',
+        'env': '{api_name}',
+        'tags': {
+            'Name': '{api_name}',
+            'Protocol': '{api_type}',
+            'Env': '{env}',
+            'Department': '{department}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'apigateway_update_api': {
+        'events': [('apigateway.amazonaws.com', 'UpdateApi')],
+        'writer': 'apigatewayv2.tag_resource',
+        'fields': {
+            'api_name': 'responseElements.name',
+            'api_id': 'responseElements.apiId',
+            'api_type': 'responseElements.protocolType',
+            'api_arn': 'arn:aws:apigateway:{region}::/apis/{api_id}',
+        },
+        'resource': '{api_arn}',
+        'log': 'Tagging updated API: {api_name} (type: {api_type})',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'apigateway_create_api_key': {
+        'events': [('apigateway.amazonaws.com', 'CreateApiKey')],
+        'writer': 'apigateway.tag_resource',
+        'fields': {
+            'api_key_name': 'responseElements.name',
+            'api_key_id': 'responseElements.id',
+            'api_key_arn': 'arn:aws:apigateway:{region}::/apikeys/{api_key_id}',
+        },
+        'resource': '{api_key_arn}',
+        'log': 'Tagging new API key: {api_key_name}',
+        'env': '{api_key_name}',
+        'tags': {
+            'Name': '{api_key_name}',
+            'Id': '{api_key_id}',
+            'Env': '{env}',
+            'Department': '{department}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'apigateway_update_api_key': {
+        'events': [('apigateway.amazonaws.com', 'UpdateApiKey')],
+        'writer': 'apigateway.tag_resource',
+        'fields': {
+            'api_key_name': 'responseElements.name',
+            'api_key_id': 'responseElements.id',
+            'api_key_arn': 'arn:aws:apigateway:{region}::/apikeys/{api_key_id}',
+        },
+        'resource': '{api_key_arn}',
+        'log': 'Tagging updated API key: {api_key_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'apigateway_create_domain_name': {
+        'events': [('apigateway.amazonaws.com', 'CreateDomainName')],
+        'writer': 'apigatewayv2.tag_resource',
+        'fields': {
+            'domain_name': 'responseElements.domainName',
+            'domain_name_arn': 'arn:aws:apigateway:{region}::/domainnames/{domain_name}',
+        },
+        'resource': '{domain_name_arn}',
+        'log': 'Tagging new API custom domain name: {domain_name}',
+        'tags': {
+            'Name': '{domain_name}',
+            'Env': 'ops',
+            'Department': 'Operations',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'apigateway_update_domain_name': {
+        'events': [('apigateway.amazonaws.com', 'UpdateDomainName')],
+        'writer': 'apigatewayv2.tag_resource',
+        'fields': {
+            'domain_name': 'responseElements.domainName',
+            'domain_name_arn': 'arn:aws:apigateway:{region}::/domainnames/{domain_name}',
+        },
+        'resource': '{domain_name_arn}',
+        'log': 'Tagging updated API custom domain name: {domain_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'apigateway_create_vpc_link': {
+        'events': [('apigateway.amazonaws.com', 'CreateVpcLink')],
+        'writer': 'apigatewayv2.tag_resource',
+        'fields': {
+            'vpc_link_name': 'responseElements.name',
+            'vpc_link_id': 'responseElements.id',
+            'vpc_link_arn': 'arn:aws:apigateway:{region}::/vpclinks/{vpc_link_id}',
+        },
+        'resource': '{vpc_link_arn}',
+        'log': 'Tagging new API VPC link: {vpc_link_name}',
+        'env': '{vpc_link_name}',
+        'tags': {
+            'Name': '{vpc_link_name}',
+            'Id': '{vpc_link_id}',
+            'Env': '{env}',
+            'Department': '{department}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'apigateway_update_vpc_link': {
+        'events': [('apigateway.amazonaws.com', 'UpdateVpcLink')],
+        'writer': 'apigatewayv2.tag_resource',
+        'fields': {
+            'vpc_link_name': 'responseElements.name',
+            'vpc_link_id': 'responseElements.id',
+            'vpc_link_arn': 'arn:aws:apigateway:{region}::/vpclinks/{vpc_link_id}',
+        },
+        'resource': '{vpc_link_arn}',
+        'log': 'Tagging updated API VPC link: {vpc_link_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'apigateway_create_usage_plan': {
+        'events': [('apigateway.amazonaws.com', 'CreateUsagePlan')],
+        'writer': 'apigateway.tag_resource',
+        'fields': {
+            'usage_plan_name': 'responseElements.name',
+            'usage_plan_id': 'responseElements.id',
+            'usage_plan_arn': 'arn:aws:apigateway:{region}::/usageplans/{usage_plan_id}',
+        },
+        'resource': '{usage_plan_arn}',
+        'log': 'Tagging new API usage plan: {usage_plan_name}',
+        'env': '{usage_plan_name}',
+        'tags': {
+            'Name': '{usage_plan_name}',
+            'Id': '{usage_plan_id}',
+            'Env': '{env}',
+            'Department': '{department}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'apigateway_update_usage_plan': {
+        'events': [('apigateway.amazonaws.com', 'UpdateUsagePlan')],
+        'writer': 'apigateway.tag_resource',
+        'fields': {
+            'usage_plan_name': 'responseElements.name',
+            'usage_plan_id': 'responseElements.id',
+            'usage_plan_arn': 'arn:aws:apigateway:{region}::/usageplans/{usage_plan_id}',
+        },
+        'resource': '{usage_plan_arn}',
+        'log': 'Tagging updated API usage plan: {usage_plan_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'apigateway_generate_client_certificate': {
+        'events': [('apigateway.amazonaws.com', 'GenerateClientCertificate')],
+        'writer': 'apigateway.tag_resource',
+        'fields': {
+            'cert_id': 'responseElements.self.clientCertificateId',
+            'cert_arn': 'arn:aws:apigateway:{region}::/clientcertificates/{cert_id}',
+        },
+        'resource': '{cert_arn}',
+        'log': 'Tagging new generated API client certificate: {cert_id}',
+        'tags': {
+            'Id': '{cert_id}',
+            'Env': 'ops',
+            'Department': 'Operations',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'apigateway_update_client_certificate': {
+        'events': [('apigateway.amazonaws.com', 'UpdateClientCertificate')],
+        'writer': 'apigateway.tag_resource',
+        'fields': {
+            'cert_id': 'responseElements.self.clientCertificateId',
+            'cert_arn': 'arn:aws:apigateway:{region}::/clientcertificates/{cert_id}',
+        },
+        'resource': '{cert_arn}',
+        'log': 'Tagging updated API client certificate: {cert_id}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # SSM events
+    'ssm_put_parameter': {
+        'events': [('ssm.amazonaws.com', 'PutParameter')],
+        'writer': 'ssm.add_tags_to_resource',
+        'fields': {
+            'param_name': 'requestParameters.name',
+        },
+        'resource': '{param_name}',
+        'params': {'ResourceType': 'Parameter'},
+        'log': 'Tagging SSM Parameter: {param_name}',
+        'env': '{param_name}',
+        'tags': {
+            'Name': '{param_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'ssm_create_document': {
+        'events': [('ssm.amazonaws.com', 'CreateDocument')],
+        'writer': 'ssm.add_tags_to_resource',
+        'fields': {
+            'document_name': 'requestParameters.name',
+        },
+        'resource': '{document_name}',
+        'params': {'ResourceType': 'Document'},
+        'log': 'Tagging SSM Document: {document_name}',
+        'env': '{document_name}',
+        'tags': {
+            'Name': '{document_name}',
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'ssm_update_document': {
+        'events': [('ssm.amazonaws.com', 'UpdateDocument')],
+        'writer': 'ssm.add_tags_to_resource',
+        'fields': {
+            'document_name': 'requestParameters.name',
+        },
+        'resource': '{document_name}',
+        'params': {'ResourceType': 'Document'},
+        'log': 'Tagging updated SSM Document: {document_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'ssm_update_document_default_version': {
+        'events': [('ssm.amazonaws.com', 'UpdateDocumentDefaultVersion')],
+        'writer': 'ssm.add_tags_to_resource',
+        'fields': {
+            'document_name': 'requestParameters.name',
+        },
+        'resource': '{document_name}',
+        'params': {'ResourceType': 'Document'},
+        'log': 'Tagging updated default version of SSM Document: {document_name}',
+        'tags': {
+            'DefaultVersionUpdatedBy': '{user}',
+            'DefaultVersionUpdatedAt': '{event_time}',
+        },
+    },
+
+    # S3 events
+    's3_create_bucket': {
+        'events': [('s3.amazonaws.com', 'CreateBucket')],
+        'writer': 's3.put_bucket_tagging',
+        'fields': {
+            'bucket_name': 'requestParameters.bucketName',
+        },
+        'resource': '{bucket_name}',
+        'log': 'Tagging new S3 bucket: {bucket_name}',
+        'env': '{bucket_name}',
+        'tags': {
+            'Name': '{bucket_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # Glacier events
+    'glacier_create_vault': {
+        'events': [('glacier.amazonaws.com', 'CreateVault')],
+        'writer': 'glacier.add_tags_to_vault',
+        'fields': {
+            'vault_name': 'requestParameters.vaultName',
+        },
+        'resource': '{vault_name}',
+        'log': 'Tagging new Glacier vault: {vault_name}',
+        'env': '{vault_name}',
+        'tags': {
+            'Name': '{vault_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # ServiceCatalog events
+    'servicecatalog_create_portfolio': {
+        'events': [('servicecatalog.amazonaws.com', 'CreatePortfolio')],
+        'writer': 'servicecatalog.update_portfolio',
+        'fields': {
+            'portfolio_id': 'responseElements.portfolioDetail.id',
+            'portfolio_name': 'responseElements.portfolioDetail.displayName',
+        },
+        'resource': '{portfolio_id}',
+        'params': {'DisplayName': '{portfolio_name}'},
+        'log': 'Tagging new servicecatalog portfolio: {portfolio_name}',
+        'env': '{portfolio_name}',
+        'tags': {
+            'Name': '{portfolio_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'servicecatalog_create_product': {
+        'events': [('servicecatalog.amazonaws.com', 'CreateProduct')],
+        'writer': 'servicecatalog.update_product',
+        'fields': {
+            'product_id': 'responseElements.productViewDetail.productViewSummary.productId',
+            'product_name': 'responseElements.productViewDetail.productViewSummary.name',
+        },
+        'resource': '{product_id}',
+        'params': {'Name': '{product_name}'},
+        'log': 'Tagging new servicecatalog product: {product_name}',
+        'env': '{product_name}',
+        'tags': {
+            'Name': '{product_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'servicecatalog_update_portfolio': {
+        'events': [('servicecatalog.amazonaws.com', 'UpdatePortfolio')],
+        'writer': 'servicecatalog.update_portfolio',
+        'fields': {
+            'portfolio_id': 'responseElements.portfolioDetail.id',
+            'portfolio_name': 'responseElements.portfolioDetail.displayName',
+        },
+        'resource': '{portfolio_id}',
+        'params': {'DisplayName': '{portfolio_name}'},
+        'log': 'Tagging updated servicecatalog portfolio: {portfolio_name}',
+        'tags': {
+            'Name': '{portfolio_name}',
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'servicecatalog_update_product': {
+        'events': [('servicecatalog.amazonaws.com', 'UpdateProduct')],
+        'writer': 'servicecatalog.update_product',
+        'fields': {
+            'product_id': 'responseElements.productViewDetail.productViewSummary.productId',
+            'product_name': 'responseElements.productViewDetail.productViewSummary.name',
+        },
+        'resource': '{product_id}',
+        'params': {'Name': '{product_name}'},
+        'log': 'Tagging updated servicecatalog product: {product_name}',
+        'tags': {
+            'Name': '{product_name}',
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # DynamoDB events
+    'dynamodb_create_table': {
+        'events': [('dynamodb.amazonaws.com', 'CreateTable')],
+        'writer': 'dynamodb.tag_resource',
+        'fields': {
+            'table_arn': 'responseElements.tableDescription.tableArn',
+            'table_name': 'responseElements.tableDescription.tableName',
+        },
+        'resource': '{table_arn}',
+        'log': 'Tagging new DynamoDB table: {table_name}',
+        'env': '{table_name}',
+        'tags': {
+            'Name': '{table_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'dynamodb_create_global_table': {
+        'events': [('dynamodb.amazonaws.com', 'CreateGlobalTable')],
+        'writer': 'dynamodb.tag_resource',
+        'fields': {
+            'global_table_arn': 'responseElements.globalTableDescription.globalTableArn',
+            'global_table_name': 'responseElements.globalTableDescription.globalTableName',
+        },
+        'resource': '{global_table_arn}',
+        'log': 'Tagging new global DynamoDB table: {global_table_name}',
+        'env': '{global_table_name}',
+        'tags': {
+            'Name': '{global_table_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'dynamodb_update_table': {
+        'events': [('dynamodb.amazonaws.com', 'UpdateTable')],
+        'writer': 'dynamodb.tag_resource',
+        'fields': {
+            'table_arn': 'responseElements.tableDescription.tableArn',
+            'table_name': 'responseElements.tableDescription.tableName',
+        },
+        'resource': '{table_arn}',
+        'log': 'Tagging updated DynamoDB table: {table_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'dynamodb_update_global_table': {
+        'events': [('dynamodb.amazonaws.com', 'UpdateGlobalTable')],
+        'writer': 'dynamodb.tag_resource',
+        'fields': {
+            'global_table_arn': 'responseElements.globalTableDescription.globalTableArn',
+            'global_table_name': 'responseElements.globalTableDescription.globalTableName',
+        },
+        'resource': '{global_table_arn}',
+        'log': 'Tagging updated global DynamoDB table: {global_table_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # EMR events
+    'emr_run_job_flow': {
+        'events': [('elasticmapreduce.amazonaws.com', 'RunJobFlow')],
+        'writer': 'emr.add_tags',
+        'fields': {
+            'emr_job_id': 'responseElements.jobFlowId',
+            'emr_name': 'requestParameters.name',
+        },
+        'resource': '{emr_job_id}',
+        'log': 'Tagging EMR job: {emr_job_id} ({emr_name})',
+        'env': '{emr_name}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # IAM events
+    'iam_create_user': {
+        'events': [('iam.amazonaws.com', 'CreateUser')],
+        'writer': 'iam.tag_user',
+        'fields': {
+            'iam_user_name': 'requestParameters.userName',
+        },
+        'resource': '{iam_user_name}',
+        'log': 'Tagging new IAM user: {iam_user_name}',
+        'tags': {
+            'Name': '{iam_user_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'iam_create_role': {
+        'events': [('iam.amazonaws.com', 'CreateRole')],
+        'writer': 'iam.tag_role',
+        'fields': {
+            'iam_role_name': 'requestParameters.roleName',
+        },
+        'resource': '{iam_role_name}',
+        'log': 'Tagging new IAM role: {iam_role_name}',
+        'tags': {
+            'Name': '{iam_role_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'iam_update_role': {
+        'events': [('iam.amazonaws.com', 'UpdateRole')],
+        'writer': 'iam.tag_role',
+        'fields': {
+            'iam_role_name': 'requestParameters.roleName',
+        },
+        'resource': '{iam_role_name}',
+        'log': 'Tagging updated IAM role: {iam_role_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'iam_create_policy': {
+        'events': [('iam.amazonaws.com', 'CreatePolicy')],
+        'writer': 'iam.tag_policy',
+        'fields': {
+            'iam_policy_name': 'responseElements.policy.policyName',
+            'iam_policy_arn': 'responseElements.policy.arn',
+        },
+        'resource': '{iam_policy_arn}',
+        'log': 'Tagging new IAM policy: {iam_policy_name}',
+        'tags': {
+            'Name': '{iam_policy_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'iam_create_policy_version': {
+        'events': [('iam.amazonaws.com', 'CreatePolicyVersion')],
+        'writer': 'iam.tag_policy',
+        'fields': {
+            'iam_policy_arn': 'requestParameters.policyArn',
+            'iam_policy_name': 'requestParameters.policyArn|split:/:1',
+        },
+        'resource': '{iam_policy_arn}',
+        'log': 'Tagging new IAM policy version: {iam_policy_name}',
+        'tags': {
+            'LastVersionUpdatedBy': '{user}',
+            'LastVersionUpdatedAt': '{event_time}',
+        },
+    },
+    'iam_create_open_id_connect_provider': {
+        'events': [('iam.amazonaws.com', 'CreateOpenIDConnectProvider')],
+        'writer': 'iam.tag_open_id_connect_provider',
+        'fields': {
+            'open_id_provider_arn': 'responseElements.openIDConnectProviderArn',
+        },
+        'resource': '{open_id_provider_arn}',
+        'log': 'Tagging new IAM OpenID Connect Provider: {open_id_provider_arn}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'iam_create_saml_provider': {
+        'events': [('iam.amazonaws.com', 'CreateSAMLProvider')],
+        'writer': 'iam.tag_saml_provider',
+        'fields': {
+            'saml_provider_name': 'requestParameters.name',
+            'saml_provider_arn': 'responseElements.SAMLProviderArn',
+        },
+        'resource': '{saml_provider_arn}',
+        'log': 'Tagging new IAM SAML Provider: {saml_provider_arn}',
+        'tags': {
+            'Name': '{saml_provider_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+
+    # AWS KMS events
+    'kms_create_key': {
+        'events': [('kms.amazonaws.com', 'CreateKey')],
+        'writer': 'kms.tag_resource',
+        'fields': {
+            'key_arn': 'responseElements.keyMetadata.arn',
+            'key_id': 'responseElements.keyMetadata.keyId',
+        },
+        'resource': '{key_id}',
+        'log': 'Tagging KMS CMK key: {key_arn}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': 'ops',
+            'Department': 'Operations',
+        },
+    },
+
+    # CloudTrail events
+    'cloudtrail_create_trail': {
+        'events': [('cloudtrail.amazonaws.com', 'CreateTrail')],
+        'writer': 'cloudtrail.add_tags',
+        'fields': {
+            'cloudtrail_arn': 'responseElements.TrailARN',
+            'cloudtrail_name': 'responseElements.Name',
+        },
+        'resource': '{cloudtrail_arn}',
+        'log': 'Tagging created Cloudtrail resource: {cloudtrail_name}',
+        'env': '{cloudtrail_name}',
+        'tags': {
+            'Name': '{cloudtrail_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'cloudtrail_update_trail': {
+        'events': [('cloudtrail.amazonaws.com', 'UpdateTrail')],
+        'writer': 'cloudtrail.add_tags',
+        'fields': {
+            'cloudtrail_arn': 'responseElements.TrailARN',
+            'cloudtrail_name': 'responseElements.Name',
+        },
+        'resource': '{cloudtrail_arn}',
+        'log': 'Tagging updated Cloudtrail resource: {cloudtrail_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # OpsWorksCM events
+    'opsworkscm_create_server': {
+        'events': [('opsworks-cm.amazonaws.com', 'CreateServer')],
+        'writer': 'opsworkscm.tag_resource',
+        'fields': {
+            'server_arn': 'responseElements.server.serverArn',
+            'server_name': 'responseElements.server.serverName',
+        },
+        'resource': '{server_arn}',
+        'log': 'Tagging Chef Automate server: {server_name}',
+        'env': '{server_name}',
+        'tags': {
+            'Name': '{server_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'opsworkscm_update_server': {
+        'events': [('opsworks-cm.amazonaws.com', 'UpdateServer')],
+        'writer': 'opsworkscm.tag_resource',
+        'fields': {
+            'server_arn': 'responseElements.server.serverArn',
+            'server_name': 'responseElements.server.serverName',
+        },
+        'resource': '{server_arn}',
+        'log': 'Tagging updated Chef Automate server: {server_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # EKS & ECS events
+    'eks_create_nodegroup': {
+        'events': [('eks.amazonaws.com', 'CreateNodegroup')],
+        'writer': 'eks.tag_resource',
+        'fields': {
+            'nodegroup_arn': 'responseElements.nodegroup.nodegroupArn',
+            'nodegroup_name': 'responseElements.nodegroup.nodegroupName',
+            'nodegroup_cluster': 'responseElements.nodegroup.clusterName',
+        },
+        'resource': '{nodegroup_arn}',
+        'log': 'Tagging EKS Nodegroup: {nodegroup_name} of cluster: {nodegroup_cluster}',
+        'env': '{nodegroup_name}',
+        'tags': {
+            'Name': '{nodegroup_name}',
+            'Cluster': '{nodegroup_cluster}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'ecs_register_task_definition': {
+        'events': [('ecs.amazonaws.com', 'RegisterTaskDefinition')],
+        'writer': 'ecs.tag_resource',
+        'fields': {
+            'task_definition_arn': 'responseElements.taskDefinition.taskDefinitionArn',
+            'task_definition_family': 'responseElements.taskDefinition.family',
+        },
+        'resource': '{task_definition_arn}',
+        'log': 'Tagging ECS task definition (family): {task_definition_family}',
+        'tags': {
+            'TaskDefinitionFamily': '{task_definition_family}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+
+    # FSx and EFS events
+    'efs_create_mount_target': {
+        'events': [('elasticfilesystem.amazonaws.com', 'CreateMountTarget')],
+        'writer': 'efs.tag_resource',
+        'fields': {
+            'filesystem_id': 'requestParameters.fileSystemId',
+        },
+        'resource': '{filesystem_id}',
+        'log': 'Tagging EFS mount created for: {filesystem_id}',
+        'tags': {
+            'MountAddedBy': '{user}',
+            'MountAddedAt': '{event_time}',
+        },
+    },
+    'efs_create_access_point': {
+        'events': [('elasticfilesystem.amazonaws.com', 'CreateAccessPoint')],
+        'writer': 'efs.tag_resource',
+        'fields': {
+            'access_point_name': 'responseElements.name',
+            'access_point_id': 'responseElements.accessPointId',
+            'filesystem_id': 'responseElements.fileSystemId',
+        },
+        'resource': '{access_point_id}',
+        'log': 'Tagging EFS access point: {access_point_name} (created for {filesystem_id})',
+        'env': '{access_point_name}',
+        'tags': {
+            'Name': '{access_point_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # Cognito events
+    'cognito_create_user_pool': {
+        'events': [('cognito-idp.amazonaws.com', 'CreateUserPool')],
+        'writer': 'cognito-idp.tag_resource',
+        'fields': {
+            'userpool_arn': 'responseElements.userPool.arn',
+            'userpool_name': 'responseElements.userPool.name',
+        },
+        'resource': '{userpool_arn}',
+        'log': 'Tagging Cognito userpool: {userpool_name}',
+        'env': '{userpool_name}',
+        'tags': {
+            'Name': '{userpool_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'cognito_update_user_pool': {
+        'events': [('cognito-idp.amazonaws.com', 'UpdateUserPool')],
+        'writer': 'cognito-idp.tag_resource',
+        'fields': {
+            'userpool_id': 'requestParameters.userPoolId',
+            'userpool_arn': 'arn:aws:cognito-idp:{region}:{account}:userpool/{userpool_id}',
+        },
+        'resource': '{userpool_arn}',
+        'log': 'Tagging updated Cognito userpool: {userpool_id}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # EventBridge events
+    'events_put_rule': {
+        'events': [('events.amazonaws.com', 'PutRule')],
+        'writer': 'events.tag_resource',
+        'fields': {
+            'event_rule_arn': 'responseElements.ruleArn',
+            'event_rule_name': 'requestParameters.name',
+        },
+        'resource': '{event_rule_arn}',
+        'log': 'Tagging new EventBridge rule: {event_rule_name}',
+        'env': '{event_rule_name}',
+        'tags': {
+            'Name': '{event_rule_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # SNS events
+    'sns_create_topic': {
+        'events': [('sns.amazonaws.com', 'CreateTopic')],
+        'writer': 'sns.tag_resource',
+        'fields': {
+            'topic_arn': 'responseElements.topicArn',
+            'topic_name': 'requestParameters.name',
+        },
+        'resource': '{topic_arn}',
+        'log': 'Tagging SNS topic: {topic_name}',
+        'env': '{topic_name}',
+        'tags': {
+            'Name': '{topic_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # SQS events
+    'sqs_create_queue': {
+        'events': [('sqs.amazonaws.com', 'CreateQueue')],
+        'writer': 'sqs.tag_queue',
+        'fields': {
+            'queue_url': 'responseElements.queueUrl',
+            'queue_name': 'requestParameters.queueName',
+        },
+        'resource': '{queue_url}',
+        'log': 'Tagging SQS queue: {queue_name}',
+        'env': '{queue_name}',
+        'tags': {
+            'Name': '{queue_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # ECR events
+    'ecr_create_repository': {
+        'events': [('ecr.amazonaws.com', 'CreateRepository')],
+        'writer': 'ecr.tag_resource',
+        'fields': {
+            'repo_arn': 'responseElements.repository.repositoryArn',
+            'repo_name': 'responseElements.repository.repositoryName',
+        },
+        'resource': '{repo_arn}',
+        'log': 'Tagging ECR repository: {repo_name}',
+        'env': '{repo_name}',
+        'tags': {
+            'Name': '{repo_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+
+    # AWS Backup events
+    'backup_create_backup_vault': {
+        'events': [('backup.amazonaws.com', 'CreateBackupVault')],
+        'writer': 'backup.tag_resource',
+        'fields': {
+            'backup_vault_arn': 'responseElements.backupVaultArn',
+            'backup_vault_name': 'responseElements.backupVaultName',
+        },
+        'resource': '{backup_vault_arn}',
+        'log': 'Tagging Backup Vault: {backup_vault_name}',
+        'env': '{backup_vault_name}',
+        'tags': {
+            'Name': '{backup_vault_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'backup_create_backup_plan': {
+        'events': [('backup.amazonaws.com', 'CreateBackupPlan')],
+        'writer': 'backup.tag_resource',
+        'fields': {
+            'backup_plan_arn': 'responseElements.backupPlanArn',
+            'backup_plan_name': 'requestParameters.backupPlan.backupPlanName',
+        },
+        'resource': '{backup_plan_arn}',
+        'log': 'Tagging Backup Plan: {backup_plan_name}',
+        'env': '{backup_plan_name}',
+        'tags': {
+            'Name': '{backup_plan_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'backup_update_backup_plan': {
+        'events': [('backup.amazonaws.com', 'UpdateBackupPlan')],
+        'writer': 'backup.tag_resource',
+        'fields': {
+            'backup_plan_arn': 'responseElements.backupPlanArn',
+            'backup_plan_name': 'requestParameters.backupPlan.backupPlanName',
+        },
+        'resource': '{backup_plan_arn}',
+        'log': 'Tagging updated Backup Plan: {backup_plan_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # Kinesis Data Stream events
+    'kinesis_create_stream': {
+        'events': [('kinesis.amazonaws.com', 'CreateStream')],
+        'writer': 'kinesis.add_tags_to_stream',
+        'fields': {
+            'kinesis_stream_name': 'requestParameters.streamName',
+        },
+        'resource': '{kinesis_stream_name}',
+        'log': 'Tagging Kinesis Stream: {kinesis_stream_name}',
+        'env': '{kinesis_stream_name}',
+        'tags': {
+            'Name': '{kinesis_stream_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+        'wait': 30,
+    },
+
+    # Kinesis Analytics events
+    'kinesisanalytics_create_application': {
+        'events': [('kinesisanalytics.amazonaws.com', 'CreateApplication')],
+        'writer': 'kinesisanalytics.tag_resource',
+        'fields': {
+            'app_arn': 'responseElements.applicationDetail.applicationARN',
+            'app_name': 'responseElements.applicationDetail.applicationName',
+        },
+        'resource': '{app_arn}',
+        'log': 'Tagging KinesisAnalytics Application: {app_name}',
+        'env': '{app_name}',
+        'tags': {
+            'Name': '{app_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'kinesisanalytics_update_application': {
+        'events': [('kinesisanalytics.amazonaws.com', 'UpdateApplication')],
+        'writer': 'kinesisanalytics.tag_resource',
+        'fields': {
+            'app_arn': 'responseElements.applicationDetail.applicationARN',
+            'app_name': 'responseElements.applicationDetail.applicationName',
+        },
+        'resource': '{app_arn}',
+        'log': 'Tagging KinesisAnalytics Application: {app_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # Kinesis Firehose events
+    'firehose_create_delivery_stream': {
+        'events': [('firehose.amazonaws.com', 'CreateDeliveryStream')],
+        'writer': 'firehose.tag_delivery_stream',
+        'fields': {
+            'firehose_stream_name': 'requestParameters.deliveryStreamName',
+        },
+        'resource': '{firehose_stream_name}',
+        'log': 'Tagging Kinesis Firehose Delivery Stream: {firehose_stream_name}',
+        'env': '{firehose_stream_name}',
+        'tags': {
+            'Name': '{firehose_stream_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+        'wait': 30,
+    },
+
+    # AWS Glue events
+    'glue_create_crawler': {
+        'events': [('glue.amazonaws.com', 'CreateCrawler')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'crawler_name': 'requestParameters.name',
+            'crawler_arn': 'arn:aws:glue:{region}:{account}:crawler/{crawler_name}',
+        },
+        'resource': '{crawler_arn}',
+        'log': 'Tagging new Glue crawler: {crawler_name}',
+        'env': '{crawler_name}',
+        'tags': {
+            'Name': '{crawler_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'glue_update_crawler': {
+        'events': [('glue.amazonaws.com', 'UpdateCrawler')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'crawler_name': 'requestParameters.name',
+            'crawler_arn': 'arn:aws:glue:{region}:{account}:crawler/{crawler_name}',
+        },
+        'resource': '{crawler_arn}',
+        'log': 'Tagging updated Glue crawler: {crawler_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'glue_start_crawler': {
+        'events': [('glue.amazonaws.com', 'StartCrawler')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'crawler_name': 'requestParameters.name',
+            'crawler_arn': 'arn:aws:glue:{region}:{account}:crawler/{crawler_name}',
+        },
+        'resource': '{crawler_arn}',
+        'log': 'Tagging started Glue crawler: {crawler_name}',
+        'tags': {
+            'LastStartedBy': '{user}',
+            'LastStartedAt': '{event_time}',
+        },
+    },
+    'glue_create_registry': {
+        'events': [('glue.amazonaws.com', 'CreateRegistry')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'registry_name': 'responseElements.registryName',
+            'registry_arn': 'responseElements.registryArn',
+        },
+        'resource': '{registry_arn}',
+        'log': 'Tagging new Glue registry: {registry_name}',
+        'env': '{registry_name}',
+        'tags': {
+            'Name': '{registry_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'glue_update_registry': {
+        'events': [('glue.amazonaws.com', 'UpdateRegistry')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'registry_name': 'responseElements.registryName',
+            'registry_arn': 'arn:aws:glue:{region}:{account}:registry/{registry_name}',
+        },
+        'resource': '{registry_arn}',
+        'log': 'Tagging updated Glue registry: {registry_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'glue_create_schema': {
+        'events': [('glue.amazonaws.com', 'CreateSchema')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'schema_name': 'responseElements.schemaName',
+            'registry_name': 'responseElements.registryName',
+            'schema_arn': 'responseElements.schemaArn',
+        },
+        'resource': '{schema_arn}',
+        'log': 'Tagging new Glue schema: {schema_name} (registry: {registry_name})',
+        'env': '{schema_name}',
+        'tags': {
+            'Name': '{schema_name}',
+            'Registry': '{registry_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'glue_update_schema': {
+        'events': [('glue.amazonaws.com', 'UpdateSchema')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'schema_name': 'responseElements.schemaName',
+            'registry_name': 'responseElements.registryName',
+            'schema_arn': 'arn:aws:glue:{region}:{account}:schema/{registry_name}/{schema_name}',
+        },
+        'resource': '{schema_arn}',
+        'log': 'Tagging updated Glue schema: {schema_name} (registry: {registry_name})',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'glue_create_job': {
+        'events': [('glue.amazonaws.com', 'CreateJob')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'job_name': 'responseElements.name',
+            'job_arn': 'arn:aws:glue:{region}:{account}:job/{job_name}',
+        },
+        'resource': '{job_arn}',
+        'log': 'Tagging new Glue job: {job_name}',
+        'env': '{job_name}',
+        'tags': {
+            'Name': '{job_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'glue_update_job': {
+        'events': [('glue.amazonaws.com', 'UpdateJob')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'job_name': 'responseElements.jobName',
+            'job_arn': 'arn:aws:glue:{region}:{account}:job/{job_name}',
+        },
+        'resource': '{job_arn}',
+        'log': 'Tagging updated Glue job: {job_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'glue_create_workflow': {
+        'events': [('glue.amazonaws.com', 'CreateWorkflow')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'workflow_name': 'responseElements.name',
+            'workflow_arn': 'arn:aws:glue:{region}:{account}:workflow/{workflow_name}',
+        },
+        'resource': '{workflow_arn}',
+        'log': 'Tagging new Glue workflow: {workflow_name}',
+        'env': '{workflow_name}',
+        'tags': {
+            'Name': '{workflow_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'glue_update_workflow': {
+        'events': [('glue.amazonaws.com', 'UpdateWorkflow')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'workflow_name': 'responseElements.name',
+            'workflow_arn': 'arn:aws:glue:{region}:{account}:workflow/{workflow_name}',
+        },
+        'resource': '{workflow_arn}',
+        'log': 'Tagging updated Glue workflow: {workflow_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+    'glue_create_trigger': {
+        'events': [('glue.amazonaws.com', 'CreateTrigger')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'trigger_name': 'responseElements.name',
+            'trigger_arn': 'arn:aws:glue:{region}:{account}:trigger/{trigger_name}',
+        },
+        'resource': '{trigger_arn}',
+        'log': 'Tagging new Glue trigger: {trigger_name}',
+        'env': '{trigger_name}',
+        'tags': {
+            'Name': '{trigger_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'glue_update_trigger': {
+        'events': [('glue.amazonaws.com', 'UpdateTrigger')],
+        'writer': 'glue.tag_resource',
+        'fields': {
+            'trigger_name': 'requestParameters.name',
+            'trigger_arn': 'arn:aws:glue:{region}:{account}:trigger/{trigger_name}',
+        },
+        'resource': '{trigger_arn}',
+        'log': 'Tagging updated Glue trigger: {trigger_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # AppSync events
+    'appsync_create_graphql_api': {
+        'events': [('appsync.amazonaws.com', 'CreateGraphqlApi')],
+        'writer': 'appsync.tag_resource',
+        'fields': {
+            'graphql_api_name': 'responseElements.graphqlApi.name',
+            'graphql_api_arn': 'responseElements.graphqlApi.arn',
+        },
+        'resource': '{graphql_api_arn}',
+        'log': 'Tagging new AppSync GraphqlApi: {graphql_api_name}',
+        'env': '{graphql_api_name}',
+        'tags': {
+            'Name': '{graphql_api_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'appsync_update_graphql_api': {
+        'events': [('appsync.amazonaws.com', 'UpdateGraphqlApi')],
+        'writer': 'appsync.tag_resource',
+        'fields': {
+            'graphql_api_name': 'responseElements.graphqlApi.name',
+            'graphql_api_arn': 'responseElements.graphqlApi.arn',
+        },
+        'resource': '{graphql_api_arn}',
+        'log': 'Tagging updated AppSync GraphqlApi: {graphql_api_name}',
+        'tags': {
+            'LastUpdatedBy': '{user}',
+            'LastUpdatedAt': '{event_time}',
+        },
+    },
+
+    # CloudWatch events
+    'logs_create_log_group': {
+        'events': [('logs.amazonaws.com', 'CreateLogGroup')],
+        'writer': 'logs.tag_log_group',
+        'fields': {
+            'log_group_name': 'requestParameters.logGroupName',
+        },
+        'resource': '{log_group_name}',
+        'log': 'Tagging new CloudWatch Log Group: {log_group_name}',
+        'env': '{log_group_name}',
+        'tags': {
+            'Name': '{log_group_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'cloudwatch_put_metric_alarm': {
+        'events': [('monitoring.amazonaws.com', 'PutMetricAlarm')],
+        'writer': 'cloudwatch.tag_resource',
+        'fields': {
+            'metric_alarm_name': 'requestParameters.alarmName',
+            'metric_alarm_arn': 'arn:aws:cloudwatch:{region}:{account}:alarm:{metric_alarm_name}',
+        },
+        'resource': '{metric_alarm_arn}',
+        'log': 'Tagging new Cloudwatch metric alarm: {metric_alarm_name}',
+        'tags': {
+            'alarm:name': 'string',
+            'alarm:created-by': '{user}',
+            'alarm:created-at': '{event_time}',
+        },
+    },
+    'cloudwatch_put_insight_rule': {
+        'events': [('monitoring.amazonaws.com', 'PutInsightRule')],
+        'writer': 'cloudwatch.tag_resource',
+        'fields': {
+            'insights_rule_name': 'requestParameters.ruleName',
+            'insights_rule_arn': 'arn:aws:cloudwatch:{region}:{account}:insight-rule/{insights_rule_name}',
+        },
+        'resource': '{insights_rule_arn}',
+        'log': 'Tagging new Cloudwatch insights rule: {insights_rule_name}',
+        'tags': {
+            'insights-rule:name': 'string',
+            'insights-rule:created-by': '{user}',
+            'insights-rule:created-at': '{event_time}',
+        },
+    },
+
+    # EC2 events
+    'ec2_request_spot_instances': {
+        'events': [('ec2.amazonaws.com', 'RequestSpotInstances')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'spot_request_ids': 'responseElements.spotInstanceRequestSet.items.*.spotInstanceRequestId',
+        },
+        'resource': '{spot_request_ids}',
+        'log': 'Request for Spot Instances {spot_request_ids} submitted by: {user}',
+        'tags': {
+            'RequestedBy': '{user}',
+            'RequestedAt': '{event_time}',
+        },
+    },
+    'ec2_register_image': {
+        'events': [('ec2.amazonaws.com', 'RegisterImage')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'image_id': 'responseElements.imageId',
+        },
+        'resource': '{image_id}',
+        'log': 'Tagging registered image: {image_id}',
+        'tags': {
+            'Owner': '{user}',
+            'RegisteredAt': '{event_time}',
+        },
+    },
+    'ec2_copy_snapshot': {
+        'events': [('ec2.amazonaws.com', 'CopySnapshot')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'snapshot_id': 'responseElements.snapshotId',
+        },
+        'resource': '{snapshot_id}',
+        'log': 'Tagging copied snapshot: {snapshot_id}',
+        'tags': {
+            'Owner': '{user}',
+            'CopiedAt': '{event_time}',
+        },
+    },
+    'ec2_import_snapshot': {
+        'events': [('ec2.amazonaws.com', 'ImportSnapshot')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'snapshot_id': 'responseElements.snapshotId',
+        },
+        'resource': '{snapshot_id}',
+        'log': 'Tagging imported snapshot: {snapshot_id}',
+        'tags': {
+            'Owner': '{user}',
+            'ImportedAt': '{event_time}',
+        },
+    },
+    'ec2_create_security_group': {
+        'events': [('ec2.amazonaws.com', 'CreateSecurityGroup')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'sg_name': 'requestParameters.groupName',
+            'sg_id': 'responseElements.groupId',
+        },
+        'resource': '{sg_id}',
+        'log': 'Tagging new EC2 security group: {sg_name}',
+        'env': '{sg_name}',
+        'tags': {
+            'Name': '{sg_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'ec2_create_launch_template': {
+        'events': [('ec2.amazonaws.com', 'CreateLaunchTemplate')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'template_name_id': 'responseElements.CreateLaunchTemplateResponse.launchTemplate.launchTemplateId',
+            'template_name': 'responseElements.CreateLaunchTemplateResponse.launchTemplate.launchTemplateName',
+        },
+        'resource': '{template_name_id}',
+        'log': 'Tagging new EC2 launch template: {template_name}',
+        'env': '{template_name}',
+        'tags': {
+            'Name': '{template_name}',
+            'CreateBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'ec2_modify_launch_template': {
+        'events': [('ec2.amazonaws.com', 'ModifyLaunchTemplate')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'template_name_id': 'responseElements.ModifyLaunchTemplateResponse.launchTemplate.launchTemplateId',
+            'template_name': 'responseElements.ModifyLaunchTemplateResponse.launchTemplate.launchTemplateName',
+        },
+        'resource': '{template_name_id}',
+        'log': 'Tagging modified EC2 LaunchTemplate: {template_name}',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+    'ec2_create_launch_template_version': {
+        'events': [('ec2.amazonaws.com', 'CreateLaunchTemplateVersion')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'template_name_id': 'responseElements.CreateLaunchTemplateVersionResponse.launchTemplateVersion.launchTemplateId',
+            'template_name': 'responseElements.CreateLaunchTemplateVersionResponse.launchTemplateVersion.launchTemplateName',
+            'version_number': 'responseElements.CreateLaunchTemplateVersionResponse.launchTemplateVersion.versionNumber',
+        },
+        'resource': '{template_name_id}',
+        'log': 'Tagging EC2 LaunchTemplate (version: {version_number}): {template_name}',
+        'tags': {
+            'LastVersion': '{version_number}',
+            'LastVersionAddedBy': '{user}',
+            'LastVersionAddedAt': '{event_time}',
+        },
+    },
+    'ec2_create_key_pair': {
+        'events': [('ec2.amazonaws.com', 'CreateKeyPair')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'keypair_id': 'responseElements.keyPairId',
+            'keypair_name': 'responseElements.keyName',
+        },
+        'resource': '{keypair_id}',
+        'log': 'Tagging new keypair name: {keypair_name}',
+        'env': '{keypair_name}',
+        'tags': {
+            'Name': '{keypair_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'ec2_create_placement_group': {
+        'events': [('ec2.amazonaws.com', 'CreatePlacementGroup')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'placement_group_id': 'responseElements.placementGroup.groupId',
+            'placement_group_name': 'responseElements.placementGroup.groupName',
+        },
+        'resource': '{placement_group_id}',
+        'log': 'Tagging new EC2 placement group: {placement_group_name}',
+        'env': '{placement_group_name}',
+        'tags': {
+            'Name': '{placement_group_name}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': '{env}',
+            'Department': '{department}',
+        },
+    },
+    'ec2_create_capacity_reservation': {
+        'events': [('ec2.amazonaws.com', 'CreateCapacityReservation')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'capacity_reservation_id': 'responseElements.CreateCapacityReservationResponse.capacityReservation.capacityReservationId',
+        },
+        'resource': '{capacity_reservation_id}',
+        'log': 'Tagging new EC2 capacity reservation: {capacity_reservation_id}',
+        'tags': {
+            'id': '{capacity_reservation_id}',
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+            'Env': 'ops',
+            'Department': 'Operations',
+        },
+    },
+    'ec2_modify_capacity_reservation': {
+        'events': [('ec2.amazonaws.com', 'ModifyCapacityReservation')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'capacity_reservation_id': 'requestParameters.ModifyCapacityReservationRequest.CapacityReservationId',
+        },
+        'resource': '{capacity_reservation_id}',
+        'log': 'Tagging modified EC2 capacity reservation: {capacity_reservation_id}',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+    'ec2_modify_instance_attribute': {
+        'events': [('ec2.amazonaws.com', 'ModifyInstanceAttribute')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'instance_id': 'requestParameters.instanceId',
+        },
+        'resource': '{instance_id}',
+        'log': 'Tagging modified EC2 instance: {instance_id}',
+        'tags': {
+            'LastModifiedBy': '{user}',
+            'LastModifiedAt': '{event_time}',
+        },
+    },
+
+    # VPC events
+    'ec2_create_internet_gateway': {
+        'events': [('ec2.amazonaws.com', 'CreateInternetGateway')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'igw_id': 'responseElements.internetGateway.internetGatewayId',
+        },
+        'resource': '{igw_id}',
+        'log': 'Tagging new VPC internet gateway: {igw_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_route_table': {
+        'events': [('ec2.amazonaws.com', 'CreateRouteTable')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'rtable_id': 'responseElements.routeTable.routeTableId',
+        },
+        'resource': '{rtable_id}',
+        'log': 'Tagging new VPC route table: {rtable_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_nat_gateway': {
+        'events': [('ec2.amazonaws.com', 'CreateNatGateway')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'nat_gw_id': 'responseElements.CreateNatGatewayResponse.natGateway.natGatewayId',
+        },
+        'resource': '{nat_gw_id}',
+        'log': 'Tagging new VPC NAT gateway: {nat_gw_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_egress_only_internet_gateway': {
+        'events': [('ec2.amazonaws.com', 'CreateEgressOnlyInternetGateway')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'egress_gw_id': 'responseElements.CreateEgressOnlyInternetGatewayResponse.egressOnlyInternetGateway.egressOnlyInternetGatewayId',
+        },
+        'resource': '{egress_gw_id}',
+        'log': 'Tagging new VPC EgressOnlyInternetGateway: {egress_gw_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_dhcp_options': {
+        'events': [('ec2.amazonaws.com', 'CreateDhcpOptions')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'dhcp_options_id': 'responseElements.dhcpOptions.dhcpOptionsId',
+        },
+        'resource': '{dhcp_options_id}',
+        'log': 'Tagging new VPC DhcpOptions set: {dhcp_options_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_vpn_gateway': {
+        'events': [('ec2.amazonaws.com', 'CreateVpnGateway')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'vpn_gw_id': 'responseElements.vpnGateway.vpnGatewayId',
+        },
+        'resource': '{vpn_gw_id}',
+        'log': 'Tagging new VPC VpnGateway: {vpn_gw_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_vpn_connection': {
+        'events': [('ec2.amazonaws.com', 'CreateVpnConnection')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'vpn_conn_id': 'responseElements.vpnConnection.vpnConnectionId',
+        },
+        'resource': '{vpn_conn_id}',
+        'log': 'Tagging new VPC VpnConnection: {vpn_conn_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_customer_gateway': {
+        'events': [('ec2.amazonaws.com', 'CreateCustomerGateway')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'customer_gw_id': 'responseElements.customerGateway.customerGatewayId',
+            'customer_gw_type': 'responseElements.customerGateway.type',
+        },
+        'resource': '{customer_gw_id}',
+        'log': 'Tagging new VPC CustomerGateway (type: {customer_gw_type}): {customer_gw_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_vpc_peering_connection': {
+        'events': [('ec2.amazonaws.com', 'CreateVpcPeeringConnection')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'vpc_peering_conn_id': 'responseElements.vpcPeeringConnection.vpcPeeringConnectionId',
+        },
+        'resource': '{vpc_peering_conn_id}',
+        'log': 'Tagging new VPC VpcPeeringConnection: {vpc_peering_conn_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_managed_prefix_list': {
+        'events': [('ec2.amazonaws.com', 'CreateManagedPrefixList')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'prefix_list_id': 'responseElements.CreateManagedPrefixListResponse.prefixList.prefixListId',
+            'prefix_list_name': 'responseElements.CreateManagedPrefixListResponse.prefixList.prefixListName',
+        },
+        'resource': '{prefix_list_id}',
+        'log': 'Tagging new VPC ManagedPrefixList: {prefix_list_name}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_transit_gateway': {
+        'events': [('ec2.amazonaws.com', 'CreateTransitGateway')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'transit_gw_id': 'responseElements.CreateTransitGatewayResponse.transitGateway.transitGatewayId',
+            'transit_gw_arn': 'responseElements.CreateTransitGatewayResponse.transitGateway.transitGatewayArn',
+        },
+        'resource': '{transit_gw_id}',
+        'log': 'Tagging new VPC TransitGateway: {transit_gw_arn}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_transit_gateway_route_table': {
+        'events': [('ec2.amazonaws.com', 'CreateTransitGatewayRouteTable')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'transit_gw_rtable_id': 'responseElements.CreateTransitGatewayRouteTableResponse.transitGatewayRouteTable.transitGatewayRouteTableId',
+        },
+        'resource': '{transit_gw_rtable_id}',
+        'log': 'Tagging new VPC TransitGatewayRouteTable: {transit_gw_rtable_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_network_acl': {
+        'events': [('ec2.amazonaws.com', 'CreateNetworkAcl')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'network_acl_id': 'responseElements.networkAcl.networkAclId',
+        },
+        'resource': '{network_acl_id}',
+        'log': 'Tagging new VPC NetworkAcl: {network_acl_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_vpc_endpoint': {
+        'events': [('ec2.amazonaws.com', 'CreateVpcEndpoint')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'vpc_endpoint_id': 'responseElements.CreateVpcEndpointResponse.vpcEndpoint.vpcEndpointId',
+            'endpoint_type': 'responseElements.CreateVpcEndpointResponse.vpcEndpoint.vpcEndpointType',
+        },
+        'resource': '{vpc_endpoint_id}',
+        'log': 'Tagging new VPC VpcEndpoint (type: {endpoint_type}): {vpc_endpoint_id}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+    'ec2_create_vpc_endpoint_service_configuration': {
+        'events': [('ec2.amazonaws.com', 'CreateVpcEndpointServiceConfiguration')],
+        'writer': 'ec2.create_tags',
+        'fields': {
+            'vpc_endpoint_service_id': 'responseElements.CreateVpcEndpointServiceConfigurationResponse.serviceConfiguration.serviceId',
+            'vpc_endpoint_service_name': 'responseElements.CreateVpcEndpointServiceConfigurationResponse.serviceConfiguration.serviceName',
+            'vpc_endpoint_service_type': 'responseElements.CreateVpcEndpointServiceConfigurationResponse.serviceConfiguration.serviceType',
+        },
+        'resource': '{vpc_endpoint_service_id}',
+        'log': 'Tagging new VPC VpcEndpointServiceConfiguration (type: {vpc_endpoint_service_type}): {vpc_endpoint_service_name}',
+        'tags': {
+            'CreatedBy': '{user}',
+            'CreatedAt': '{event_time}',
+        },
+    },
+}
@@ -11,7 +11,12 @@
 
 import boto3
 import argparse
-import json
+import os
+import sys
+
+# reuse relationship graph of EC2 resources of autotagging-function
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'autotagging-function'))
+from resource_graph import IMAGE, INSTANCE, SNAPSHOT, FILTER_MAX_VALUES, ResourceGraph
 
 
 class color:
@@ -30,7 +35,7 @@ class color:
 
 class ImageHandler:
     """
-    EC2Handler Class containing instance, image and volume iterators
+    ImageHandler Class matching images with their instances in a relationship graph built from bulk describes
     """
 
       
@@ -50,7 +55,6 @@ class ImageHandler:
         if self:
             try:
                 print("Initiliazing ImageHandler")
-                self.images = images
                 self.region = region
                 self.DEBUG = DEBUG
                 
@@ -59,155 +63,75 @@ class ImageHandler:
                 else:
                     print(f"{color.GREEN}Running in ACTIVE MODE{color.END}")
                     
-                self.ec2 = boto3.resource('ec2', region_name=region)
                 self.ec2_client = boto3.client('ec2', region_name=region)
+                self.graph = ResourceGraph(self.ec2_client, owners=['461796779995'])
                 
-                for self.imagename in self.get_imagenames(images):
-                    print(f"{color.BOLD}Parsing image name: {str(self.imagename)}{color.END}")
-                    for self.imageid in self.get_imageids(self.imagename):
-                        print(f"{color.CYAN}-Parsing image: {str(self.imageid)}{color.END}")
-                        self.image_tags = self.get_instancetags(self.imagename)
-                        
-                        if not self.image_tags:
-                            print(f"{color.YELLOW}Attempting to evaluate tags by originId{color.END}")
-                            intanceId = self.get_instanceid_by_originid(self.imagename)
-                            if intanceId != "":
-                                self.image_tags = self.get_instancetags_by_originid(intanceId)
-                            else:
-                                print(f"{color.RED}Cannot process tags, please tag manually: {self.imageid}{color.END}")
-                                pass
-                            
-                        if self.image_tags:
-                            self.apply_tags()
-                            self.snap_tagger()
-                            print(f"\n")
+                # images with their snapshots and candidate instances are described in bulk
+                self.imageids = self.graph.load_filter(IMAGE, [{'Name': 'tag:Name', 'Values': list(images)}])
+                imagenames = list(dict.fromkeys(self.graph.tags(imageid)['Name'] for imageid in self.imageids))
+                self.load_instances(imagenames)
+                
+                plan = {}
+                for self.imageid in self.imageids:
+                    self.imagename = self.graph.tags(self.imageid)['Name']
+                    print(f"{color.CYAN}-Parsing image: {str(self.imageid)} ({str(self.imagename)}){color.END}")
+                    instanceid = self.get_instanceid(self.imageid)
+                    
+                    if instanceid:
+                        self.graph.link(instanceid, self.imageid)
+                        image_tags = self.graph.tags(instanceid)
+                        print(f"{color.GREEN}Formed tags: {color.END}{image_tags}")
+                        # image and its snapshots get tags of the instance
+                        plan.update(self.graph.plan(instanceid, {IMAGE: lambda tags, current: image_tags, SNAPSHOT: lambda tags, current: image_tags}))
+                    else:
+                        print(f"{color.RED}Cannot process tags, please tag manually: {self.imageid}{color.END}")
+                
+                self.apply_tags(plan)
                             
             except Exception as error:
-                print(f"{color.RED}Error message when processing EC2Handler: {str(error)}{color.END}")
+                print(f"{color.RED}Error message when processing ImageHandler: {str(error)}{color.END}")
                 exit()
 
-    def get_imagenames(self, images: list):
-        try:
-            self.images = self.ec2_client.describe_images(Filters=[{'Name': 'tag:Name', 'Values': images}])
-            images = []
-            for image in self.images['Images']:
-                imagename = [tag['Value'] for tag in image['Tags'] if tag['Key'] == 'Name'][0]
-                if imagename not in images:
-                    images.append(imagename)
-                    
-            return images
-
-        except Exception as error:
-            print(f"{color.RED}Error message when attempting to get_imagenames: {str(error)}{color.END}")
-            exit()
-            
-            
-    def get_imageids(self, imagename: str):
-        try:
-            self.images = self.ec2_client.describe_images(Filters=[{'Name': 'tag:Name', 'Values': [imagename]}])
-            imageIds = []
-            for image in self.images['Images']:
-                imageId = image['ImageId']
-                imageIds.append(imageId)
-            
-            return imageIds
-
-        except Exception as error:
-            print(f"{color.RED}Error message when attempting to get_imageids: {str(error)}{color.END}")
-            exit()
-            
-            
-    def get_instancetags(self, imagename: str) -> bool:
+    def load_instances(self, imagenames: list):
         try:
-            instances = self.ec2_client.describe_instances(Filters=[{'Name': 'tag:Name', 'Values': [imagename]}])
-            for reservation in instances['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_tags = instance['Tags']
-                    image_tags = self.get_tags(instance_tags)
-                    
-                    if image_tags:
-                        return image_tags
-                    else:
-                        return False
+            # instances named as images and instances referenced by Origin.Id tags of images
+            for start in range(0, len(imagenames), FILTER_MAX_VALUES):
+                self.graph.load_filter(INSTANCE, [{'Name': 'tag:Name', 'Values': imagenames[start:start + FILTER_MAX_VALUES]}])
+            originids = [self.graph.tags(imageid).get('Origin.Id') for imageid in self.imageids]
+            self.graph.load(INSTANCE, [originid for originid in originids if originid])
 
         except Exception as error:
-            print(f"{color.RED}Error message when attempting to get_instancetags: {str(error)}{color.END}")
-            exit()
-            
-    def get_instanceid_by_originid(self, imagename: str):
-        try:
-            self.images = self.ec2_client.describe_images(Filters=[{'Name': 'tag:Name', 'Values': [imagename]}])
-            originId = ""
-            for image in self.images['Images']:
-                image_tags = image['Tags']
-                if "Origin.Id" in [tag['Key'] for tag in image_tags]:
-                    originId = [tag['Value'] for tag in image_tags if tag['Key'] == "Origin.Id"][0]
-                
-            return originId
-                
-        except Exception as error:
-            print(f"{color.RED}Error message when attempting to get_instanceid_by_originid: {str(error)}{color.END}")
+            print(f"{color.RED}Error message when attempting to load_instances: {str(error)}{color.END}")
             exit()
             
+    def get_instanceid(self, imageid: str):
+        imagetags = self.graph.tags(imageid)
+        instanceids = self.graph.find(INSTANCE, {'Name': imagetags['Name']})
+        if instanceids:
+            return instanceids[0]
+        
+        print(f"{color.YELLOW}Attempting to evaluate tags by originId{color.END}")
+        originid = imagetags.get('Origin.Id')
+        if originid and self.graph.tags(originid) is not None:
+            return originid
+        return None
             
-    def get_instancetags_by_originid(self, instanceId: str) -> bool:
+    def apply_tags(self, plan: dict):
         try:
-            instances = self.ec2_client.describe_instances(InstanceIds=[instanceId])
-            for reservation in instances['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_tags = instance['Tags']
-                    image_tags = self.get_tags(instance_tags)
-                    
-                    if image_tags:
-                        return image_tags
+            # resources getting identical changes are tagged with a single call
+            for changes, resourceids in self.graph.changes(plan).items():
+                tags = [{'Key': key, 'Value': value} for key, value in changes]
+                for start in range(0, len(resourceids), 1000):
+                    chunk = resourceids[start:start + 1000]
+                    print(f"{color.DARKCYAN}--{'DEBUG MODE: ' if self.DEBUG else ''}creating tags for {', '.join(chunk)}{color.END}")
+                    if not self.DEBUG:
+                        self.ec2_client.create_tags(Resources=chunk, Tags=tags)
                     else:
-                        return False
-
-        except Exception as error:
-            print(f"{color.RED}Error message when attempting to get_instancetags_by_originid: {str(error)}{color.END}")
-            exit()
-            
-            
-    def get_tags(self, instance_tags: list):
-        try:
-            image_tags = []
-            for tag in instance_tags:
-                image_tags.append(tag)
-                
-            if image_tags:
-                print(f"{color.GREEN}Formed tags: {color.END}{image_tags}")
-                
-                return image_tags
-
-        except Exception as error:
-            print(f"{color.RED}Error message when attempting to get_tags: {str(error)}{color.END}")
-            exit()
-    
-    
-    def apply_tags(self, resourceid):
-        try:
-            if not self.DEBUG:
-                self.ec2_client.create_tags(Resources=[resourceid], Tags=self.image_tags)
-            else:
-                pass
+                        print(f"{color.BOLD}{tags}{color.END}")
 
         except Exception as error:
             print(f"{color.RED}Error message when attempting to apply_tags: {str(error)}{color.END}")
             exit()
-            
-    def snap_tagger(self):
-        images = self.ec2_client.describe_images(ImageIds=[self.imageid], Owners=['461796779995'])
-        try:
-            for ami in images['Images']:
-                print(f"{color.DARKCYAN}--Parsing snaphots of: {str(self.imageid)}{color.END}")
-                for snapshot in ami['BlockDeviceMappings']:
-                    snapshotid = snapshot['Ebs']['SnapshotId']
-                    print(f"{color.CYAN}---snapshot: {str(snapshotid)}{color.END}")
-                    self.apply_tags(snapshotid)
-
-        except Exception as error:
-            print(f"{color.RED}Encountered errors{color.END}")
-            raise error
 
 
 ##########################################
@@ -223,4 +147,4 @@ images = args.images
 ##########################################
 
 if __name__ == '__main__':
-    ec2handler = ImageHandler(images, DEBUG)
\ No newline at end of file
+    ec2handler = ImageHandler(images, DEBUG=DEBUG)
\ No newline at end of file
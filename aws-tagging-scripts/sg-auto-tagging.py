@@ -10,8 +10,16 @@
 
 import boto3
 import argparse
-import re
 import json
+import os
+import sys
+
+# reuse precompiled Env/Department classifier of autotagging-function
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'autotagging-function'))
+from env_classifier import EnvClassifier
+
+# Env keywords searched in security group names, in order of priority
+SG_ENV_KEYWORDS = ('qa', 'ops', 'prd', 'prodtest', 'uat', 'sim', 'ins', 'dev', 'tst', 'demo', 'imp', 'test', 'performance', 'training', 'prod', 'ia')
 
 
 class color:
@@ -33,6 +41,7 @@ class TagHandler:
     def __init__(self, DEBUG):   
         self.DEBUG = DEBUG
         self.ec2 = boto3.resource('ec2', region_name='us-west-2')
+        self.classifier = EnvClassifier(keywords=SG_ENV_KEYWORDS)
     
     def department_check(self, env_tag) -> str:
         """
@@ -46,16 +55,8 @@ class TagHandler:
             [str]: dep_tag variable 
         """    
         try:
-            dep_tag = ''
-            dev_tags = {'dev', 'demo', 'ins', 'tst'}
-            ops_tags = {'qa', 'ops'}
-            prd_tags = {'prd', 'prodtest', 'uat', 'sim'}
-            env_tags = {'qa', 'ops', 'prd', 'prodtest', 'uat', 'sim', 'ins', 'dev', 'tst', 'demo', 'ins'}
-            if env_tag in env_tags:
-                if env_tag in dev_tags: dep_tag = "Development"
-                elif env_tag in ops_tags: dep_tag = "Operations"
-                elif env_tag in prd_tags: dep_tag = "Production"
-            if dep_tag != '':
+            dep_tag = self.classifier.department_tag(env_tag)
+            if dep_tag:
                 return dep_tag
 
         except Exception as error:
@@ -73,20 +74,8 @@ class TagHandler:
         Returns:
             [str]: env tag variable
         """
-        env_tags = ['qa', 'ops', 'prd', 'prodtest', 'uat', 'sim', 'ins', 'dev', 'tst', 'demo', 'ins', 'imp', 'test', 'performance', 'training', 'prod', 'ia']
         try:
-            env_tag = ""
-            for tag_to_search in env_tags:
-                search = re.search(tag_to_search, sgName)
-                if search:
-                    env_tag = tag_to_search
-                    if env_tag == "imp" or env_tag == "performance": env_tag = "uat"
-                    elif env_tag == "test": env_tag = "dev"
-                    elif env_tag == "training": env_tag = "trn"
-                    elif env_tag == "prod" or env_tag == "production": env_tag = "prd"
-                    elif env_tag == "ia": env_tag = "ins"
-                    break
-                else: env_tag = "ops"
+            env_tag = self.classifier.env_tag(sgName)
             if env_tag != "":
                 return env_tag
 
@@ -12,7 +12,18 @@
 
 import boto3
 import argparse
-from botocore.exceptions import ClientError
+import os
+import sys
+
+# reuse relationship graph of EC2 resources of autotagging-function
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'autotagging-function'))
+from resource_graph import INSTANCE, SNAPSHOT, VOLUME, ResourceGraph
+
+# volume tags propagated to snapshots
+PROPAGATED_TAG_KEYS = frozenset(['Name', 'Env', 'Department', 'Customers', 'Cluster', 'Owner',
+                                 'Id', 'tenant', 'stage', 'Project', 'Class', 'Role', 'application'])
+# tags of snapshots which volume is unknown or deleted
+UNKNOWN_VOLUME_TAGS = {'Name': '[unknown-volume]', 'Env': 'ops', 'Department': 'Operations'}
 
 
 class color:
@@ -29,90 +40,54 @@ class color:
 
 ##########################################
 
-ec2 = boto3.resource('ec2', region_name='us-west-2')
 ec2client = boto3.client('ec2', region_name='us-west-2')
 
 def snapshot_parser():
-    snapshots = ec2.snapshots.filter(OwnerIds=['461796779995']).all()
-    try:
-        for snap in snapshots:
-            if snap.tags is None or 'Name' not in [tagkey['Key'] for tagkey in snap.tags]:
-                if snap.volume_id == 'vol-ffffffff':
-                    print(
-                        f"{color.RED}Found vol-ffffffff volume: {snap.id}{color.END}")
-                    unknown_tagging(snapshot=snap)
-                else:
-                    volume_parser(volume_id=snap.volume_id, snapshot=snap)
-
-    except ClientError as clienterror:
-        if clienterror.response['Error']['Code'] == 'InvalidVolume.NotFound':
-            print(f"{color.RED}Found unknown volume: {snap.volume_id}{color.END}")
-            unknown_tagging(snapshot=snap)
-            snapshot_parser()
-        else:
-            print(f"{color.RED}Unexpected error: {clienterror}{color.END}")
-    except Exception as error:
-        print(f"{color.RED}Encountered errors:{color.END}")
-        raise error
-
-
-def volume_parser(volume_id, snapshot):
-    volumes = ec2client.describe_volumes(VolumeIds=[volume_id])
-    try:
-        for vol in volumes['Volumes']:
-            tags = []
-            tags_list = ['Name', 'Env', 'Department', 'Customers', 'Cluster', 'Owner',
-                         'Id', 'tenant', 'stage', 'Project', 'Class', 'Role', 'application']
-            for tag in vol['Tags']:
-                for item in tags_list:
-                    if tag['Key'] == item:
-                        tags.append(tag)
-            if tags:
-                print(f"{color.PURPLE}Parsing volume: {vol['VolumeId']}:")
-                tagging(snapshot, tags)
-
-    except Exception as error:
-        print(f"{color.RED}Encountered errors:{color.END}")
-        raise error
-
-
-def tagging(snapshot, tags):
     try:
-        if not DEBUG:
-            print(f"{color.DARKCYAN}--creating tags for {snapshot.id}{color.END}")
-            snapshot.create_tags(Tags=tags)
-        else:
-            print(
-                f"{color.RED}DEBUG MODE: {color.END}{color.DARKCYAN}--creating tags for {snapshot.id}{color.END}")
-            print(f"{color.BOLD}{tags}{color.END}")
+        # all snapshots and their volumes are described in bulk, relationships are resolved in memory
+        graph = ResourceGraph(ec2client, owners=['461796779995'])
+        snapshot_ids = graph.load_filter(SNAPSHOT, [])
+        untagged = [snapshot_id for snapshot_id in snapshot_ids if 'Name' not in graph.tags(snapshot_id)]
+        volume_ids = graph.load(VOLUME, [graph.parent(snapshot_id, VOLUME) for snapshot_id in untagged if graph.parent(snapshot_id, VOLUME)])
+        # volumes without Name tag take missing tags from instances they are attached to
+        instance_ids = graph.load(INSTANCE, [graph.parent(volume_id, INSTANCE) for volume_id in volume_ids if 'Name' not in graph.tags(volume_id) and graph.parent(volume_id, INSTANCE)])
+        print(f"{color.PURPLE}Found {len(untagged)} snapshots without Name tag of {len(snapshot_ids)} snapshots, {len(volume_ids)} volumes and {len(instance_ids)} instances described{color.END}")
+
+        plan = {}
+        for snapshot_id in untagged:
+            volume_id = graph.parent(snapshot_id, VOLUME)
+            if volume_id in volume_ids:
+                volume_tags = graph.tags(volume_id)
+                instance_id = graph.ancestor(snapshot_id, INSTANCE)
+                if 'Name' not in volume_tags and instance_id in instance_ids:
+                    volume_tags = {**graph.tags(instance_id), **volume_tags}
+                tags = {key: value for key, value in volume_tags.items() if key in PROPAGATED_TAG_KEYS}
+                if tags:
+                    plan[snapshot_id] = tags
+            else:
+                print(f"{color.RED}Found unknown volume: {volume_id or 'vol-ffffffff'} ({snapshot_id}){color.END}")
+                plan[snapshot_id] = UNKNOWN_VOLUME_TAGS
+
+        # snapshots getting identical tags are tagged with a single call
+        for changes, snapshot_ids in graph.changes(plan).items():
+            tagging(snapshot_ids, [{'Key': key, 'Value': value} for key, value in changes])
 
     except Exception as error:
         print(f"{color.RED}Encountered errors:{color.END}")
         raise error
 
 
-def unknown_tagging(snapshot):
-    
-    tags = [{
-        "Key": "Name",
-        "Value": "[unknown-volume]"
-    },
-        {
-        "Key": "Env",
-        "Value": "ops"
-    },
-        {
-        "Key": "Department",
-        "Value": "Operations"
-    }]
-    
+def tagging(snapshot_ids, tags):
     try:
-        if not DEBUG:
-            print(f"{color.DARKCYAN}--creating tags for {snapshot.id}{color.END}")
-            snapshot.create_tags(Tags=tags)
-        else:
-            print(f"{color.RED}DEBUG MODE: {color.END}{color.DARKCYAN}--creating tags for {snapshot.id}{color.END}")
-            print(f"{color.BOLD}{tags}{color.END}")
+        for start in range(0, len(snapshot_ids), 1000):
+            chunk = snapshot_ids[start:start + 1000]
+            if not DEBUG:
+                print(f"{color.DARKCYAN}--creating tags for {', '.join(chunk)}{color.END}")
+                ec2client.create_tags(Resources=chunk, Tags=tags)
+            else:
+                print(
+                    f"{color.RED}DEBUG MODE: {color.END}{color.DARKCYAN}--creating tags for {', '.join(chunk)}{color.END}")
+                print(f"{color.BOLD}{tags}{color.END}")
 
     except Exception as error:
         print(f"{color.RED}Encountered errors:{color.END}")